@@ -0,0 +1,94 @@
+import asyncio
+import codecs
+from io import IncrementalNewlineDecoder
+from typing import AsyncGenerator, AsyncIterable
+
+from .bloom_filter import BloomFilter
+from .text_search_filter import LineFilter
+
+READ_SIZE = 64 * 1024
+
+
+async def _read_chunks(
+    source: asyncio.StreamReader | AsyncIterable[bytes],
+) -> AsyncGenerator[bytes, None]:
+    """Асинхронный генератор блоков байт из источника."""
+    if isinstance(source, asyncio.StreamReader):
+        while chunk := await source.read(READ_SIZE):
+            yield chunk
+    else:
+        async for chunk in source:
+            yield chunk
+
+
+async def async_line_filter(
+    source: asyncio.StreamReader | AsyncIterable[bytes],
+    search_words: list[str],
+    stop_words: list[str] | BloomFilter | None = None,
+    *,
+    engine: str = "set",
+) -> AsyncGenerator[str, None]:
+    """
+    Асинхронный генератор, который читает строки из потока байт
+    и фильтрует их так же, как ``line_filter``.
+
+    Байты декодируются из UTF-8 инкрементально, поэтому многобайтовые
+    символы и переводы строк (\\n, \\r\\n, \\r) могут быть разорваны
+    между блоками. После обработки каждого блока управление отдается
+    циклу событий.
+
+    Параметры:
+    ----------
+    source : Union[asyncio.StreamReader, AsyncIterable[bytes]]
+        Поток, из которого читаются блоки байт: StreamReader
+        (например, сокет) или асинхронный итерируемый объект.
+    search_words : List[str]
+        Список слов для поиска.
+    stop_words : Union[List[str], BloomFilter], optional
+        Список стоп-слов или BloomFilter, как в ``line_filter``.
+        По умолчанию None.
+    engine : str, optional
+        Движок поиска слов в строке, как в ``line_filter``.
+
+    Возвращает:
+    ----------
+    AsyncGenerator[str, None]
+        Асинхронный генератор строк, соответствующих критериям фильтрации.
+
+    Исключения:
+    -----------
+    TypeError
+        Если аргументы не соответствуют ожидаемым типам.
+    ValueError
+        Если передан неизвестный движок поиска.
+    """
+    if not isinstance(source, asyncio.StreamReader) and not hasattr(
+        source, "__aiter__"
+    ):
+        raise TypeError(
+            f"Получено {type(source).__name__}, source должен быть "
+            "asyncio.StreamReader или асинхронным итерируемым объектом"
+        )
+
+    matcher = LineFilter(search_words, stop_words, engine=engine).match
+    decoder = IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(), translate=True
+    )
+
+    pending = ""
+    async for chunk in _read_chunks(source):
+        if not isinstance(chunk, (bytes, bytearray)):
+            raise TypeError(
+                f"Получено {type(chunk).__name__}, "
+                "source должен возвращать блоки байт (bytes)"
+            )
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            if matcher(line):
+                yield line.strip()
+        await asyncio.sleep(0)
+
+    for line in (pending + decoder.decode(b"", final=True)).split("\n"):
+        if matcher(line):
+            yield line.strip()
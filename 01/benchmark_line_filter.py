@@ -0,0 +1,105 @@
+import os
+import random
+import string
+import tempfile
+import timeit
+
+from .mmap_filter import MMAP_MAX_WORDS
+from .text_search_filter import ENGINES, LineFilter
+
+LINES = 200_000
+WORDS_PER_LINE = 10
+VOCABULARY = 200_000
+SEARCH_WORDS = 10_000
+STOP_WORDS = 10_000
+
+
+def generate_words(count: int, seed: int = 0) -> list[str]:
+    """Словарь случайных слов из строчных латинских букв."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+        for _ in range(count)
+    ]
+
+
+def generate_file(path: str, words: list[str], lines: int = LINES) -> None:
+    """Файл из строк случайных слов словаря в случайном регистре."""
+    rng = random.Random(1)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(lines):
+            f.write(
+                " ".join(
+                    word.upper() if rng.random() < 0.1 else word
+                    for word in rng.choices(words, k=WORDS_PER_LINE)
+                )
+                + "\n"
+            )
+
+
+def run(line_filter: LineFilter, path: str, **kwargs) -> int:
+    """Количество строк, прошедших фильтр."""
+    return sum(1 for _ in line_filter(path, **kwargs))
+
+
+def compare_engines(path: str, words: list[str], number_iteration: int):
+    """Время движков на больших списках слов поиска и стоп-слов."""
+    search_words = words[:SEARCH_WORDS]
+    stop_words = words[SEARCH_WORDS:SEARCH_WORDS + STOP_WORDS]
+    print(
+        f"\n{LINES} lines, {len(search_words)} search words, "
+        f"{len(stop_words)} stop words ({number_iteration} iterations):"
+    )
+
+    expected = None
+    for engine in ENGINES:
+        line_filter = LineFilter(search_words, stop_words, engine=engine)
+        found = run(line_filter, path)
+        assert expected is None or found == expected
+        expected = found
+        seconds = timeit.timeit(
+            lambda line_filter=line_filter: run(line_filter, path),
+            number=number_iteration,
+        )
+        print(f"{engine:>12}: {seconds:.3f}s ({found} lines)")
+
+
+def compare_mmap(path: str, words: list[str], number_iteration: int):
+    """Время текстового режима и use_mmap на малых списках слов."""
+    print(
+        f"\nuse_mmap, {os.path.getsize(path) // 1024 // 1024} MB "
+        f"({number_iteration} iterations):"
+    )
+    cases = {
+        "1 rare word": ["rareword"],
+        f"{MMAP_MAX_WORDS} words": words[:MMAP_MAX_WORDS],
+        "1 cyrillic word": ["редкое"],
+    }
+    for name, case_words in cases.items():
+        line_filter = LineFilter(case_words)
+        found = run(line_filter, path)
+        assert run(line_filter, path, use_mmap=True) == found
+        for use_mmap in (False, True):
+            seconds = timeit.timeit(
+                lambda line_filter=line_filter, use_mmap=use_mmap: run(
+                    line_filter, path, use_mmap=use_mmap
+                ),
+                number=number_iteration,
+            )
+            mode = "mmap" if use_mmap else "text"
+            print(f"{name:>16} {mode}: {seconds:.3f}s ({found} lines)")
+
+
+def main():
+    number_iteration = 3
+    words = generate_words(VOCABULARY)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "lines.txt")
+        generate_file(path, words)
+        compare_engines(path, words, number_iteration)
+        compare_mmap(path, words, number_iteration)
+
+
+if __name__ == "__main__":
+    main()
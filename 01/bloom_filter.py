@@ -0,0 +1,198 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+from typing import Iterable
+
+_MAGIC = b"BLMF"
+# Сигнатура, число бит, число хеш-функций, число слов
+_HEADER = struct.Struct("<4sQIQ")
+
+
+def _hashes(key: bytes) -> tuple[int, int]:
+    """Два независимых 64-битных хеша слова для двойного хеширования."""
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    return (
+        int.from_bytes(digest[:8], "little"),
+        int.from_bytes(digest[8:], "little") | 1,
+    )
+
+
+def _bloom_bits(
+    keys: list[bytes], error_rate: float
+) -> tuple[int, int, bytearray]:
+    """
+    Подбирает размер фильтра Блума и число хеш-функций для заданной
+    доли ложных срабатываний и заполняет биты ключами.
+    """
+    count = max(len(keys), 1)
+    bit_count = max(
+        math.ceil(-count * math.log(error_rate) / math.log(2) ** 2), 8
+    )
+    hash_count = max(round(bit_count / count * math.log(2)), 1)
+    bits = bytearray((bit_count + 7) // 8)
+    for key in keys:
+        first, second = _hashes(key)
+        for index in range(hash_count):
+            bit = (first + index * second) % bit_count
+            bits[bit >> 3] |= 1 << (bit & 7)
+    return bit_count, hash_count, bits
+
+
+class BloomFilter:
+    """
+    Компактное множество стоп-слов в файле, отображаемом в память.
+
+    Файл содержит фильтр Блума и отсортированный список слов. Проверка
+    слова сначала выполняется по фильтру Блума, а при положительном
+    ответе уточняется двоичным поиском по списку слов, поэтому ложных
+    срабатываний нет. Файл отображается в память только для чтения,
+    и страницы разделяются всеми процессами, открывшими его. При
+    передаче в другой процесс (pickle) файл открывается заново по пути.
+
+    Объект можно передать в ``line_filter`` вместо списка stop_words.
+
+    Параметры:
+    ----------
+    path : str
+        Имя файла, созданного методом ``BloomFilter.build``.
+
+    Исключения:
+    -----------
+    TypeError
+        Если path не является строкой.
+    ValueError
+        Если файл не является файлом фильтра.
+    """
+
+    def __init__(self, path: str):
+        if not isinstance(path, str):
+            raise TypeError(
+                f"Получено {type(path).__name__}, path должен быть str"
+            )
+        self.path = path
+
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or not header.startswith(_MAGIC):
+                raise ValueError(f"Файл {path} не является фильтром Блума")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        _, self._bit_count, self._hash_count, self._word_count = (
+            _HEADER.unpack(header)
+        )
+        self._words_start = _HEADER.size + (self._bit_count + 7) // 8
+
+    @classmethod
+    def build(
+        cls, words: Iterable[str], path: str, error_rate: float = 0.01
+    ) -> "BloomFilter":
+        """
+        Создает файл фильтра из слов и открывает его.
+
+        Слова приводятся к нижнему регистру. Слова с пробельными
+        символами пропускаются: ``line_filter`` делит строки по ним,
+        поэтому такие слова никогда не совпадают.
+
+        Параметры:
+        ----------
+        words : Iterable[str]
+            Стоп-слова.
+        path : str
+            Имя создаваемого файла.
+        error_rate : float, optional
+            Доля ложных срабатываний фильтра Блума, после которых
+            требуется поиск по списку слов. По умолчанию 0.01.
+
+        Исключения:
+        -----------
+        TypeError
+            Если слова не являются строками или path не является строкой.
+        ValueError
+            Если error_rate не лежит в интервале (0, 1).
+        """
+        if not isinstance(path, str):
+            raise TypeError(
+                f"Получено {type(path).__name__}, path должен быть str"
+            )
+        if not isinstance(error_rate, float) or not 0 < error_rate < 1:
+            raise ValueError(
+                f"Получено {error_rate=}, error_rate должен быть в (0, 1)"
+            )
+
+        keys = set()
+        for word in words:
+            if not isinstance(word, str):
+                raise TypeError("words должен содержать только строки")
+            if word.split() == [word]:
+                keys.add(word.lower().encode("utf-8"))
+        # Байтовый порядок UTF-8 совпадает с порядком кодовых точек
+        keys = sorted(keys)
+
+        bit_count, hash_count, bits = _bloom_bits(keys, error_rate)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, bit_count, hash_count, len(keys)))
+            f.write(bits)
+            for key in keys:
+                f.write(key + b"\n")
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self._word_count
+
+    def __contains__(self, word: str) -> bool:
+        key = word.lower().encode("utf-8")
+        return self._might_contain(key) and self._search(key)
+
+    def __reduce__(self):
+        return type(self), (self.path,)
+
+    def __enter__(self) -> "BloomFilter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает отображение файла в память."""
+        self._mm.close()
+
+    def _might_contain(self, key: bytes) -> bool:
+        first, second = _hashes(key)
+        for index in range(self._hash_count):
+            bit = (first + index * second) % self._bit_count
+            if not self._mm[_HEADER.size + (bit >> 3)] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def _search(self, key: bytes) -> bool:
+        """Двоичный поиск слова по отсортированному списку в файле."""
+        mm = self._mm
+        low, high = self._words_start, len(mm)
+        while low < high:
+            position = mm.rfind(b"\n", low, (low + high) // 2)
+            start = low if position == -1 else position + 1
+            end = mm.find(b"\n", start)
+            word = mm[start:end]
+            if word == key:
+                return True
+            if word < key:
+                low = end + 1
+            else:
+                high = start
+        return False
+
+    def might_contain(self, word: str) -> bool:
+        """
+        Проверка только по фильтру Блума: False означает, что слова
+        точно нет, True - что слово есть с вероятностью ложного
+        срабатывания error_rate.
+        """
+        return self._might_contain(word.lower().encode("utf-8"))
+
+    def isdisjoint(self, words: Iterable[str]) -> bool:
+        """Проверяет, что ни одно из слов не входит в множество."""
+        return not any(word in self for word in words)
@@ -0,0 +1,208 @@
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import zlib
+from contextlib import contextmanager
+from io import BufferedReader, StringIO, TextIOWrapper
+from typing import Callable, Iterator
+
+from .filter_stats import FilterStats
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+COMPRESSED_FILES = (gzip.GzipFile, bz2.BZ2File, lzma.LZMAFile)
+READ_SIZE = 1024 * 1024
+
+_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+_GZIP_MAGIC = b"\x1f\x8b\x08"
+
+
+def detect_compression(source: str | BufferedReader) -> str | None:
+    """
+    Определяет формат сжатия файла по сигнатуре в начале файла.
+
+    source - имя файла или открытый двоичный файл: у него сигнатура
+    читается через peek, не сдвигая позицию чтения.
+
+    Возвращает "gzip", "bz2", "xz", "zstd" или None для несжатого файла.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return detect_compression(f)
+    head = source.peek(6)[:6]
+    for magic, compression in _MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_compressed(
+    source: str | BufferedReader, compression: str
+) -> TextIOWrapper:
+    """
+    Открывает сжатый файл (имя или открытый двоичный файл)
+    в текстовом режиме с потоковой распаковкой.
+    """
+    if compression == "gzip":
+        binary = gzip.open(source, "rb")
+    elif compression == "bz2":
+        binary = bz2.open(source, "rb")
+    elif compression == "xz":
+        binary = lzma.open(source, "rb")
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ImportError(
+                "Для чтения файлов zstd нужен пакет zstandard"
+            )
+        binary = zstandard.open(source, "rb")
+    else:
+        raise ValueError(f"Получено {compression=}, неизвестный формат")
+    return TextIOWrapper(binary, encoding="utf-8")
+
+
+@contextmanager
+def open_text(path: str) -> Iterator[TextIOWrapper]:
+    """
+    Открывает файл в текстовом режиме, распаковывая сжатые файлы на лету.
+
+    Файл открывается один раз: формат определяется по сигнатуре через
+    peek, и распаковка читает тот же дескриптор, поэтому поддерживаются
+    файлы, которые можно прочитать только один раз (FIFO, /dev/stdin).
+    """
+    with open(path, "rb") as f:
+        compression = detect_compression(f)
+        with (
+            open_compressed(f, compression)
+            if compression is not None
+            else TextIOWrapper(f, encoding="utf-8")
+        ) as text:
+            yield text
+
+
+def _is_gzip_header(header: bytes) -> bool:
+    """
+    Проверяет, что байты похожи на заголовок члена gzip: сигнатура,
+    метод deflate, нулевые зарезервированные флаги.
+    """
+    return (
+        len(header) >= 10
+        and header.startswith(_GZIP_MAGIC)
+        and not header[3] & 0xE0
+        and header[8] in (0, 2, 4)
+    )
+
+
+def gzip_member_chunks(path: str, chunk_count: int) -> list[tuple[int, int]]:
+    """
+    Разбивает многочленный gzip-файл на диапазоны байт [start, end),
+    начинающиеся с кандидатов в заголовки членов.
+
+    Сигнатура может случайно встретиться внутри сжатых данных, поэтому
+    границы являются лишь кандидатами и проверяются при распаковке.
+    """
+    size = os.path.getsize(path)
+    offsets = [0]
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for index in range(1, chunk_count):
+            position = max(size * index // chunk_count, offsets[-1] + 1)
+            while (position := mm.find(_GZIP_MAGIC, position)) != -1:
+                if _is_gzip_header(mm[position:position + 10]):
+                    break
+                position += 1
+            if position == -1:
+                break
+            offsets.append(position)
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def _split_lines(
+    data: bytes, matcher: Callable[[str], bool], lines: list[str]
+) -> None:
+    """Проверяет блок завершенных строк и добавляет подходящие в lines."""
+    text = data.decode("utf-8")
+    for line in StringIO(text, newline=None):
+        if matcher(line):
+            lines.append(line.strip())
+
+
+def filter_gzip_members(
+    path: str,
+    start: int,
+    end: int,
+    matcher: Callable[[str], bool],
+    *,
+    stats: FilterStats | None = None,
+) -> tuple[bytes | None, list[str], bytes, int] | None:
+    """
+    Распаковывает члены gzip, начинающиеся в диапазоне [start, end),
+    и фильтрует полные строки внутри них.
+
+    Последний член распаковывается до конца, даже если выходит за end.
+    Возвращает кортеж (начало первой строки до перевода строки
+    включительно или None, если перевода строки не было; подходящие
+    полные строки; незавершенный конец последней строки; смещение
+    первого члена за пределами диапазона) или None, если start
+    не является началом члена gzip. В stats.bytes_read добавляется
+    размер распакованных полных строк, проверенных здесь.
+    """
+    head = None
+    lines = []
+    buffer = b""
+    decompressor = zlib.decompressobj(wbits=31)
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(READ_SIZE)
+        if not _is_gzip_header(data[:10]):
+            return None
+
+        while True:
+            try:
+                buffer += decompressor.decompress(data)
+            except zlib.error:
+                return None
+
+            if head is None and b"\n" in buffer:
+                head, buffer = buffer.split(b"\n", 1)
+                head += b"\n"
+            if head is not None and b"\n" in buffer:
+                complete, buffer = buffer.rsplit(b"\n", 1)
+                _split_lines(complete + b"\n", matcher, lines)
+                if stats is not None:
+                    stats.bytes_read += len(complete) + 1
+
+            if not decompressor.eof:
+                data = f.read(READ_SIZE)
+                if not data:
+                    raise EOFError(
+                        "Сжатый файл закончился до конца потока gzip"
+                    )
+                continue
+
+            data = decompressor.unused_data
+            position = f.tell() - len(data)
+            if len(data) < 10:
+                data += f.read(READ_SIZE)
+            if not data or position >= end:
+                break
+            if not _is_gzip_header(data[:10]):
+                # Мусор после последнего члена: поток закончился
+                position = os.fstat(f.fileno()).st_size
+                break
+            decompressor = zlib.decompressobj(wbits=31)
+
+    return head, lines, buffer, position
@@ -0,0 +1,85 @@
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+# Раз в сколько строк текстового режима обновляется bytes_read
+BYTES_READ_INTERVAL = 1024
+
+
+@dataclass
+class FilterStats:
+    """
+    Счетчики работы фильтра строк.
+
+    Обновляются по мере чтения строк, поэтому их можно читать, пока
+    генератор еще работает. bytes_read обновляет читатель файла по уже
+    прочитанным байтам (после распаковки сжатых файлов), а не record,
+    поэтому строки не кодируются заново. В текстовом режиме счетчик
+    обновляется по позиции буфера байт раз в BYTES_READ_INTERVAL строк
+    и может отставать на этот интервал до конца чтения.
+    """
+
+    lines_read: int = 0
+    bytes_read: int = 0
+    matches: int = 0
+    stop_word_rejections: int = 0
+    word_hits: Counter = field(default_factory=Counter)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def start(self) -> None:
+        """Отметка начала фильтрации."""
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def finish(self) -> None:
+        """Отметка окончания фильтрации."""
+        self.finished_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Время фильтрации в секундах (до текущего момента, если идет)."""
+        if self.started_at is None:
+            return 0.0
+        end = (
+            self.finished_at
+            if self.finished_at is not None
+            else time.perf_counter()
+        )
+        return end - self.started_at
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Скорость чтения в байтах в секунду."""
+        elapsed = self.elapsed
+        return self.bytes_read / elapsed if elapsed > 0 else 0.0
+
+    def record(self, hits: set[str], stopped: bool) -> bool:
+        """
+        Учитывает прочитанную строку и возвращает, прошла ли она фильтр.
+        """
+        self.lines_read += 1
+        if not hits:
+            return False
+        if stopped:
+            self.stop_word_rejections += 1
+            return False
+        self.matches += 1
+        self.word_hits.update(hits)
+        return True
+
+    def merge(self, other: "FilterStats") -> None:
+        """Добавляет счетчики другой статистики (например, из процесса)."""
+        self.lines_read += other.lines_read
+        self.bytes_read += other.bytes_read
+        self.matches += other.matches
+        self.stop_word_rejections += other.stop_word_rejections
+        self.word_hits.update(other.word_hits)
+
+    def reset(self) -> None:
+        """Обнуляет счетчики."""
+        self.lines_read = 0
+        self.bytes_read = 0
+        self.matches = 0
+        self.stop_word_rejections = 0
+        self.word_hits = Counter()
@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+from io import BufferedReader, StringIO
+from typing import Callable, Generator
+
+from .bloom_filter import BloomFilter
+from .text_search_filter import LineFilter
+
+
+def _filter_lines(
+    raw_lines: bytes, matcher: Callable[[str], bool]
+) -> Generator[str, None, None]:
+    """Декодирует блок строк и проверяет их так же, как текстовый режим."""
+    text = raw_lines.decode("utf-8")
+    # Текстовый режим также разбивает строки по одиночному \r
+    if "\r" in text or text.count("\n") > 1:
+        lines = StringIO(text, newline=None)
+    else:
+        lines = (text,)
+    for line in lines:
+        if matcher(line):
+            yield line.strip()
+
+
+def _is_rotated(f: BufferedReader, path: str) -> bool:
+    """
+    Проверяет, что по пути лежит другой файл (ротация логов). Пока новый
+    файл не создан, чтение продолжается из старого.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    current = os.fstat(f.fileno())
+    return (stat.st_dev, stat.st_ino) != (current.st_dev, current.st_ino)
+
+
+def _is_truncated(f: BufferedReader, path: str) -> bool:
+    """Проверяет, что файл был обрезан короче прочитанной части."""
+    try:
+        return os.stat(path).st_size < f.tell()
+    except FileNotFoundError:
+        return False
+
+
+def _wait(poll_interval: float, stop_event: threading.Event | None) -> None:
+    """Ожидание новых данных, прерываемое событием остановки."""
+    if stop_event is None:
+        time.sleep(poll_interval)
+    else:
+        stop_event.wait(poll_interval)
+
+
+def follow_line_filter(  # pylint: disable=too-many-arguments
+    path: str,
+    search_words: list[str],
+    stop_words: list[str] | BloomFilter | None = None,
+    *,
+    engine: str = "set",
+    poll_interval: float = 0.5,
+    from_end: bool = False,
+    stop_event: threading.Event | None = None,
+) -> Generator[str, None, None]:
+    """
+    Генератор, который следит за растущим файлом (аналог ``tail -f``)
+    и возвращает новые строки, прошедшие фильтр ``line_filter``.
+
+    Файл остается открытым, уже прочитанные байты повторно не читаются.
+    На конце файла генератор опрашивает его с интервалом poll_interval:
+    при замене файла по пути (ротация, смена inode) дочитывается старый
+    файл и открывается новый с начала, при обрезании файла чтение
+    начинается с начала. Незавершенная строка возвращается только после
+    появления перевода строки.
+
+    Параметры:
+    ----------
+    path : str
+        Имя файла.
+    search_words : List[str]
+        Список слов для поиска.
+    stop_words : Union[List[str], BloomFilter], optional
+        Список стоп-слов или BloomFilter, как в ``line_filter``.
+        По умолчанию None.
+    engine : str, optional
+        Движок поиска слов в строке, как в ``line_filter``.
+    poll_interval : float, optional
+        Интервал опроса файла в секундах. По умолчанию 0.5.
+    from_end : bool, optional
+        Начать с конца файла, пропустив уже записанные строки.
+        По умолчанию False.
+    stop_event : threading.Event, optional
+        Событие остановки: когда оно установлено и файл дочитан,
+        генератор завершается. По умолчанию None - следить бесконечно.
+
+    Исключения:
+    -----------
+    TypeError
+        Если аргументы не соответствуют ожидаемым типам.
+    ValueError
+        Если передан неизвестный движок поиска или poll_interval <= 0.
+    FileNotFoundError
+        Если файл не существует при запуске.
+    """
+    if not isinstance(path, str):
+        raise TypeError(
+            f"Получено {type(path).__name__}, path должен быть str"
+        )
+
+    matcher = LineFilter(search_words, stop_words, engine=engine).match
+
+    if not isinstance(poll_interval, (int, float)) or poll_interval <= 0:
+        raise ValueError(
+            f"Получено {poll_interval=}, poll_interval должен быть > 0"
+        )
+
+    f = open(path, "rb")  # pylint: disable=consider-using-with
+    try:
+        if from_end:
+            f.seek(0, os.SEEK_END)
+        pending = b""
+        while True:
+            chunk = f.readline()
+            if chunk:
+                pending += chunk
+                if pending.endswith(b"\n"):
+                    yield from _filter_lines(pending, matcher)
+                    pending = b""
+                continue
+
+            if _is_rotated(f, path):
+                # Дочитываем то, что успело попасть в старый файл
+                pending += f.read()
+                f.close()
+                f = open(path, "rb")  # pylint: disable=consider-using-with
+            elif _is_truncated(f, path):
+                f.seek(0)
+            elif stop_event is not None and stop_event.is_set():
+                break
+            else:
+                _wait(poll_interval, stop_event)
+                continue
+
+            # Старый файл дочитан: незавершенная строка больше не изменится
+            yield from _filter_lines(pending, matcher)
+            pending = b""
+
+        yield from _filter_lines(pending, matcher)
+    finally:
+        f.close()
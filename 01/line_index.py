@@ -0,0 +1,164 @@
+import os
+import sqlite3
+from array import array
+from contextlib import closing
+from io import StringIO
+from typing import Generator, Iterable
+
+from .bloom_filter import BloomFilter
+from .text_search_filter import LineFilter
+
+# Ограничение SQLite на количество параметров в одном запросе
+_QUERY_BATCH = 500
+
+
+class LineIndex:
+    """
+    Инвертированный индекс строк текстового файла, сохраняемый на диск.
+
+    Файл токенизируется один раз (слово -> смещения строк в байтах),
+    после чего запросы, эквивалентные ``line_filter``, выполняются
+    объединением и разностью списков смещений с чтением только
+    совпавших строк. Индекс хранит размер и время изменения исходного
+    файла и автоматически перестраивается, если файл изменился.
+    """
+
+    def __init__(self, path: str, index_path: str | None = None):
+        if not isinstance(path, str):
+            raise TypeError(
+                f"Получено {type(path).__name__}, path должен быть str"
+            )
+        if index_path is not None and not isinstance(index_path, str):
+            raise TypeError(
+                f"Получено {type(index_path).__name__}, "
+                "index_path должен быть str или быть None"
+            )
+        self.path = path
+        self.index_path = index_path if index_path else f"{path}.idx"
+
+    def _source_stat(self) -> tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def is_stale(self) -> bool:
+        """Проверяет, что индекс отсутствует или не соответствует файлу."""
+        if not os.path.exists(self.index_path):
+            return True
+        with closing(sqlite3.connect(self.index_path)) as connection:
+            try:
+                meta = dict(connection.execute("SELECT key, value FROM meta"))
+            except sqlite3.DatabaseError:
+                return True
+        return (meta.get("size"), meta.get("mtime_ns")) != self._source_stat()
+
+    def build(self) -> None:
+        """
+        Токенизирует файл и записывает индекс на диск.
+
+        Для строк с одиночным \\r (текстовый режим делит их на несколько
+        строк) смещения сохраняются отдельно: такие строки нельзя
+        отбросить разностью по стоп-словам без проверки.
+        """
+        size, mtime_ns = self._source_stat()
+        postings: dict[str, array] = {}
+        split_offsets = array("Q")
+
+        with open(self.path, "rb") as f:
+            offset = 0
+            for raw_line in f:
+                text = raw_line.decode("utf-8")
+                if "\r" in text.rstrip("\r\n"):
+                    split_offsets.append(offset)
+                for word in set(text.lower().split()):
+                    postings.setdefault(word, array("Q")).append(offset)
+                offset += len(raw_line)
+
+        tmp_path = f"{self.index_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        with closing(sqlite3.connect(tmp_path)) as connection:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE meta (key TEXT, value INTEGER)"
+                )
+                connection.execute(
+                    "CREATE TABLE postings "
+                    "(word TEXT PRIMARY KEY, offsets BLOB)"
+                )
+                connection.execute("CREATE TABLE split_lines (offsets BLOB)")
+                connection.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [("size", size), ("mtime_ns", mtime_ns)],
+                )
+                connection.executemany(
+                    "INSERT INTO postings VALUES (?, ?)",
+                    (
+                        (word, offsets.tobytes())
+                        for word, offsets in postings.items()
+                    ),
+                )
+                connection.execute(
+                    "INSERT INTO split_lines VALUES (?)",
+                    (split_offsets.tobytes(),),
+                )
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def _offsets(
+        connection: sqlite3.Connection, words: Iterable[str]
+    ) -> set[int]:
+        """Объединение списков смещений для переданных слов."""
+        words = list(words)
+        offsets = set()
+        for start in range(0, len(words), _QUERY_BATCH):
+            batch = words[start:start + _QUERY_BATCH]
+            rows = connection.execute(
+                "SELECT offsets FROM postings "
+                f"WHERE word IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            for (blob,) in rows:
+                offsets.update(array("Q", blob))
+        return offsets
+
+    def query(
+        self,
+        search_words: list[str],
+        stop_words: list[str] | BloomFilter | None = None,
+    ) -> Generator[str, None, None]:
+        """
+        Генератор строк файла, эквивалентный ``line_filter``.
+
+        Перед запросом индекс перестраивается, если файл изменился.
+        Возвращаются строки в исходном порядке без пробельных символов
+        по краям. Стоп-слова из BloomFilter не ищутся в индексе
+        и проверяются только в строках-кандидатах.
+        """
+        line_filter = LineFilter(search_words, stop_words)
+
+        if self.is_stale():
+            self.build()
+
+        with closing(sqlite3.connect(self.index_path)) as connection:
+            candidates = self._offsets(connection, line_filter.search_words)
+            excluded = (
+                set()
+                if isinstance(line_filter.stop_words, BloomFilter)
+                else self._offsets(connection, line_filter.stop_words)
+            )
+            if excluded:
+                (blob,) = connection.execute(
+                    "SELECT offsets FROM split_lines"
+                ).fetchone()
+                excluded.difference_update(array("Q", blob))
+
+        with open(self.path, "rb") as f:
+            for offset in sorted(candidates - excluded):
+                f.seek(offset)
+                text = f.readline().decode("utf-8")
+                lines = (
+                    StringIO(text, newline=None) if "\r" in text else (text,)
+                )
+                for line in lines:
+                    if line_filter.match(line):
+                        yield line.strip()
@@ -1,11 +1,191 @@
+import math
+import os
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Iterable, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
 class SomeModel:
     # pylint: disable=too-few-public-methods, unused-argument
     def predict(self, message: str) -> float: ...
 
 
-def predict_message_mood(
-    message: str, bad_thresholds: float = 0.3, good_thresholds: float = 0.8
-) -> str:
+class ModelRegistry:
+    """
+    Реестр модели с ленивой загрузкой.
+
+    Модель создается фабрикой при первом обращении, отдельно для каждого
+    потока и каждого процесса (после fork экземпляр создается заново),
+    и дальше переиспользуется, поэтому холодный старт происходит один
+    раз на поток, а не на каждое сообщение. Смена фабрики или clear
+    сбрасывают экземпляры во всех потоках.
+    """
+
+    def __init__(self, factory: Callable[[], SomeModel] = SomeModel):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._factory = SomeModel
+        self.loads = 0
+        self.set_factory(factory)
+
+    def get(self) -> SomeModel:
+        """Экземпляр модели для текущего потока."""
+        key = (self._generation, os.getpid())
+        if getattr(self._local, "key", None) != key:
+            with self._lock:
+                factory = self._factory
+                key = (self._generation, os.getpid())
+                self.loads += 1
+            self._local.model = factory()
+            self._local.key = key
+        return self._local.model
+
+    def set_factory(self, factory: Callable[[], SomeModel]) -> None:
+        """Заменяет фабрику модели, например для подстановки модели."""
+        if not callable(factory):
+            raise TypeError(
+                f"Получено {type(factory).__name__}, "
+                "factory должна быть вызываемым объектом."
+            )
+        with self._lock:
+            self._factory = factory
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Сбрасывает загруженные экземпляры во всех потоках."""
+        with self._lock:
+            self._generation += 1
+
+
+model_registry = ModelRegistry()
+
+
+def normalize_message(message: str) -> str:
+    """Ключ кэша: сообщение в нижнем регистре с одиночными пробелами."""
+    return " ".join(message.lower().split())
+
+
+class PredictionCache:
+    """
+    Ограниченный кэш предсказаний модели для повторяющихся сообщений.
+
+    Ключом служит нормализованное сообщение (normalize_message), поэтому
+    сообщения, отличающиеся регистром и пробелами, оцениваются моделью
+    один раз. Хранится предсказание, а не оценка, поэтому кэш можно
+    использовать с разными порогами, но только с одной моделью.
+    Самые давно использованные записи вытесняются при превышении maxsize,
+    записи старше ttl секунд считаются отсутствующими. Кэш
+    потокобезопасен.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int):
+            raise TypeError(
+                f"Получено {type(maxsize).__name__}, "
+                "maxsize должен быть целым числом."
+            )
+        if maxsize < 1:
+            raise ValueError(f"Получено {maxsize=}, maxsize должен быть >= 1.")
+        if ttl is not None and (
+            isinstance(ttl, bool) or not isinstance(ttl, (int, float))
+        ):
+            raise TypeError(
+                f"Получено {type(ttl).__name__}, "
+                "ttl должен быть числом или быть None."
+            )
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Получено {ttl=}, ttl должен быть > 0.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля обращений, найденных в кэше."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: str) -> float | None:
+        """Предсказание по ключу или None, если его нет или оно устарело."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry[1] < self.ttl
+            ):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, pred: float) -> None:
+        """Сохраняет предсказание, вытесняя самую старую запись."""
+        with self._lock:
+            self._data[key] = (pred, time.monotonic())
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Удаляет записи и обнуляет счетчики."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def cache_lookup(
+    messages: list[str], cache: PredictionCache
+) -> tuple[list[str], dict[str, float], dict[str, str]]:
+    """
+    Ключи сообщений, найденные в кэше предсказания и сообщения, которых
+    в кэше нет (одно сообщение на ключ).
+    """
+    keys = [normalize_message(message) for message in messages]
+    found = {}
+    missing = {}
+    for key, message in zip(keys, messages):
+        if key in found or key in missing:
+            continue
+        pred = cache.get(key)
+        if pred is None:
+            missing[key] = message
+        else:
+            found[key] = pred
+    return keys, found, missing
+
+
+def cache_store(
+    cache: PredictionCache,
+    found: dict[str, float],
+    missing: dict[str, str],
+    preds: list[float],
+) -> None:
+    """Сохраняет предсказания для сообщений missing в кэш и в found."""
+    for key, pred in zip(missing, preds):
+        cache.put(key, pred)
+        found[key] = pred
+
+
+def validate_message(message: str) -> None:
+    """Проверяет, что сообщение - непустая строка."""
     if not isinstance(message, str):
         raise TypeError(
             f"Получено {type(message).__name__}, "
@@ -14,6 +194,11 @@ def predict_message_mood(
     if not message.strip():
         raise ValueError("Ожидалось, что message не пустая строка.")
 
+
+def validate_thresholds(
+    bad_thresholds: float, good_thresholds: float
+) -> None:
+    """Проверяет, что пороги - числа из [0, 1] и bad <= good."""
     if not isinstance(bad_thresholds, (int, float)):
         raise TypeError(
             f"Получено {type(bad_thresholds).__name__}, "
@@ -39,19 +224,213 @@ def predict_message_mood(
             "bad_thresholds должен быть меньше или равен good_thresholds."
         )
 
-    model = SomeModel()
-    pred = float(
-        model.predict(message=message.lower())
-    )  # pylint: disable=E1111
+
+def validate_cache(cache: PredictionCache | None) -> None:
+    """Проверяет, что cache - PredictionCache или None."""
+    if cache is not None and not isinstance(cache, PredictionCache):
+        raise TypeError(
+            f"Получено {type(cache).__name__}, "
+            "cache должен быть PredictionCache или быть None."
+        )
+
+
+def validate_count(name: str, value: int) -> None:
+    """Проверяет, что параметр name - целое число не меньше 1."""
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(
+            f"Получено {type(value).__name__}, "
+            f"{name} должен быть целым числом."
+        )
+    if value < 1:
+        raise ValueError(f"Получено {name}={value}, ожидалось >= 1.")
+
+
+def _validate_pred(pred: float) -> float:
+    pred = float(pred)
 
     if not 0 <= pred <= 1:
         raise ValueError(
             "Ожидался pred с вероятностью от 0 до 1. "
             f"Получено {pred=}; {type(pred).__name__}"
         )
+    return pred
+
+
+class MoodScale:
+    """
+    Шкала оценок: отсортированные пороги и оценки между ними.
+
+    Оценка со значением score равна labels[i], где i - количество
+    порогов, не превышающих score, то есть порог относится к верхнему
+    интервалу. Пачка значений размечается двоичным поиском, а массив
+    NumPy (если NumPy установлен) - одним вызовом searchsorted, поэтому
+    одни и те же предсказания можно разметить несколькими шкалами без
+    повторного запуска модели.
+
+    Параметры:
+    ----------
+    thresholds : Sequence[float]
+        Неубывающие пороги.
+    labels : Sequence[str]
+        Оценки, на одну больше, чем порогов.
+
+    Исключения:
+    -----------
+    TypeError
+        Если пороги не числа или оценки не строки.
+    ValueError
+        Если пороги не отсортированы или число оценок не равно
+        числу порогов плюс один.
+    """
+
+    def __init__(self, thresholds: Sequence[float], labels: Sequence[str]):
+        if not all(
+            isinstance(threshold, (int, float))
+            and not isinstance(threshold, bool)
+            for threshold in thresholds
+        ):
+            raise TypeError("thresholds должен содержать только числа.")
+        if not all(isinstance(label, str) for label in labels):
+            raise TypeError("labels должен содержать только строки.")
+        if any(
+            low > high for low, high in zip(thresholds, thresholds[1:])
+        ):
+            raise ValueError("thresholds должен быть отсортирован.")
+        if len(labels) != len(thresholds) + 1:
+            raise ValueError(
+                f"Ожидалось {len(thresholds) + 1} оценок, "
+                f"получено {len(labels)}."
+            )
+        self.thresholds = list(thresholds)
+        self.labels = list(labels)
+
+    @classmethod
+    def from_thresholds(
+        cls, bad_thresholds: float = 0.3, good_thresholds: float = 0.8
+    ) -> "MoodScale":
+        """
+        Шкала predict_message_mood: "неуд" ниже bad_thresholds,
+        "отл" выше good_thresholds, "норм" между ними включительно.
+        """
+        validate_thresholds(bad_thresholds, good_thresholds)
+        # Значение, равное good_thresholds, остается в "норм"
+        return cls(
+            [bad_thresholds, math.nextafter(good_thresholds, math.inf)],
+            ["неуд", "норм", "отл"],
+        )
+
+    def label(self, score: float) -> str:
+        """Оценка одного значения."""
+        return self.labels[bisect_right(self.thresholds, score)]
+
+    def label_many(self, scores: Iterable[float]):
+        """
+        Оценки для пачки значений: список для последовательности,
+        массив NumPy для массива NumPy.
+        """
+        if numpy is not None and isinstance(scores, numpy.ndarray):
+            indexes = numpy.searchsorted(self.thresholds, scores, "right")
+            return numpy.asarray(self.labels)[indexes]
+        thresholds, labels = self.thresholds, self.labels
+        return [labels[bisect_right(thresholds, score)] for score in scores]
+
+
+def predict_message_mood(
+    message: str,
+    bad_thresholds: float = 0.3,
+    good_thresholds: float = 0.8,
+    *,
+    model: SomeModel | None = None,
+    cache: PredictionCache | None = None,
+) -> str:
+    validate_message(message)
+    scale = MoodScale.from_thresholds(bad_thresholds, good_thresholds)
+    validate_cache(cache)
+
+    key = normalize_message(message) if cache is not None else None
+    pred = cache.get(key) if cache is not None else None
+    if pred is None:
+        model = model if model is not None else model_registry.get()
+        pred = model.predict(message=message.lower())  # pylint: disable=E1111
+        if cache is not None:
+            cache.put(key, pred)
+
+    return scale.label(_validate_pred(pred))
+
+
+def _predict_many(model: SomeModel, messages: list[str]) -> list[float]:
+    predict_batch = getattr(model, "predict_batch", None)
+    if not callable(predict_batch):
+        return [model.predict(message=message) for message in messages]
+
+    preds = list(predict_batch(messages=messages))
+    if len(preds) != len(messages):
+        raise ValueError(
+            f"Ожидалось {len(messages)} предсказаний, "
+            f"получено {len(preds)}."
+        )
+    return preds
+
+
+def predict_message_scores(
+    messages: Iterable[str],
+    *,
+    model: SomeModel | None = None,
+    cache: PredictionCache | None = None,
+) -> list[float]:
+    """
+    Предсказания модели для пачки сообщений без перевода в оценки.
+
+    Модель берется из model_registry (или передается в model). Если
+    у модели есть метод predict_batch, все сообщения оцениваются одним
+    вызовом, иначе predict вызывается для каждого сообщения. С кэшем
+    модели передаются только сообщения, которых нет в кэше, каждое
+    нормализованное сообщение один раз. Результат можно разметить
+    несколькими шкалами MoodScale.
+    """
+    if isinstance(messages, str) or not isinstance(messages, Iterable):
+        raise TypeError(
+            f"Получено {type(messages).__name__}, "
+            "messages должен быть итерируемым объектом строк."
+        )
+    messages = list(messages)
+    for message in messages:
+        validate_message(message)
+    messages = [message.lower() for message in messages]
+    validate_cache(cache)
+
+    model = model if model is not None else model_registry.get()
+    if cache is None:
+        preds = _predict_many(model, messages)
+    else:
+        keys, found, missing = cache_lookup(messages, cache)
+        if missing:
+            cache_store(
+                cache,
+                found,
+                missing,
+                _predict_many(model, list(missing.values())),
+            )
+        preds = [found[key] for key in keys]
+
+    return [_validate_pred(pred) for pred in preds]
+
+
+def predict_message_mood_batch(  # pylint: disable=too-many-arguments
+    messages: Iterable[str],
+    bad_thresholds: float = 0.3,
+    good_thresholds: float = 0.8,
+    *,
+    model: SomeModel | None = None,
+    cache: PredictionCache | None = None,
+) -> list[str]:
+    """
+    Оценка пачки сообщений одной моделью.
 
-    if pred > good_thresholds:
-        return "отл"
-    if pred < bad_thresholds:
-        return "неуд"
-    return "норм"
+    Пороги проверяются один раз, предсказания получаются как
+    в ``predict_message_scores`` и размечаются шкалой
+    ``MoodScale.from_thresholds``. Возвращает оценки в порядке сообщений.
+    """
+    scale = MoodScale.from_thresholds(bad_thresholds, good_thresholds)
+    scores = predict_message_scores(messages, model=model, cache=cache)
+    return scale.label_many(scores)
@@ -0,0 +1,259 @@
+import mmap
+import os
+import re
+from functools import lru_cache
+from io import StringIO
+from typing import Callable, Generator, Iterable
+
+# Больше слов поиска поиск по байтам не ускоряет: каждое слово - это
+# отдельный проход по блоку (см. benchmark_line_filter.py), поэтому
+# проверяются все строки
+MMAP_MAX_WORDS = 16
+BLOCK_SIZE = 8 * 1024 * 1024
+
+# Выше U+20000 нет символов, у которых есть строчная форма
+_CASED_LIMIT = 0x20000
+# Самая короткая ASCII-часть слова, по которой ищутся кандидаты
+_MIN_NEEDLE = 3
+# ASCII-символы, которые не могут стоять рядом с границей слова
+_WORD_BOUNDARY_BEFORE = rb"(?<![\x21-\x7e])"
+_WORD_BOUNDARY_AFTER = rb"(?![\x21-\x7e])"
+
+
+@lru_cache(maxsize=None)
+def _lower_variants() -> dict[str, tuple[str, ...]]:
+    """
+    Таблица обратного приведения к нижнему регистру: строчная форма ->
+    все символы, которые после ``str.lower()`` дают эту форму.
+    """
+    variants = {}
+    for code in range(_CASED_LIMIT):
+        char = chr(code)
+        lower = char.lower()
+        variants.setdefault(lower, [lower])
+        if lower != char:
+            variants[lower].append(char)
+    # str.lower() всей строки переводит "Σ" в конце слова в "ς", а не "σ";
+    # других правил, зависящих от контекста, у str.lower() нет
+    variants["ς"].append("Σ")
+    return {lower: tuple(chars) for lower, chars in variants.items()}
+
+
+@lru_cache(maxsize=None)
+def _multi_char_variants() -> dict[str, tuple[str, ...]]:
+    """
+    Символы, строчная форма которых состоит из нескольких символов
+    (например, "İ" -> "i̇").
+    """
+    return {
+        lower: chars[1:]
+        for lower, chars in _lower_variants().items()
+        if len(lower) > 1
+    }
+
+
+def _alternatives(chars: Iterable[str]) -> bytes:
+    """Регулярное выражение, совпадающее с UTF-8 байтами любого символа."""
+    return (
+        b"(?:"
+        + b"|".join(re.escape(char.encode("utf-8")) for char in chars)
+        + b")"
+    )
+
+
+def _word_pattern(word: str) -> bytes:
+    """
+    Регулярное выражение на байтах UTF-8, совпадающее с любым написанием
+    слова, которое после ``str.lower()`` равно word.
+    """
+    variants = _lower_variants()
+    multi_char = _multi_char_variants()
+
+    parts = []
+    index = 0
+    while index < len(word):
+        for lower, chars in multi_char.items():
+            if word.startswith(lower, index):
+                single = b"".join(
+                    _alternatives(variants.get(char, (char,)))
+                    for char in lower
+                )
+                parts.append(
+                    b"(?:" + single + b"|" + _alternatives(chars) + b")"
+                )
+                index += len(lower)
+                break
+        else:
+            char = word[index]
+            parts.append(_alternatives(variants.get(char, (char,))))
+            index += 1
+    return b"".join(parts)
+
+
+def _matchable_words(search_words: Iterable[str]) -> set[str]:
+    """Слова поиска, которые могут совпасть с целым словом строки."""
+    return {
+        word.lower()
+        for word in search_words
+        if word and not any(char.isspace() for char in word)
+    }
+
+
+def compile_bytes_pattern(search_words: Iterable[str]) -> re.Pattern | None:
+    """
+    Компилирует регулярное выражение на байтах для поиска кандидатов
+    в строки по словам поиска без учета регистра.
+
+    Выражение является предфильтром: оно не пропускает ни одной строки
+    с совпадением, но может найти лишние (например, часть слова,
+    окруженную не ASCII-символами). Возвращает None, если ни одно слово
+    не может совпасть с целым словом строки.
+    """
+    words = sorted(_matchable_words(search_words), key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile(
+        _WORD_BOUNDARY_BEFORE
+        + b"(?:"
+        + b"|".join(_word_pattern(word) for word in words)
+        + b")"
+        + _WORD_BOUNDARY_AFTER
+    )
+
+
+def ascii_needle(word: str) -> bytes | None:
+    """
+    Самая длинная часть слова в нижнем регистре, любое написание которой
+    после ``bytes.lower()`` совпадает с ней байт в байт: ASCII-символы,
+    у которых нет других написаний (как "K" у "k") и которые не входят
+    в многосимвольную строчную форму (как "i̇" у "İ"). Возвращает None,
+    если такая часть короче _MIN_NEEDLE символов и не равна всему слову.
+    """
+    variants = _lower_variants()
+    unsafe = set()
+    for lower in _multi_char_variants():
+        start = word.find(lower)
+        while start != -1:
+            unsafe.update(range(start, start + len(lower)))
+            start = word.find(lower, start + 1)
+
+    best = run = ""
+    for index, char in enumerate(word):
+        if index not in unsafe and all(
+            variant.isascii() for variant in variants.get(char, (char,))
+        ):
+            run += char
+            best = max(best, run, key=len)
+        else:
+            run = ""
+    if len(best) < min(_MIN_NEEDLE, len(word)):
+        return None
+    return best.encode("ascii")
+
+
+def _compile_prefilter(
+    search_words: Iterable[str],
+) -> tuple[set[bytes], re.Pattern | None]:
+    """
+    Предфильтр кандидатов: ASCII-части слов для поиска в блоке,
+    приведенном ``bytes.lower()``, и регулярное выражение для остальных
+    слов (например, кириллических).
+    """
+    needles = set()
+    other_words = []
+    for word in _matchable_words(search_words):
+        needle = ascii_needle(word)
+        if needle is None:
+            other_words.append(word)
+        else:
+            needles.add(needle)
+    return needles, compile_bytes_pattern(other_words)
+
+
+def _blocks(mm: mmap.mmap) -> Generator[bytes, None, None]:
+    """Блоки файла примерно по BLOCK_SIZE байт, выровненные по "\\n"."""
+    start = 0
+    while start < len(mm):
+        end = mm.find(b"\n", start + BLOCK_SIZE - 1)
+        end = len(mm) if end == -1 else end + 1
+        yield mm[start:end]
+        start = end
+
+
+def _candidate_starts(
+    block: bytes, needles: set[bytes], pattern: re.Pattern | None
+) -> list[int]:
+    """Начала строк блока, в которых предфильтр нашел кандидата."""
+    starts = set()
+    folded = block.lower() if needles else block
+    for needle in needles:
+        position = folded.find(needle)
+        while position != -1:
+            starts.add(folded.rfind(b"\n", 0, position) + 1)
+            end = folded.find(b"\n", position)
+            position = -1 if end == -1 else folded.find(needle, end)
+
+    if pattern is not None:
+        position = 0
+        while (found := pattern.search(block, position)) is not None:
+            starts.add(block.rfind(b"\n", 0, found.start()) + 1)
+            position = block.find(b"\n", found.end())
+            if position == -1:
+                break
+    return sorted(starts)
+
+
+def mmap_line_filter(
+    path: str,
+    search_words: Iterable[str],
+    matcher: Callable[[str], bool],
+) -> Generator[str, None, None]:
+    """
+    Генератор строк файла, найденных поиском по байтам отображенного
+    в память файла.
+
+    Файл не декодируется целиком: он читается блоками, в которых
+    предфильтр ищет кандидатов по словам поиска прямо в байтах (ASCII-части
+    слов - через ``bytes.lower()`` и ``bytes.find``, остальные слова -
+    регулярным выражением). Только строки с кандидатами декодируются
+    и проверяются функцией matcher (включая стоп-слова). Строки
+    возвращаются в исходном порядке без пробельных символов по краям,
+    как и при чтении файла в текстовом режиме.
+
+    Каждое слово - это отдельный проход по блоку, поэтому при больших
+    списках (больше MMAP_MAX_WORDS слов поиска) предфильтр не строится:
+    блоки декодируются целиком и проверяются все строки, как при чтении
+    файла в текстовом режиме.
+    """
+    search_words = _matchable_words(search_words)
+    prefilter = len(search_words) <= MMAP_MAX_WORDS
+    needles, pattern = (
+        _compile_prefilter(search_words) if prefilter else (set(), None)
+    )
+    if (
+        prefilter and not needles and pattern is None
+    ) or os.path.getsize(path) == 0:
+        return
+
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for block in _blocks(mm):
+            if not prefilter:
+                lines = StringIO(block.decode("utf-8"), newline=None)
+                yield from (line.strip() for line in lines if matcher(line))
+                continue
+
+            for start in _candidate_starts(block, needles, pattern):
+                end = block.find(b"\n", start)
+                end = len(block) if end == -1 else end + 1
+
+                text = block[start:end].decode("utf-8")
+                # Текстовый режим также разбивает строки по одиночному \r
+                lines = (
+                    StringIO(text, newline=None) if "\r" in text else (text,)
+                )
+                for line in lines:
+                    if matcher(line):
+                        yield line.strip()
@@ -0,0 +1,227 @@
+import argparse
+import csv
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice, tee
+from typing import Generator, Iterable, TextIO
+
+from .message_mood import (
+    predict_message_mood_batch,
+    validate_count,
+    validate_thresholds,
+)
+
+BATCH_SIZE = 1000
+
+
+def _score_batch(
+    messages: list[str], bad_thresholds: float, good_thresholds: float
+) -> list[str]:
+    """
+    Оценка пачки в процессе пула. Пустые сообщения получают пустую
+    оценку, чтобы вывод оставался выровненным по входу.
+    """
+    labels = [""] * len(messages)
+    indexes = [
+        index for index, message in enumerate(messages) if message.strip()
+    ]
+    scored = predict_message_mood_batch(
+        [messages[index] for index in indexes],
+        bad_thresholds,
+        good_thresholds,
+    )
+    for index, label in zip(indexes, scored):
+        labels[index] = label
+    return labels
+
+
+def score_stream(
+    messages: Iterable[str],
+    bad_thresholds: float = 0.3,
+    good_thresholds: float = 0.8,
+    *,
+    batch_size: int = BATCH_SIZE,
+    workers: int | None = None,
+) -> Generator[str, None, None]:
+    """
+    Генератор оценок потока сообщений в исходном порядке.
+
+    Сообщения читаются пачками по batch_size. С workers пачки
+    оцениваются в пуле процессов (модель загружается один раз в каждом
+    процессе), одновременно в работе не больше 2 * workers пачек,
+    поэтому память ограничена независимо от размера входа. Пустые
+    сообщения получают пустую оценку.
+
+    Исключения:
+    -----------
+    TypeError
+        Если аргументы не соответствуют ожидаемым типам.
+    ValueError
+        Если пороги, batch_size или workers некорректны.
+    """
+    validate_thresholds(bad_thresholds, good_thresholds)
+    validate_count("batch_size", batch_size)
+    if workers is not None:
+        validate_count("workers", workers)
+
+    messages = iter(messages)
+    batches = iter(lambda: list(islice(messages, batch_size)), [])
+
+    if workers is None:
+        for batch in batches:
+            yield from _score_batch(batch, bad_thresholds, good_thresholds)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: deque[Future] = deque()
+    try:
+        for batch in batches:
+            pending.append(
+                executor.submit(
+                    _score_batch, batch, bad_thresholds, good_thresholds
+                )
+            )
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+class _Progress:
+    """Вывод количества оценок и скорости в stderr не чаще interval."""
+
+    def __init__(self, stream: TextIO, interval: float = 1.0):
+        self.stream = stream
+        self.interval = interval
+        self.count = 0
+        self.started_at = time.perf_counter()
+        self._reported_at = self.started_at
+
+    def update(self) -> None:
+        self.count += 1
+        now = time.perf_counter()
+        if now - self._reported_at >= self.interval:
+            self._reported_at = now
+            self.report(now)
+
+    def report(self, now: float | None = None) -> None:
+        now = now if now is not None else time.perf_counter()
+        elapsed = now - self.started_at
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        print(
+            f"scored {self.count} messages, {rate:.0f} messages/s",
+            file=self.stream,
+        )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Score messages with predict_message_mood"
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="Input file, '-' for stdin"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="Output file, '-' for stdout"
+    )
+    parser.add_argument(
+        "--csv",
+        metavar="COLUMN",
+        help="Read CSV with a header and score COLUMN; "
+        "rows are written back with an extra 'mood' column",
+    )
+    parser.add_argument("--bad", type=float, default=0.3)
+    parser.add_argument("--good", type=float, default=0.8)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument(
+        "-w", "--workers", type=int, help="Number of worker processes"
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Report progress and messages per second to stderr",
+    )
+    return parser
+
+
+def _open(path: str, mode: str, std: TextIO) -> TextIO:
+    if path == "-":
+        return std
+    return open(  # pylint: disable=consider-using-with
+        path, mode, encoding="utf-8", newline=""
+    )
+
+
+def _run(args: argparse.Namespace, source: TextIO, target: TextIO) -> None:
+    if args.csv is None:
+        rows = None
+        messages = (line.rstrip("\r\n") for line in source)
+    else:
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return
+        if args.csv not in header:
+            raise SystemExit(f"Column {args.csv!r} not found in CSV header")
+        column = header.index(args.csv)
+        writer = csv.writer(target, lineterminator="\n")
+        writer.writerow(header + ["mood"])
+        # tee хранит только строки, чьи пачки еще оцениваются
+        rows, message_rows = tee(reader)
+        messages = (
+            row[column] if column < len(row) else "" for row in message_rows
+        )
+
+    labels = score_stream(
+        messages,
+        args.bad,
+        args.good,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+    progress = _Progress(sys.stderr) if args.progress else None
+    for label in labels:
+        if rows is None:
+            target.write(f"{label}\n")
+        else:
+            writer.writerow(next(rows) + [label])
+        if progress is not None:
+            progress.update()
+    if progress is not None:
+        progress.report()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Оценивает сообщения из файла или stdin (по одному в строке или
+    столбец CSV) и пишет оценки в том же порядке в файл или stdout.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        validate_thresholds(args.bad, args.good)
+        validate_count("batch_size", args.batch_size)
+        if args.workers is not None:
+            validate_count("workers", args.workers)
+    except ValueError as error:
+        parser.error(str(error))
+
+    source = _open(args.input, "r", sys.stdin)
+    try:
+        target = _open(args.output, "w", sys.stdout)
+        try:
+            _run(args, source, target)
+        finally:
+            if target is not sys.stdout:
+                target.close()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()
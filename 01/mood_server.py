@@ -0,0 +1,216 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+
+from .message_mood import (
+    MoodScale,
+    PredictionCache,
+    SomeModel,
+    cache_lookup,
+    cache_store,
+    predict_message_scores,
+    validate_cache,
+    validate_count,
+    validate_message,
+)
+
+
+class MoodBatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Асинхронный сервис оценки сообщений с микробатчингом.
+
+    Одновременные вызовы predict собираются в пачки до max_batch_size
+    сообщений, ожидая новые сообщения не дольше max_wait_ms
+    миллисекунд после первого. Каждая пачка оценивается одним вызовом
+    ``predict_message_scores`` в пуле executor (по умолчанию пул
+    потоков цикла событий), после чего каждый вызывающий получает свою
+    оценку. При ошибке модели исключение получают все вызовы пачки.
+    Пока в пуле оценивается не больше max_in_flight пачек, следующие
+    пачки собираются и отправляются в пул, не дожидаясь предыдущих;
+    при max_in_flight > 1 модель вызывается одновременно из нескольких
+    потоков пула.
+
+    Кэш применяется в этом процессе до отправки пачки: в пул уходят
+    только сообщения, которых нет в кэше, поэтому cache работает и с пулом
+    процессов. Для пула процессов model должна поддерживать pickle.
+
+    Параметры:
+    ----------
+    bad_thresholds : float, optional
+        Нижний порог, как в ``predict_message_mood``. По умолчанию 0.3.
+    good_thresholds : float, optional
+        Верхний порог, как в ``predict_message_mood``. По умолчанию 0.8.
+    max_batch_size : int, optional
+        Максимальный размер пачки. По умолчанию 32.
+    max_wait_ms : float, optional
+        Максимальное ожидание пополнения пачки в миллисекундах.
+        По умолчанию 5.
+    max_in_flight : int, optional
+        Максимальное число пачек, одновременно оцениваемых в пуле.
+        По умолчанию 2.
+    executor : concurrent.futures.Executor, optional
+        Пул, в котором выполняется модель. По умолчанию None.
+    model : SomeModel, optional
+        Модель. По умолчанию None - модель из model_registry.
+    cache : PredictionCache, optional
+        Кэш предсказаний. По умолчанию None.
+
+    Исключения:
+    -----------
+    TypeError
+        Если аргументы не соответствуют ожидаемым типам.
+    ValueError
+        Если пороги, размер пачки, число пачек в работе или время
+        ожидания некорректны.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        bad_thresholds: float = 0.3,
+        good_thresholds: float = 0.8,
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_in_flight: int = 2,
+        executor: Executor | None = None,
+        model: SomeModel | None = None,
+        cache: PredictionCache | None = None,
+    ):
+        self._scale = MoodScale.from_thresholds(
+            bad_thresholds, good_thresholds
+        )
+        validate_cache(cache)
+        validate_count("max_batch_size", max_batch_size)
+        validate_count("max_in_flight", max_in_flight)
+        if isinstance(max_wait_ms, bool) or not isinstance(
+            max_wait_ms, (int, float)
+        ):
+            raise TypeError(
+                f"Получено {type(max_wait_ms).__name__}, "
+                "max_wait_ms должен быть числом."
+            )
+        if max_wait_ms < 0:
+            raise ValueError(
+                f"Получено {max_wait_ms=}, max_wait_ms должен быть >= 0."
+            )
+
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_in_flight = max_in_flight
+        self.batches = 0
+        self._predict_scores = partial(predict_message_scores, model=model)
+        self._cache = cache
+        self._executor = executor
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    async def __aenter__(self) -> "MoodBatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Запускает сбор пачек в текущем цикле событий."""
+        if self._task is not None:
+            raise RuntimeError("MoodBatcher уже запущен.")
+        self._queue = asyncio.Queue()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Оценивает уже поставленные сообщения и останавливает сервис."""
+        if self._task is None:
+            return
+        if not self._stopping:
+            # Новые вызовы predict отклоняются до сигнала остановки,
+            # иначе сообщение после него никогда не будет оценено
+            self._stopping = True
+            self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    async def predict(self, message: str) -> str:
+        """Оценка сообщения в составе ближайшей пачки."""
+        validate_message(message)
+        if self._task is None or self._task.done() or self._stopping:
+            raise RuntimeError("MoodBatcher не запущен.")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((message, future))
+        return await future
+
+    async def _collect(self, batch: list) -> bool:
+        """
+        Дополняет пачку до max_batch_size, пока не истекло max_wait_ms.
+        Возвращает False, если получен сигнал остановки.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            try:
+                if timeout <= 0:
+                    item = self._queue.get_nowait()
+                else:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            if item is None:
+                return False
+            batch.append(item)
+        return True
+
+    async def _scores(self, messages: list[str]) -> list[float]:
+        """
+        Предсказания для пачки: из кэша в этом процессе, остальные -
+        одним вызовом в пуле.
+        """
+        loop = asyncio.get_running_loop()
+        if self._cache is None:
+            return await loop.run_in_executor(
+                self._executor, self._predict_scores, messages
+            )
+        keys, found, missing = cache_lookup(messages, self._cache)
+        if missing:
+            preds = await loop.run_in_executor(
+                self._executor, self._predict_scores, list(missing.values())
+            )
+            cache_store(self._cache, found, missing, preds)
+        return [found[key] for key in keys]
+
+    async def _score(self, batch: list) -> None:
+        """Оценивает пачку в пуле и передает результаты вызывающим."""
+        messages = [message for message, _ in batch]
+        self.batches += 1
+        try:
+            labels = self._scale.label_many(await self._scores(messages))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), label in zip(batch, labels):
+            if not future.done():
+                future.set_result(label)
+
+    async def _run(self) -> None:
+        in_flight: set[asyncio.Task] = set()
+        running = True
+        try:
+            while running:
+                if len(in_flight) >= self.max_in_flight:
+                    _, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                item = await self._queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                running = await self._collect(batch)
+                in_flight.add(asyncio.create_task(self._score(batch)))
+        finally:
+            if in_flight:
+                await asyncio.wait(in_flight)
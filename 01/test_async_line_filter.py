@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from io import BytesIO, TextIOWrapper
+
+from .async_line_filter import async_line_filter
+from .text_search_filter import line_filter
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _collect(generator) -> list[str]:
+    return [line async for line in generator]
+
+
+class TestAsyncLineFilter(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.data = (
+            "а Роза упала на лапу Азора\r\n"
+            "Это просто тестовая строка\r"
+            "Без слов поиска\n"
+            "И ещё одна строка с Роза\n"
+            "Строка с стоп-словом Азора\n"
+            "И последняя строка без стоп-слов\r"
+        ).encode("utf-8")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    async def test_chunks_same_as_line_filter(self):
+        """
+        Проверка, что результат не зависит от разбиения на блоки
+        и совпадает с line_filter
+        """
+        cases = [
+            (["роза"], ["азора"]),
+            (["роза", "тестовая", "стоп-слов"], ["одна"]),
+            (["строка"], None),
+        ]
+        for search_words, stop_words in cases:
+            expected_output = list(
+                line_filter(
+                    TextIOWrapper(BytesIO(self.data), encoding="utf-8"),
+                    search_words,
+                    stop_words,
+                )
+            )
+            for size in (1, 2, 5, 1024):
+                for engine in ("set", "word_table"):
+                    result = await _collect(
+                        async_line_filter(
+                            _chunks(self.data, size),
+                            search_words,
+                            stop_words,
+                            engine=engine,
+                        )
+                    )
+                    self.assertEqual(result, expected_output)
+
+    async def test_stream_reader(self):
+        """
+        Проверка чтения из asyncio.StreamReader
+        """
+        reader = asyncio.StreamReader()
+        reader.feed_data(self.data[:7])
+        reader.feed_data(self.data[7:])
+        reader.feed_eof()
+
+        result = await _collect(async_line_filter(reader, ["роза"]))
+        self.assertEqual(
+            result, ["а Роза упала на лапу Азора", "И ещё одна строка с Роза"]
+        )
+
+    async def test_empty_source(self):
+        """
+        Проверка работы на пустом потоке
+        """
+        result = await _collect(async_line_filter(_chunks(b"", 1), ["роза"]))
+        self.assertEqual(result, [])
+
+    async def test_invalid_arguments(self):
+        """
+        Проверка, что некорректные аргументы вызывают исключения
+        """
+        with self.assertRaises(TypeError):
+            await _collect(async_line_filter(self.data, ["роза"]))
+        with self.assertRaises(TypeError):
+            await _collect(async_line_filter(_chunks(self.data, 4), "роза"))
+        with self.assertRaises(ValueError):
+            await _collect(
+                async_line_filter(
+                    _chunks(self.data, 4), ["роза"], engine="regex"
+                )
+            )
+
+        async def strings():
+            yield "роза"
+
+        with self.assertRaises(TypeError):
+            await _collect(async_line_filter(strings(), ["роза"]))
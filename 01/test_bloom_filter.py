@@ -0,0 +1,179 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from . import text_search_filter
+from .bloom_filter import BloomFilter
+from .filter_stats import FilterStats
+from .text_search_filter import LineFilter, line_filter
+
+
+class TestBloomFilter(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.bloom_path = os.path.join(self.tmp_dir, "stop.bloom")
+        self.path = os.path.join(self.tmp_dir, "text.txt")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(
+                (
+                    "а Роза упала на лапу Азора\n"
+                    "Это просто тестовая строка\n"
+                    "Без слов поиска\n"
+                    "И ещё одна строка с Роза\n"
+                    "Строка с стоп-словом Азора\n"
+                    "И последняя строка без стоп-слов\n"
+                )
+                * 10
+            )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+        print(f"End test {self.id()}")
+
+    def test_contains(self):
+        """
+        Проверка точной проверки слов без ложных срабатываний
+        """
+        words = [f"слово{number}" for number in range(1000)]
+        with BloomFilter.build(
+            words + ["Азора"], self.bloom_path, error_rate=0.2
+        ) as bloom:
+            self.assertEqual(len(bloom), 1001)
+            for word in words:
+                self.assertIn(word, bloom)
+                self.assertTrue(bloom.might_contain(word))
+            self.assertIn("азора", bloom)
+            self.assertIn("АЗОРА", bloom)
+
+            others = [f"другое{number}" for number in range(1000)]
+            self.assertTrue(
+                any(bloom.might_contain(word) for word in others)
+            )
+            for word in others + ["", "слово", "слово10000", "яяя"]:
+                self.assertNotIn(word, bloom)
+
+    def test_words_with_spaces_skipped(self):
+        """
+        Проверка пропуска пустых слов и слов с пробельными символами
+        """
+        with BloomFilter.build(
+            ["", "два слова", " роза", "азора"], self.bloom_path
+        ) as bloom:
+            self.assertEqual(len(bloom), 1)
+            self.assertNotIn("два слова", bloom)
+            self.assertIn("азора", bloom)
+
+    def test_empty(self):
+        """
+        Проверка пустого множества слов
+        """
+        with BloomFilter.build([], self.bloom_path) as bloom:
+            self.assertEqual(len(bloom), 0)
+            self.assertNotIn("роза", bloom)
+            self.assertTrue(bloom.isdisjoint(["роза", "азора"]))
+
+    def test_reopen_and_pickle(self):
+        """
+        Проверка повторного открытия файла и передачи через pickle
+        """
+        BloomFilter.build(["азора"], self.bloom_path).close()
+
+        with BloomFilter(self.bloom_path) as bloom:
+            self.assertIn("азора", bloom)
+            with pickle.loads(pickle.dumps(bloom)) as copy:
+                self.assertEqual(copy.path, self.bloom_path)
+                self.assertIn("азора", copy)
+                self.assertNotIn("роза", copy)
+
+    def test_line_filter_same_as_list(self):
+        """
+        Проверка, что BloomFilter в stop_words дает те же строки,
+        что и список стоп-слов
+        """
+        for stop_words in (["азора"], ["Азора", "стоп-слов"], []):
+            with BloomFilter.build(stop_words, self.bloom_path) as bloom:
+                for engine in ("set", "word_table"):
+                    expected = list(
+                        line_filter(
+                            self.path, ["роза", "строка"], stop_words,
+                            engine=engine,
+                        )
+                    )
+                    self.assertEqual(
+                        list(
+                            line_filter(
+                                self.path, ["роза", "строка"], bloom,
+                                engine=engine,
+                            )
+                        ),
+                        expected,
+                    )
+                    self.assertEqual(
+                        list(
+                            LineFilter(
+                                ["роза", "строка"], bloom, engine=engine
+                            )(self.path, use_mmap=True)
+                        ),
+                        expected,
+                    )
+
+    def test_line_filter_workers_and_stats(self):
+        """
+        Проверка BloomFilter при параллельной фильтрации и статистике
+        """
+        with BloomFilter.build(["азора"], self.bloom_path) as bloom:
+            for engine in ("set", "word_table"):
+                expected_stats = FilterStats()
+                expected = list(
+                    line_filter(
+                        self.path, ["роза"], ["азора"], engine=engine,
+                        stats=expected_stats,
+                    )
+                )
+
+                stats = FilterStats()
+                with patch.object(text_search_filter, "CHUNK_SIZE", 100):
+                    lines = list(
+                        line_filter(
+                            self.path, ["роза"], bloom, engine=engine,
+                            workers=2, stats=stats,
+                        )
+                    )
+
+                self.assertEqual(lines, expected)
+                self.assertEqual(stats.matches, expected_stats.matches)
+                self.assertEqual(
+                    stats.stop_word_rejections,
+                    expected_stats.stop_word_rejections,
+                )
+
+    def test_invalid_args(self):
+        """
+        Проверка некорректных аргументов
+        """
+        with self.assertRaises(TypeError):
+            BloomFilter(123)
+
+        with self.assertRaises(TypeError):
+            BloomFilter.build(["азора"], 123)
+
+        with self.assertRaises(TypeError):
+            BloomFilter.build(["азора", 1], self.bloom_path)
+
+        for error_rate in (0.0, 1.0, 1):
+            with self.assertRaises(ValueError):
+                BloomFilter.build(
+                    ["азора"], self.bloom_path, error_rate=error_rate
+                )
+
+        with self.assertRaises(ValueError):
+            BloomFilter(self.path)
+
+        with BloomFilter.build(["азора"], self.bloom_path) as bloom:
+            with self.assertRaises(TypeError):
+                next(line_filter(self.path, ["роза", 1], bloom))
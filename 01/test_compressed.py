@@ -0,0 +1,224 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from . import text_search_filter
+from .compressed import (
+    detect_compression,
+    filter_gzip_members,
+    gzip_member_chunks,
+    open_compressed,
+)
+from .filter_stats import FilterStats
+from .text_search_filter import line_filter
+
+
+class TestCompressed(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.text = (
+            "а Роза упала на лапу Азора\r\n"
+            "Это просто тестовая строка\n"
+            "Без слов поиска\n"
+            "И ещё одна строка с Роза\n"
+            "Строка с стоп-словом Азора\n"
+            "И последняя строка без стоп-слов"
+        ) * 20
+        self.data = self.text.encode("utf-8")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+        print(f"End test {self.id()}")
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def _multi_member_gzip(self, name: str, piece: int = 37) -> str:
+        # Члены режут строки и многобайтовые символы посередине
+        return self._write(
+            name,
+            b"".join(
+                gzip.compress(self.data[start:start + piece])
+                for start in range(0, len(self.data), piece)
+            ),
+        )
+
+    def test_detect_compression(self):
+        """
+        Проверка определения формата сжатия по сигнатуре
+        """
+        cases = {
+            "text.txt": (self.data, None),
+            "text.gz": (gzip.compress(self.data), "gzip"),
+            "text.bz2": (bz2.compress(self.data), "bz2"),
+            "text.xz": (lzma.compress(self.data), "xz"),
+            "text.zst": (b"\x28\xb5\x2f\xfd\x00\x00", "zstd"),
+            "empty.txt": (b"", None),
+        }
+        for name, (data, expected) in cases.items():
+            self.assertEqual(
+                detect_compression(self._write(name, data)), expected
+            )
+
+    def test_open_compressed(self):
+        """
+        Проверка чтения сжатого файла в текстовом режиме
+        """
+        path = self._write("text.bz2", bz2.compress(self.data))
+        with open_compressed(path, "bz2") as file:
+            self.assertEqual(file.readline(), "а Роза упала на лапу Азора\n")
+
+        with self.assertRaises(ValueError):
+            open_compressed(path, "rar")
+
+    def test_line_filter_compressed_files(self):
+        """
+        Проверка, что line_filter распаковывает файлы на лету
+        """
+        expected_output = list(
+            line_filter(self._write("text.txt", self.data), ["роза"], ["азора"])
+        )
+        for name, compress in (
+            ("text.gz", gzip.compress),
+            ("text.bz2", bz2.compress),
+            ("text.xz", lzma.compress),
+        ):
+            path = self._write(name, compress(self.data))
+            self.assertEqual(
+                list(line_filter(path, ["роза"], ["азора"])), expected_output
+            )
+
+        with gzip.open(self._write("object.gz", gzip.compress(self.data))) as f:
+            self.assertEqual(
+                list(line_filter(f, ["роза"], ["азора"])), expected_output
+            )
+
+    def test_detect_compression_open_file(self):
+        """
+        Проверка, что сигнатура открытого файла читается без сдвига позиции
+        """
+        path = self._write("text.gz", gzip.compress(self.data))
+        with open(path, "rb") as file:
+            self.assertEqual(detect_compression(file), "gzip")
+            self.assertEqual(file.tell(), 0)
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "нет os.mkfifo")
+    def test_line_filter_fifo(self):
+        """
+        Проверка, что файл, который читается один раз, читается целиком
+        """
+        expected_output = list(
+            line_filter(self._write("text.txt", self.data), ["роза"], ["азора"])
+        )
+        for name, data in (
+            ("text.fifo", self.data),
+            ("text.gz.fifo", gzip.compress(self.data)),
+        ):
+            path = os.path.join(self.tmp_dir, name)
+            os.mkfifo(path)
+            result = []
+            # Повторное открытие FIFO зависло бы, поэтому чтение идет
+            # в отдельном потоке с ограничением времени
+            threads = [
+                threading.Thread(
+                    target=self._write, args=(name, data), daemon=True
+                ),
+                threading.Thread(
+                    target=lambda path=path, result=result: result.extend(
+                        line_filter(path, ["роза"], ["азора"])
+                    ),
+                    daemon=True,
+                ),
+            ]
+            for thread in threads:
+                thread.start()
+            threads[1].join(timeout=10)
+            self.assertFalse(threads[1].is_alive())
+            self.assertEqual(result, expected_output)
+
+    def test_gzip_member_chunks(self):
+        """
+        Проверка, что диапазоны начинаются с заголовков членов gzip
+        """
+        path = self._multi_member_gzip("multi.gz")
+        chunks = gzip_member_chunks(path, 4)
+
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], os.path.getsize(path))
+        with open(path, "rb") as file:
+            for start, _ in chunks:
+                file.seek(start)
+                self.assertEqual(file.read(3), b"\x1f\x8b\x08")
+
+    def test_filter_gzip_members_not_member_start(self):
+        """
+        Проверка, что распаковка не с начала члена возвращает None
+        """
+        path = self._write("text.gz", gzip.compress(self.data))
+
+        self.assertIsNone(filter_gzip_members(path, 5, 10, bool))
+
+    def test_workers_multi_member_gzip(self):
+        """
+        Проверка параллельной распаковки многочленного gzip
+        """
+        expected_output = list(
+            line_filter(
+                self._write("text.txt", self.data), ["роза", "строка"], ["одна"]
+            )
+        )
+        path = self._multi_member_gzip("multi.gz")
+
+        for workers in (1, 3):
+            with patch.object(text_search_filter, "CHUNK_SIZE", 200):
+                result = list(
+                    line_filter(
+                        path, ["роза", "строка"], ["одна"], workers=workers
+                    )
+                )
+            self.assertEqual(result, expected_output)
+
+    def test_workers_false_member_boundary(self):
+        """
+        Проверка, что диапазон с ложной границей члена распаковывается
+        заново с реальной границы
+        """
+        expected_output = list(
+            line_filter(self._write("text.txt", self.data), ["роза"])
+        )
+        path = self._multi_member_gzip("multi.gz", piece=500)
+        real = gzip_member_chunks(path, 3)
+        bogus = [(0, 7), (7, real[1][0] + 3), (real[1][0] + 3, real[-1][1])]
+
+        stats = FilterStats()
+        with patch.object(
+            text_search_filter, "gzip_member_chunks", return_value=bogus
+        ):
+            result = list(line_filter(path, ["роза"], workers=2, stats=stats))
+        self.assertEqual(result, expected_output)
+        self.assertEqual(stats.lines_read, self.text.count("\n") + 1)
+        self.assertEqual(stats.matches, len(expected_output))
+        self.assertEqual(stats.bytes_read, len(self.data))
+
+    def test_invalid_compressed_modes(self):
+        """
+        Проверка неподдерживаемых режимов чтения сжатых файлов
+        """
+        gz_path = self._write("text.gz", gzip.compress(self.data))
+        bz2_path = self._write("text.bz2", bz2.compress(self.data))
+
+        with self.assertRaises(ValueError):
+            next(line_filter(gz_path, ["роза"], use_mmap=True))
+        with self.assertRaises(ValueError):
+            next(line_filter(bz2_path, ["роза"], workers=2))
@@ -0,0 +1,64 @@
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from .filter_stats import FilterStats
+
+
+class TestFilterStats(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    def test_record(self):
+        """
+        Проверка учета строк, совпадений и отброшенных строк
+        """
+        stats = FilterStats()
+
+        self.assertTrue(stats.record({"роза"}, False))
+        self.assertFalse(stats.record({"rose"}, True))
+        self.assertFalse(stats.record(set(), True))
+
+        self.assertEqual(stats.lines_read, 3)
+        self.assertEqual(stats.bytes_read, 0)
+        self.assertEqual(stats.matches, 1)
+        self.assertEqual(stats.stop_word_rejections, 1)
+        self.assertEqual(stats.word_hits, Counter({"роза": 1}))
+
+    def test_elapsed_and_speed(self):
+        """
+        Проверка времени работы и скорости чтения
+        """
+        stats = FilterStats()
+        self.assertEqual(stats.elapsed, 0.0)
+        self.assertEqual(stats.bytes_per_second, 0.0)
+
+        with patch("time.perf_counter", side_effect=[10.0, 12.0, 14.0]):
+            stats.start()
+            self.assertEqual(stats.elapsed, 2.0)
+            stats.finish()
+
+        stats.bytes_read = 100
+        self.assertEqual(stats.elapsed, 4.0)
+        self.assertEqual(stats.bytes_per_second, 25.0)
+
+    def test_merge_and_reset(self):
+        """
+        Проверка объединения и обнуления счетчиков
+        """
+        stats = FilterStats(1, 10, 1, 0, Counter({"роза": 1}))
+        other = FilterStats(2, 20, 1, 1, Counter({"роза": 1, "лапу": 1}))
+
+        stats.merge(other)
+        self.assertEqual(
+            (stats.lines_read, stats.bytes_read, stats.matches),
+            (3, 30, 2),
+        )
+        self.assertEqual(stats.stop_word_rejections, 1)
+        self.assertEqual(stats.word_hits, Counter({"роза": 2, "лапу": 1}))
+
+        stats.reset()
+        self.assertEqual(stats, FilterStats())
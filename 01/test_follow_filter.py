@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from .follow_filter import follow_line_filter
+
+
+class TestFollowLineFilter(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "app.log")
+        self.stop_event = threading.Event()
+        # Страховка от зависания теста
+        self.timer = threading.Timer(10, self.stop_event.set)
+        self.timer.start()
+
+        self._write(
+            "w", "а Роза упала на лапу Азора\nИ ещё одна строка с Роза\n"
+        )
+
+    def tearDown(self) -> None:
+        self.timer.cancel()
+        shutil.rmtree(self.tmp_dir)
+        print(f"End test {self.id()}")
+
+    def _write(self, mode: str, text: str) -> None:
+        with open(self.path, mode, encoding="utf-8") as file:
+            file.write(text)
+
+    def _follow(self, **kwargs):
+        return follow_line_filter(
+            self.path,
+            ["роза"],
+            ["азора"],
+            poll_interval=0.01,
+            stop_event=self.stop_event,
+            **kwargs,
+        )
+
+    def test_follow_appends(self):
+        """
+        Проверка, что дописанные строки возвращаются, а незавершенная
+        строка ждет перевода строки
+        """
+        lines = self._follow()
+        self.assertEqual(next(lines), "И ещё одна строка с Роза")
+
+        self._write("a", "новая роза")
+        threading.Timer(0.05, self._write, ("a", " в логе\nазора\n")).start()
+        self.assertEqual(next(lines), "новая роза в логе")
+
+        self.stop_event.set()
+        self.assertEqual(list(lines), [])
+
+    def test_follow_from_end(self):
+        """
+        Проверка, что при from_end уже записанные строки пропускаются
+        """
+        lines = self._follow(from_end=True)
+        threading.Timer(0.05, self._write, ("a", "роза\n")).start()
+
+        self.assertEqual(next(lines), "роза")
+
+    def test_follow_rotation(self):
+        """
+        Проверка, что после ротации дочитывается старый файл
+        и читается новый с начала
+        """
+        lines = self._follow()
+        self.assertEqual(next(lines), "И ещё одна строка с Роза")
+
+        self._write("a", "старая роза")
+        os.rename(self.path, f"{self.path}.1")
+        self._write("w", "роза в новом файле\n")
+
+        self.assertEqual(next(lines), "старая роза")
+        self.assertEqual(next(lines), "роза в новом файле")
+
+        self.stop_event.set()
+        self.assertEqual(list(lines), [])
+
+    def test_follow_truncation(self):
+        """
+        Проверка, что после обрезания файла чтение начинается с начала
+        """
+        lines = self._follow()
+        self.assertEqual(next(lines), "И ещё одна строка с Роза")
+
+        self._write("w", "роза\n")
+
+        self.assertEqual(next(lines), "роза")
+
+    def test_stop_event_flushes_last_line(self):
+        """
+        Проверка, что при остановке возвращается последняя
+        незавершенная строка
+        """
+        self._write("a", "последняя роза")
+        self.stop_event.set()
+
+        self.assertEqual(
+            list(self._follow()),
+            ["И ещё одна строка с Роза", "последняя роза"],
+        )
+
+    def test_invalid_arguments(self):
+        """
+        Проверка, что некорректные аргументы вызывают исключения
+        """
+        with self.assertRaises(TypeError):
+            next(follow_line_filter(123, ["роза"]))
+        with self.assertRaises(TypeError):
+            next(follow_line_filter(self.path, "роза"))
+        with self.assertRaises(ValueError):
+            next(follow_line_filter(self.path, ["роза"], engine="regex"))
+        with self.assertRaises(ValueError):
+            next(follow_line_filter(self.path, ["роза"], poll_interval=0))
+        with self.assertRaises(FileNotFoundError):
+            next(follow_line_filter(f"{self.path}.missing", ["роза"]))
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from .bloom_filter import BloomFilter
+from .line_index import LineIndex
+from .text_search_filter import line_filter
+
+
+class TestLineIndex(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "text.txt")
+        with open(self.path, "wb") as file:
+            file.write(
+                "а Роза упала на лапу Азора\r\n"
+                "Это просто тестовая строка\n"
+                "Без слов поиска\n"
+                "И ещё одна строка с Роза\n"
+                "роза\rи Азора\n"
+                "Строка с стоп-словом Азора\n"
+                "И последняя строка без стоп-слов".encode("utf-8")
+            )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+        print(f"End test {self.id()}")
+
+    def test_query_same_as_line_filter(self):
+        """
+        Проверка, что запросы к индексу возвращают те же строки,
+        что и line_filter
+        """
+        cases = [
+            (["роза"], ["азора"]),
+            (["роза"], None),
+            (["роз", "стоп-слов"], []),
+            (["РоЗа", "тестовая"], ["строка", "одна"]),
+            (["a Роза упала на лапу Азора"], []),
+            (["слово"], ["азора"]),
+            (["роза"], ["роза"]),
+        ]
+        index = LineIndex(self.path)
+        for search_words, stop_words in cases:
+            expected_output = list(
+                line_filter(self.path, search_words, stop_words)
+            )
+            result = list(index.query(search_words, stop_words))
+            self.assertEqual(result, expected_output)
+
+    def test_query_bloom_filter_stop_words(self):
+        """
+        Проверка стоп-слов из BloomFilter, как в line_filter
+        """
+        bloom_path = os.path.join(self.tmp_dir, "stop.bloom")
+        with BloomFilter.build(["Азора", "одна"], bloom_path) as bloom:
+            self.assertEqual(
+                list(LineIndex(self.path).query(["роза", "строка"], bloom)),
+                list(line_filter(self.path, ["роза", "строка"], bloom)),
+            )
+
+    def test_index_built_once(self):
+        """
+        Проверка, что индекс строится один раз и переиспользуется
+        """
+        index = LineIndex(self.path)
+        self.assertTrue(index.is_stale())
+
+        with patch.object(LineIndex, "build", wraps=index.build) as build:
+            list(index.query(["роза"]))
+            list(index.query(["азора"]))
+            list(LineIndex(self.path).query(["строка"]))
+
+            build.assert_called_once()
+        self.assertFalse(index.is_stale())
+
+    def test_index_invalidated_on_change(self):
+        """
+        Проверка, что индекс перестраивается при изменении файла
+        """
+        index = LineIndex(self.path)
+        self.assertEqual(list(index.query(["новая"])), [])
+
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\nновая строка")
+
+        self.assertTrue(index.is_stale())
+        self.assertEqual(list(index.query(["новая"])), ["новая строка"])
+
+    def test_custom_index_path(self):
+        """
+        Проверка сохранения индекса по указанному пути
+        """
+        index_path = os.path.join(self.tmp_dir, "custom.idx")
+        index = LineIndex(self.path, index_path)
+        index.build()
+
+        self.assertTrue(os.path.exists(index_path))
+        self.assertFalse(os.path.exists(f"{self.path}.idx"))
+
+    def test_corrupted_index_is_stale(self):
+        """
+        Проверка, что поврежденный файл индекса считается устаревшим
+        """
+        index = LineIndex(self.path)
+        with open(index.index_path, "wb") as file:
+            file.write(b"not an index")
+
+        self.assertTrue(index.is_stale())
+        self.assertEqual(len(list(index.query(["роза"]))), 3)
+
+    def test_invalid_arguments(self):
+        """
+        Проверка, что некорректные аргументы вызывают TypeError
+        """
+        with self.assertRaises(TypeError):
+            LineIndex(123)
+        with self.assertRaises(TypeError):
+            LineIndex(self.path, index_path=123)
+
+        index = LineIndex(self.path)
+        with self.assertRaises(TypeError):
+            next(index.query("роза"))
+        with self.assertRaises(TypeError):
+            next(index.query(["роза"], "азора"))
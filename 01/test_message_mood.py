@@ -1,7 +1,19 @@
+import os
+import threading
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from .message_mood import predict_message_mood, SomeModel
+from . import message_mood
+from .message_mood import (
+    ModelRegistry,
+    MoodScale,
+    PredictionCache,
+    model_registry,
+    predict_message_mood,
+    predict_message_mood_batch,
+    predict_message_scores,
+    SomeModel,
+)
 
 
 class TestPredMessageMood(unittest.TestCase):
@@ -239,3 +251,338 @@ class TestPredMessageMood(unittest.TestCase):
         )
         self.assertEqual(pred, "отл")
         mock_predict.assert_called_with(message="выше порога")
+
+    @patch.object(SomeModel, "predict")
+    def test_batch_same_as_single(self, mock_predict):
+        """
+        Проверка, что пачка оценивается так же, как по одному сообщению
+        """
+        messages = ["Чапаев и пустота", "Вулкан", "Нормально", "Граница"]
+        preds = {
+            "чапаев и пустота": 0.9,
+            "вулкан": 0.1,
+            "нормально": 0.5,
+            "граница": 0.8,
+        }
+        mock_predict.side_effect = lambda message: preds[message]
+
+        expected = [predict_message_mood(message) for message in messages]
+        mock_predict.reset_mock()
+
+        result = predict_message_mood_batch(messages)
+        self.assertEqual(result, expected)
+        self.assertEqual(result, ["отл", "неуд", "норм", "норм"])
+        self.assertEqual(mock_predict.call_count, len(messages))
+
+        self.assertEqual(
+            predict_message_mood_batch(
+                iter(messages), bad_thresholds=0.6, good_thresholds=0.85
+            ),
+            ["отл", "неуд", "неуд", "норм"],
+        )
+        self.assertEqual(predict_message_mood_batch([]), [])
+
+    def test_batch_uses_predict_batch(self):
+        """
+        Проверка одного вызова predict_batch у модели
+        """
+        model = SomeModel()
+        model.predict_batch = Mock(return_value=[0.9, 0.1])
+
+        with patch.object(SomeModel, "predict") as mock_predict:
+            result = predict_message_mood_batch(
+                ["Чапаев и пустота", "Вулкан"], model=model
+            )
+            mock_predict.assert_not_called()
+
+        self.assertEqual(result, ["отл", "неуд"])
+        model.predict_batch.assert_called_once_with(
+            messages=["чапаев и пустота", "вулкан"]
+        )
+
+        model.predict_batch.return_value = [0.9]
+        with self.assertRaises(ValueError):
+            predict_message_mood_batch(["Вулкан", "Вулкан"], model=model)
+
+        model.predict_batch.return_value = [0.9, 1.5]
+        with self.assertRaises(ValueError):
+            predict_message_mood_batch(["Вулкан", "Вулкан"], model=model)
+
+    def test_batch_invalid_args(self):
+        """
+        Проверка некорректных аргументов пачки сообщений
+        """
+        for invalid in ("сообщение", 123, None):
+            with self.assertRaises(TypeError):
+                predict_message_mood_batch(invalid)
+
+        with self.assertRaises(TypeError):
+            predict_message_mood_batch(["сообщение", 123])
+
+        with self.assertRaises(ValueError):
+            predict_message_mood_batch(["сообщение", " "])
+
+        with self.assertRaises(ValueError):
+            predict_message_mood_batch(["сообщение"], 0.9, 0.5)
+
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        print(f"\nStart test {self.id()}")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    def test_lazy_loading_and_reuse(self):
+        """
+        Проверка, что модель создается при первом обращении один раз
+        """
+        factory = Mock(side_effect=SomeModel)
+        registry = ModelRegistry(factory)
+        factory.assert_not_called()
+
+        model = registry.get()
+        self.assertIsInstance(model, SomeModel)
+        self.assertIs(registry.get(), model)
+        self.assertEqual(factory.call_count, 1)
+        self.assertEqual(registry.loads, 1)
+
+    def test_instance_per_thread_and_process(self):
+        """
+        Проверка отдельных экземпляров для потоков и процессов
+        """
+        registry = ModelRegistry()
+        models = []
+        threads = [
+            threading.Thread(target=lambda: models.append(registry.get()))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(map(id, models))), 3)
+        self.assertEqual(registry.loads, 3)
+
+        model = registry.get()
+        with patch.object(os, "getpid", return_value=-1):
+            self.assertIsNot(registry.get(), model)
+        self.assertEqual(registry.loads, 5)
+
+    def test_set_factory_and_clear(self):
+        """
+        Проверка замены фабрики и сброса экземпляров
+        """
+        registry = ModelRegistry()
+        model = registry.get()
+
+        registry.clear()
+        cleared = registry.get()
+        self.assertIsNot(cleared, model)
+
+        injected = SomeModel()
+        registry.set_factory(lambda: injected)
+        self.assertIs(registry.get(), injected)
+
+        with self.assertRaises(TypeError):
+            registry.set_factory(None)
+        with self.assertRaises(TypeError):
+            ModelRegistry(123)
+
+    @patch.object(SomeModel, "predict")
+    def test_predict_uses_registry(self, mock_predict):
+        """
+        Проверка, что модель не создается на каждое сообщение
+        """
+        mock_predict.return_value = 0.9
+        model_registry.clear()
+        loads = model_registry.loads
+
+        for _ in range(3):
+            self.assertEqual(predict_message_mood("Сообщение"), "отл")
+        predict_message_mood_batch(["Сообщение"])
+        self.assertEqual(model_registry.loads, loads + 1)
+
+    def test_predict_with_injected_model(self):
+        """
+        Проверка передачи модели в predict_message_mood
+        """
+        model = Mock()
+        model.predict.return_value = 0.1
+
+        self.assertEqual(predict_message_mood("Вулкан", model=model), "неуд")
+        model.predict.assert_called_once_with(message="вулкан")
+
+
+class TestPredictionCache(unittest.TestCase):
+    def setUp(self) -> None:
+        print(f"\nStart test {self.id()}")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    @patch.object(SomeModel, "predict")
+    def test_repeated_messages_skip_model(self, mock_predict):
+        """
+        Проверка, что нормализованные повторы не вызывают модель
+        """
+        mock_predict.return_value = 0.9
+        cache = PredictionCache()
+
+        for message in ("Спасибо", "  спасибо ", "СПАСИБО\t"):
+            self.assertEqual(
+                predict_message_mood(message, cache=cache), "отл"
+            )
+        mock_predict.assert_called_once_with(message="спасибо")
+
+        self.assertEqual(
+            predict_message_mood(
+                "Спасибо", bad_thresholds=0.95, good_thresholds=0.99,
+                cache=cache,
+            ),
+            "неуд",
+        )
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+        self.assertEqual(cache.hit_rate, 0.75)
+        self.assertEqual(len(cache), 1)
+
+    def test_batch_with_cache(self):
+        """
+        Проверка, что в пачке модели передаются только новые сообщения
+        """
+        model = Mock()
+        model.predict_batch.return_value = [0.1, 0.5]
+        cache = PredictionCache()
+        cache.put("ок", 0.9)
+
+        result = predict_message_mood_batch(
+            ["Ок", "Вулкан", "вулкан ", "Нормально", "ок"],
+            model=model,
+            cache=cache,
+        )
+
+        self.assertEqual(result, ["отл", "неуд", "неуд", "норм", "отл"])
+        model.predict_batch.assert_called_once_with(
+            messages=["вулкан", "нормально"]
+        )
+        self.assertEqual(len(cache), 3)
+
+        model.predict_batch.reset_mock()
+        predict_message_mood_batch(["Вулкан", "ок"], model=model, cache=cache)
+        model.predict_batch.assert_not_called()
+
+    def test_size_eviction(self):
+        """
+        Проверка вытеснения давно использованных записей
+        """
+        cache = PredictionCache(maxsize=2)
+        cache.put("а", 0.1)
+        cache.put("б", 0.2)
+        self.assertEqual(cache.get("а"), 0.1)
+        cache.put("в", 0.3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("б"))
+        self.assertEqual(cache.get("а"), 0.1)
+        self.assertEqual(cache.get("в"), 0.3)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+        self.assertEqual(cache.hit_rate, 0.0)
+
+    def test_ttl_eviction(self):
+        """
+        Проверка устаревания записей по ttl
+        """
+        cache = PredictionCache(ttl=10)
+        with patch.object(message_mood.time, "monotonic", return_value=100):
+            cache.put("а", 0.1)
+        with patch.object(message_mood.time, "monotonic", return_value=109):
+            self.assertEqual(cache.get("а"), 0.1)
+        with patch.object(message_mood.time, "monotonic", return_value=110):
+            self.assertIsNone(cache.get("а"))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_args(self):
+        """
+        Проверка некорректных параметров кэша
+        """
+        for maxsize in (1.5, "10", True):
+            with self.assertRaises(TypeError):
+                PredictionCache(maxsize=maxsize)
+        with self.assertRaises(ValueError):
+            PredictionCache(maxsize=0)
+        with self.assertRaises(TypeError):
+            PredictionCache(ttl="10")
+        with self.assertRaises(ValueError):
+            PredictionCache(ttl=0)
+
+        with self.assertRaises(TypeError):
+            predict_message_mood("Сообщение", cache={})
+        with self.assertRaises(TypeError):
+            predict_message_mood_batch(["Сообщение"], cache={})
+
+
+class TestMoodScale(unittest.TestCase):
+    def setUp(self) -> None:
+        print(f"\nStart test {self.id()}")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    def test_from_thresholds_same_as_predict(self):
+        """
+        Проверка, что шкала порогов совпадает с predict_message_mood
+        """
+        scores = [0, 0.299, 0.3, 0.301, 0.5, 0.799, 0.8, 0.801, 1]
+        thresholds = [(0.3, 0.8), (0.5, 0.5), (0, 0), (1, 1), (0, 1)]
+        model = Mock(spec=["predict"])
+        for bad, good in thresholds:
+            scale = MoodScale.from_thresholds(bad, good)
+            expected = []
+            for score in scores:
+                model.predict.return_value = score
+                expected.append(
+                    predict_message_mood("Сообщение", bad, good, model=model)
+                )
+            self.assertEqual(scale.label_many(scores), expected)
+            self.assertEqual([scale.label(score) for score in scores], expected)
+
+    def test_custom_scale(self):
+        """
+        Проверка произвольной шкалы и нескольких шкал на одних значениях
+        """
+        model = Mock(spec=["predict_batch"])
+        model.predict_batch.return_value = [0.05, 0.25, 0.5, 0.75, 0.95]
+        scores = predict_message_scores(["а", "б", "в", "г", "д"], model=model)
+
+        five = MoodScale([0.2, 0.4, 0.6, 0.8], ["1", "2", "3", "4", "5"])
+        binary = MoodScale([0.5], ["плохо", "хорошо"])
+        single = MoodScale([], ["все"])
+
+        self.assertEqual(five.label_many(scores), ["1", "2", "3", "4", "5"])
+        self.assertEqual(
+            binary.label_many(iter(scores)),
+            ["плохо", "плохо", "хорошо", "хорошо", "хорошо"],
+        )
+        self.assertEqual(single.label_many(scores), ["все"] * 5)
+        self.assertEqual(five.label(0.4), "3")
+        model.predict_batch.assert_called_once()
+
+    def test_invalid_scale(self):
+        """
+        Проверка некорректных порогов и оценок
+        """
+        with self.assertRaises(TypeError):
+            MoodScale([0.5, "0.8"], ["а", "б", "в"])
+        with self.assertRaises(TypeError):
+            MoodScale([True], ["а", "б"])
+        with self.assertRaises(TypeError):
+            MoodScale([0.5], ["а", 1])
+        with self.assertRaises(ValueError):
+            MoodScale([0.8, 0.5], ["а", "б", "в"])
+        with self.assertRaises(ValueError):
+            MoodScale([0.5], ["а", "б", "в"])
+        with self.assertRaises(ValueError):
+            MoodScale.from_thresholds(0.9, 0.5)
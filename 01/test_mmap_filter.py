@@ -0,0 +1,179 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from . import mmap_filter
+from .mmap_filter import (
+    MMAP_MAX_WORDS,
+    ascii_needle,
+    compile_bytes_pattern,
+    mmap_line_filter,
+)
+
+
+class TestMmapFilter(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    def test_pattern_case_insensitive(self):
+        """
+        Проверка, что выражение находит любое написание слова в байтах UTF-8
+        """
+        pattern = compile_bytes_pattern(["роза", "kelvin", "i̇stanbul"])
+
+        for text in ("РоЗа", "роза", "РОЗА", "KELVIN", "Kelvin"):
+            self.assertIsNotNone(pattern.search(text.encode("utf-8")))
+        self.assertIsNotNone(pattern.search("İstanbul".encode("utf-8")))
+        self.assertIsNone(pattern.search("роз".encode("utf-8")))
+
+    def test_pattern_ascii_word_boundary(self):
+        """
+        Проверка, что соседние ASCII-символы отсекают часть слова
+        """
+        pattern = compile_bytes_pattern(["word"])
+
+        self.assertIsNone(pattern.search(b"words sword"))
+        self.assertIsNotNone(pattern.search(b"a word\n"))
+
+    def test_pattern_no_words(self):
+        """
+        Проверка, что без слов, способных совпасть, выражение не строится
+        """
+        self.assertIsNone(compile_bytes_pattern([]))
+        self.assertIsNone(compile_bytes_pattern(["", "два слова"]))
+
+    def test_mmap_line_filter(self):
+        """
+        Проверка, что декодируются и проверяются только строки-кандидаты
+        """
+        checked = []
+
+        def matcher(line: str) -> bool:
+            checked.append(line)
+            return "азора" not in line.lower()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "text.txt")
+            with open(path, "wb") as file:
+                file.write(
+                    "а Роза упала\r\nБез слов\nроза\rи Азора\n"
+                    "розан\nРОЗА".encode("utf-8")
+                )
+
+            result = list(mmap_line_filter(path, ["роза"], matcher))
+
+            self.assertEqual(
+                result, ["а Роза упала", "роза", "розан", "РОЗА"]
+            )
+            self.assertEqual(
+                checked,
+                ["а Роза упала\n", "роза\n", "и Азора\n", "розан\n", "РОЗА"],
+            )
+
+    def test_mmap_line_filter_empty_file(self):
+        """
+        Проверка работы на пустом файле
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "empty.txt")
+            with open(path, "wb"):
+                pass
+
+            self.assertEqual(
+                list(mmap_line_filter(path, ["роза"], bool)), []
+            )
+
+    def test_pattern_final_sigma(self):
+        """
+        Проверка, что "ς" в слове совпадает с "Σ" в конце слова строки
+        """
+        pattern = compile_bytes_pattern(["λογος"])
+
+        for text in ("ΛΟΓΟΣ", "λογος", "Λογος"):
+            self.assertIsNotNone(pattern.search(text.encode("utf-8")))
+
+    def test_ascii_needle(self):
+        """
+        Проверка выбора ASCII-части слова без других написаний
+        """
+        self.assertEqual(ascii_needle("error"), b"error")
+        self.assertEqual(ascii_needle("ab"), b"ab")
+        self.assertEqual(ascii_needle("kelvin"), b"elvin")
+        self.assertEqual(ascii_needle("i̇stanbul"), b"stanbul")
+        self.assertEqual(ascii_needle("код-404"), b"-404")
+        self.assertIsNone(ascii_needle("роза"))
+        self.assertIsNone(ascii_needle("роза1"))
+
+    def test_mmap_line_filter_same_as_text_mode(self):
+        """
+        Проверка совпадения с текстовым режимом для ASCII-слов,
+        контекстных строчных форм и границ блоков
+        """
+        text = (
+            "ΛΟΓΟΣ\nλογος\nERROR disk\nerrors only\n\u212aELVIN\r"
+            "İstanbul warn\nwarning\nno match here\nWarn\n"
+        ) * 20
+        search_words = ["λογος", "error", "kelvin", "i̇stanbul", "warn"]
+        lines = [line.strip() for line in text.splitlines(keepends=True)]
+        expected = [
+            line
+            for line in lines
+            if set(line.lower().split()) & set(search_words)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "text.txt")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(text)
+
+            for block_size in (1, 10, 1024):
+                with patch.object(mmap_filter, "BLOCK_SIZE", block_size):
+                    result = list(
+                        mmap_line_filter(
+                            path,
+                            search_words,
+                            lambda line: bool(
+                                set(line.lower().split()) & set(search_words)
+                            ),
+                        )
+                    )
+                self.assertEqual(result, expected)
+        self.assertEqual(
+            expected[:5],
+            ["ΛΟΓΟΣ", "λογος", "ERROR disk", "\u212aELVIN", "İstanbul warn"],
+        )
+
+    def test_mmap_line_filter_many_words(self):
+        """
+        Проверка, что при больших списках слов проверяются все строки
+        """
+        checked = []
+
+        def matcher(line: str) -> bool:
+            checked.append(line)
+            return "word" in line.lower()
+
+        search_words = [f"word{number}" for number in range(MMAP_MAX_WORDS)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "text.txt")
+            with open(path, "wb") as file:
+                file.write(b"word1\nother\nWORD2 x\n  word\n")
+
+            self.assertEqual(
+                list(mmap_line_filter(path, search_words, matcher)),
+                ["word1", "WORD2 x"],
+            )
+            self.assertEqual(checked, ["word1\n", "WORD2 x\n"])
+
+            checked.clear()
+            self.assertEqual(
+                list(mmap_line_filter(path, search_words + ["word"], matcher)),
+                ["word1", "WORD2 x", "word"],
+            )
+            self.assertEqual(
+                checked, ["word1\n", "other\n", "WORD2 x\n", "  word\n"]
+            )
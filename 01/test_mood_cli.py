@@ -0,0 +1,123 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from .message_mood import SomeModel, model_registry
+from .mood_cli import main, score_stream
+
+
+def _predict(message: str) -> float:
+    return {"чапаев и пустота": 0.9, "вулкан": 0.1}.get(message, 0.5)
+
+
+@patch.object(SomeModel, "predict", side_effect=_predict)
+class TestMoodCli(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        model_registry.clear()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.tmp_dir, "messages.txt")
+        self.output_path = os.path.join(self.tmp_dir, "labels.txt")
+        self.messages = ["Чапаев и пустота", "Вулкан", "", "Норм"] * 5
+        self.labels = ["отл", "неуд", "", "норм"] * 5
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+        print(f"End test {self.id()}")
+
+    def test_score_stream_in_order(self, _):
+        """
+        Проверка порядка оценок при разных размерах пачки и пуле процессов
+        """
+        for batch_size in (1, 3, 100):
+            self.assertEqual(
+                list(score_stream(self.messages, batch_size=batch_size)),
+                self.labels,
+            )
+            self.assertEqual(
+                list(
+                    score_stream(
+                        iter(self.messages), batch_size=batch_size, workers=2
+                    )
+                ),
+                self.labels,
+            )
+        self.assertEqual(
+            list(score_stream(self.messages, 0.6, 0.95)),
+            ["норм", "неуд", "", "неуд"] * 5,
+        )
+        self.assertEqual(list(score_stream([])), [])
+
+    def test_score_stream_invalid_args(self, _):
+        """
+        Проверка некорректных аргументов
+        """
+        for kwargs in ({"batch_size": 1.5}, {"workers": "2"}):
+            with self.assertRaises(TypeError):
+                next(score_stream(self.messages, **kwargs))
+        for kwargs in ({"batch_size": 0}, {"workers": 0}):
+            with self.assertRaises(ValueError):
+                next(score_stream(self.messages, **kwargs))
+        with self.assertRaises(ValueError):
+            next(score_stream(self.messages, 0.9, 0.5))
+
+    def test_text_file(self, _):
+        """
+        Проверка оценки текстового файла с выводом в файл
+        """
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(self.messages) + "\n")
+
+        stderr = StringIO()
+        with patch.object(sys, "stderr", stderr):
+            main(
+                [
+                    self.input_path, "-o", self.output_path,
+                    "--batch-size", "3", "-w", "2", "--progress",
+                ]
+            )
+
+        with open(self.output_path, encoding="utf-8") as file:
+            self.assertEqual(file.read().split("\n")[:-1], self.labels)
+        self.assertIn("scored 20 messages", stderr.getvalue())
+        self.assertIn("messages/s", stderr.getvalue())
+
+    def test_csv_stdin_to_stdout(self, _):
+        """
+        Проверка оценки столбца CSV из stdin с выводом в stdout
+        """
+        stdin = StringIO(
+            'id,text\n1,"Чапаев и пустота"\n2,Вулкан\n3,"Норм, да"\n'
+        )
+        stdout = StringIO()
+        with patch.object(sys, "stdin", stdin), patch.object(
+            sys, "stdout", stdout
+        ):
+            main(["--csv", "text", "--batch-size", "2"])
+
+        self.assertEqual(
+            stdout.getvalue(),
+            "id,text,mood\n1,Чапаев и пустота,отл\n2,Вулкан,неуд\n"
+            '3,"Норм, да",норм\n',
+        )
+
+    def test_invalid_cli_args(self, _):
+        """
+        Проверка ошибок аргументов командной строки
+        """
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write("id,text\n")
+
+        for argv in (
+            [self.input_path, "--batch-size", "0"],
+            [self.input_path, "--bad", "0.9", "--good", "0.5"],
+            [self.input_path, "--csv", "message"],
+        ):
+            with patch.object(sys, "stderr", StringIO()):
+                with self.assertRaises(SystemExit):
+                    main(argv)
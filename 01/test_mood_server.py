@@ -0,0 +1,213 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import Mock
+
+from .message_mood import PredictionCache
+from .mood_server import MoodBatcher
+
+
+def _model(preds: dict) -> Mock:
+    model = Mock()
+    model.predict_batch.side_effect = lambda messages: [
+        preds[message] for message in messages
+    ]
+    return model
+
+
+class _DictModel:  # pylint: disable=too-few-public-methods
+    """Модель, которую можно передать в пул процессов"""
+
+    def __init__(self, preds: dict):
+        self.preds = preds
+
+    def predict_batch(self, messages: list[str]) -> list[float]:
+        return [self.preds[message] for message in messages]
+
+
+class TestMoodBatcher(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.preds = {"чапаев и пустота": 0.9, "вулкан": 0.1, "норм": 0.5}
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    async def test_concurrent_requests_batched(self):
+        """
+        Проверка, что одновременные запросы оцениваются пачками
+        """
+        model = _model(self.preds)
+        messages = ["Чапаев и пустота", "Вулкан", "Норм"] * 4
+
+        async with MoodBatcher(
+            max_batch_size=5, max_wait_ms=50, model=model
+        ) as batcher:
+            result = await asyncio.gather(
+                *(batcher.predict(message) for message in messages)
+            )
+
+        self.assertEqual(result, ["отл", "неуд", "норм"] * 4)
+        self.assertEqual(batcher.batches, 3)
+        self.assertEqual(
+            [len(call.kwargs["messages"]) for call in
+             model.predict_batch.call_args_list],
+            [5, 5, 2],
+        )
+
+    async def test_max_wait(self):
+        """
+        Проверка, что одиночный запрос не ждет заполнения пачки
+        """
+        model = _model(self.preds)
+        async with MoodBatcher(
+            max_batch_size=100, max_wait_ms=0, model=model
+        ) as batcher:
+            self.assertEqual(await batcher.predict("Вулкан"), "неуд")
+            self.assertEqual(await batcher.predict("Норм"), "норм")
+        self.assertEqual(batcher.batches, 2)
+
+    async def test_thresholds_executor_and_cache(self):
+        """
+        Проверка порогов, своего пула и кэша
+        """
+        model = _model(self.preds)
+        cache = PredictionCache()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async with MoodBatcher(
+                0.6, 0.95, executor=executor, model=model, cache=cache
+            ) as batcher:
+                result = await asyncio.gather(
+                    batcher.predict("Чапаев и пустота"),
+                    batcher.predict("чапаев  и пустота"),
+                )
+                self.assertEqual(result, ["норм", "норм"])
+                self.assertEqual(await batcher.predict("Норм"), "неуд")
+
+        self.assertEqual(len(cache), 2)
+
+    async def test_model_error_for_whole_batch(self):
+        """
+        Проверка, что ошибку модели получают все вызовы пачки
+        """
+        model = Mock()
+        model.predict_batch.return_value = [0.5, 1.5]
+        async with MoodBatcher(max_wait_ms=50, model=model) as batcher:
+            result = await asyncio.gather(
+                batcher.predict("Вулкан"),
+                batcher.predict("Норм"),
+                return_exceptions=True,
+            )
+            self.assertTrue(
+                all(isinstance(error, ValueError) for error in result)
+            )
+
+            model.predict_batch.return_value = [0.1]
+            self.assertEqual(await batcher.predict("Вулкан"), "неуд")
+
+    async def test_invalid_usage(self):
+        """
+        Проверка некорректных аргументов и вызовов вне работы сервиса
+        """
+        for kwargs in (
+            {"max_batch_size": 1.5},
+            {"max_wait_ms": "5"},
+            {"cache": {}},
+            {"bad_thresholds": None},
+        ):
+            with self.assertRaises(TypeError):
+                MoodBatcher(**kwargs)
+        for kwargs in (
+            {"max_batch_size": 0},
+            {"max_wait_ms": -1},
+            {"bad_thresholds": 0.9, "good_thresholds": 0.5},
+        ):
+            with self.assertRaises(ValueError):
+                MoodBatcher(**kwargs)
+
+        batcher = MoodBatcher(model=_model(self.preds))
+        with self.assertRaises(RuntimeError):
+            await batcher.predict("Вулкан")
+
+        async with batcher:
+            with self.assertRaises(RuntimeError):
+                await batcher.start()
+            with self.assertRaises(TypeError):
+                await batcher.predict(123)
+            with self.assertRaises(ValueError):
+                await batcher.predict(" ")
+
+        with self.assertRaises(RuntimeError):
+            await batcher.predict("Вулкан")
+        await batcher.stop()
+
+    async def test_process_pool_with_cache(self):
+        """
+        Проверка пула процессов с кэшем: в пул уходят только сообщения,
+        которых нет в кэше
+        """
+        cache = PredictionCache()
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            async with MoodBatcher(
+                max_wait_ms=50,
+                executor=executor,
+                model=_DictModel(self.preds),
+                cache=cache,
+            ) as batcher:
+                result = await asyncio.gather(
+                    batcher.predict("Чапаев и пустота"),
+                    batcher.predict("Вулкан"),
+                )
+                self.assertEqual(result, ["отл", "неуд"])
+                self.assertEqual(await batcher.predict("ВУЛКАН"), "неуд")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.hits, 1)
+
+    async def test_batches_in_flight(self):
+        """
+        Проверка, что пачки оцениваются в пуле одновременно
+        """
+        barrier = threading.Barrier(2, timeout=5)
+        model = Mock()
+
+        def predict_batch(messages):
+            barrier.wait()
+            return [self.preds[message] for message in messages]
+
+        model.predict_batch.side_effect = predict_batch
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            async with MoodBatcher(
+                max_batch_size=1, executor=executor, model=model
+            ) as batcher:
+                result = await asyncio.gather(
+                    batcher.predict("Вулкан"), batcher.predict("Норм")
+                )
+
+        self.assertEqual(result, ["неуд", "норм"])
+        self.assertEqual(batcher.batches, 2)
+
+        with self.assertRaises(TypeError):
+            MoodBatcher(max_in_flight=1.5)
+        with self.assertRaises(ValueError):
+            MoodBatcher(max_in_flight=0)
+
+    async def test_predict_while_stopping(self):
+        """
+        Проверка, что predict после начала остановки отклоняется,
+        а уже поставленные сообщения оцениваются
+        """
+        batcher = MoodBatcher(max_wait_ms=50, model=_model(self.preds))
+        await batcher.start()
+        queued = asyncio.create_task(batcher.predict("Вулкан"))
+        await asyncio.sleep(0)
+
+        stopping = asyncio.create_task(batcher.stop())
+        await asyncio.sleep(0)
+        with self.assertRaises(RuntimeError):
+            await batcher.predict("Норм")
+
+        await stopping
+        self.assertEqual(await queued, "неуд")
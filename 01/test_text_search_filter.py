@@ -1,9 +1,26 @@
 # pylint: disable=W1514,R0904
 
+import os
+import tempfile
 import unittest
-from io import TextIOWrapper, BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO, TextIOWrapper, BytesIO
+from unittest.mock import Mock, patch
 
-from .text_search_filter import line_filter
+from . import text_search_filter
+from .bloom_filter import BloomFilter
+from .filter_stats import FilterStats
+from .text_search_filter import LineFilter, line_filter, multi_line_filter
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Пул потоков, считающий отправленные задачи"""
+
+    submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        _CountingExecutor.submitted += 1
+        return super().submit(fn, *args, **kwargs)
 
 
 class TestLineFilter(unittest.TestCase):
@@ -340,3 +357,373 @@ class TestLineFilter(unittest.TestCase):
 
         result = list(line_filter(text_wrapper, search_words, stop_words))
         self.assertEqual(result, expected_output)
+
+    def test_word_table_engine_same_as_set(self):
+        """
+        Проверка, что движок word_table возвращает те же строки,
+        что и движок по умолчанию
+        """
+        cases = [
+            (["роза"], ["азора"]),
+            (["роза"], []),
+            (["роз", "стоп-слов"], []),
+            (["РоЗа"], ["АзОра"]),
+            (["роза", "тестовая", "стоп-слов"], ["строка", "одна"]),
+            ("a Роза упала на лапу Азора".split(), []),
+            (["a Роза упала на лапу Азора"], []),
+            (["роза"], ["a Роза упала на лапу Азора"]),
+            (["роза"], ["роза"]),
+        ]
+        for search_words, stop_words in cases:
+            expected_output = list(
+                line_filter(
+                    TextIOWrapper(BytesIO(self.text.encode("utf-8"))),
+                    search_words,
+                    stop_words,
+                )
+            )
+            result = list(
+                line_filter(
+                    TextIOWrapper(BytesIO(self.text.encode("utf-8"))),
+                    search_words,
+                    stop_words,
+                    engine="word_table",
+                )
+            )
+            self.assertEqual(result, expected_output)
+
+    def test_invalid_engine(self):
+        """
+        Проверка, что передача неизвестного движка вызывает ValueError
+        """
+        with self.assertRaises(ValueError):
+            next(line_filter(self.text_wrapper, ["роза"], engine="regex"))
+
+    def test_workers_same_as_sequential(self):
+        """
+        Проверка, что параллельная фильтрация по частям файла возвращает
+        те же строки в том же порядке, что и последовательная
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "text.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write((self.text + "\n") * 50)
+
+            search_words = ["роза", "тестовая", "стоп-слов"]
+            stop_words = ["одна"]
+            expected_output = list(line_filter(path, search_words, stop_words))
+
+            for workers in (1, 3):
+                for chunk_size in (7, 100, 1024 * 1024):
+                    with patch.object(
+                        text_search_filter, "CHUNK_SIZE", chunk_size
+                    ):
+                        result = list(
+                            line_filter(
+                                path, search_words, stop_words, workers=workers
+                            )
+                        )
+                    self.assertEqual(result, expected_output)
+
+    def test_workers_bounded_in_flight(self):
+        """
+        Проверка, что в работе не больше 2 * workers диапазонов файла
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "text.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write((self.text + "\n") * 50)
+
+            _CountingExecutor.submitted = 0
+            with patch.object(
+                text_search_filter, "ProcessPoolExecutor", _CountingExecutor
+            ), patch.object(text_search_filter, "CHUNK_SIZE", 100):
+                result = line_filter(path, ["роза"], workers=2)
+                self.assertEqual(next(result), "а Роза упала на лапу Азора")
+                self.assertEqual(_CountingExecutor.submitted, 4)
+                self.assertEqual(len(list(result)), 99)
+                self.assertGreater(_CountingExecutor.submitted, 50)
+
+    def test_workers_empty_file(self):
+        """
+        Проверка параллельной фильтрации пустого файла
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "empty.txt")
+            with open(path, "w", encoding="utf-8"):
+                pass
+
+            self.assertEqual(list(line_filter(path, ["роза"], workers=2)), [])
+
+    def test_invalid_workers(self):
+        """
+        Проверка, что некорректное значение workers вызывает исключение
+        """
+        for invalid_value in ("2", 1.5, True):
+            with self.assertRaises(TypeError):
+                next(line_filter("text.txt", ["роза"], workers=invalid_value))
+
+        for invalid_value in (0, -1):
+            with self.assertRaises(ValueError):
+                next(line_filter("text.txt", ["роза"], workers=invalid_value))
+
+        with self.assertRaises(ValueError):
+            next(line_filter(self.text_wrapper, ["роза"], workers=2))
+
+    def test_use_mmap_same_as_text_mode(self):
+        """
+        Проверка, что поиск по байтам отображенного в память файла
+        возвращает те же строки, что и чтение в текстовом режиме
+        """
+        cases = [
+            (["роза"], ["азора"]),
+            (["РоЗа", "стоп-слов"], []),
+            (["роз", "тестовая"], ["одна"]),
+            (["a Роза упала на лапу Азора"], []),
+            ("а Роза упала на лапу Азора строка тестовая с стоп-слов "
+             "просто И ещё одна последняя без Это слов поиска".split(),
+             ["азора"]),
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "text.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(self.text)
+
+            for search_words, stop_words in cases:
+                for engine in ("set", "word_table"):
+                    expected_output = list(
+                        line_filter(path, search_words, stop_words)
+                    )
+                    result = list(
+                        line_filter(
+                            path,
+                            search_words,
+                            stop_words,
+                            engine=engine,
+                            use_mmap=True,
+                        )
+                    )
+                    self.assertEqual(result, expected_output)
+
+    def test_invalid_use_mmap(self):
+        """
+        Проверка, что use_mmap поддерживается только для имени файла
+        и не совместим с workers
+        """
+        with self.assertRaises(ValueError):
+            next(line_filter(self.text_wrapper, ["роза"], use_mmap=True))
+
+        with self.assertRaises(ValueError):
+            next(line_filter("text.txt", ["роза"], workers=2, use_mmap=True))
+
+    def test_multi_line_filter_same_as_line_filter(self):
+        """
+        Проверка, что пакетная фильтрация возвращает для каждого правила
+        те же строки, что и line_filter
+        """
+        rules = {
+            "roza": (["роза"], ["азора"]),
+            "roza_all": (["РоЗа"], None),
+            "substring": (["роз", "стоп-слов"], []),
+            "many": (["роза", "тестовая", "стоп-слов"], ["строка", "одна"]),
+            "same": (["роза"], ["роза"]),
+            "nothing": (["слово"], []),
+        }
+
+        result = list(multi_line_filter(self.text_wrapper, rules))
+
+        for rule_id, (search_words, stop_words) in rules.items():
+            expected_output = list(
+                line_filter(
+                    TextIOWrapper(BytesIO(self.text.encode("utf-8"))),
+                    search_words,
+                    stop_words,
+                )
+            )
+            self.assertEqual(
+                [line for rule, line in result if rule == rule_id],
+                expected_output,
+            )
+
+        self.assertEqual(
+            result[:4],
+            [
+                ("roza_all", "а Роза упала на лапу Азора"),
+                ("many", "а Роза упала на лапу Азора"),
+                ("roza", "И ещё одна строка с Роза"),
+                ("roza_all", "И ещё одна строка с Роза"),
+            ],
+        )
+
+    def test_multi_line_filter_invalid_rules(self):
+        """
+        Проверка, что некорректные правила вызывают TypeError
+        """
+        invalid_rules = [
+            [(["роза"], [])],
+            {"rule": ["роза"]},
+            {"rule": ("роза", [])},
+            {"rule": (["роза"], "азора")},
+        ]
+        for rules in invalid_rules:
+            with self.assertRaises(TypeError):
+                next(multi_line_filter(self.text_wrapper, rules))
+
+        with self.assertRaises(TypeError):
+            next(multi_line_filter(123, {"rule": (["роза"], [])}))
+
+    def test_stats(self):
+        """
+        Проверка статистики фильтрации для обоих движков
+        """
+        for engine in ("set", "word_table"):
+            stats = FilterStats()
+            lines = line_filter(
+                TextIOWrapper(BytesIO(self.text.encode("utf-8"))),
+                ["роза", "строка"],
+                ["азора", "одна"],
+                engine=engine,
+                stats=stats,
+            )
+
+            self.assertEqual(next(lines), "Это просто тестовая строка")
+            self.assertEqual(stats.lines_read, 2)
+            self.assertIsNone(stats.finished_at)
+
+            self.assertEqual(list(lines), ["И последняя строка без стоп-слов"])
+            self.assertEqual(stats.lines_read, 6)
+            self.assertEqual(stats.bytes_read, len(self.text.encode()))
+            self.assertEqual(stats.matches, 2)
+            self.assertEqual(stats.stop_word_rejections, 3)
+            self.assertEqual(stats.word_hits, {"строка": 2})
+            self.assertIsNotNone(stats.finished_at)
+            self.assertGreater(stats.elapsed, 0)
+
+    def test_stats_bytes_read(self):
+        """
+        Проверка bytes_read по буферу байт, при раннем завершении
+        и для текстовых объектов без буфера байт
+        """
+        size = len(self.text.encode())
+        with patch.object(text_search_filter, "BYTES_READ_INTERVAL", 2):
+            stats = FilterStats()
+            lines = line_filter(
+                TextIOWrapper(BytesIO(self.text.encode())),
+                ["роза"],
+                stats=stats,
+            )
+            next(lines)
+            self.assertEqual(next(lines), "И ещё одна строка с Роза")
+            self.assertEqual(stats.bytes_read, size)
+            lines.close()
+            self.assertEqual(stats.bytes_read, size)
+
+            stats = FilterStats()
+            list(line_filter(StringIO(self.text), ["роза"], stats=stats))
+            self.assertEqual(stats.bytes_read, size)
+
+    def test_stats_stop_words_only_with_hits(self):
+        """
+        Проверка, что стоп-слова проверяются только в строках со словом
+        поиска
+        """
+        stop_words = Mock(spec=BloomFilter)
+        stop_words.isdisjoint.return_value = True
+        stats = FilterStats()
+
+        result = list(
+            LineFilter(["роза"], stop_words)(self.text_wrapper, stats=stats)
+        )
+        self.assertEqual(
+            result, ["а Роза упала на лапу Азора", "И ещё одна строка с Роза"]
+        )
+        self.assertEqual(stop_words.isdisjoint.call_count, 2)
+        self.assertEqual(stats.lines_read, 6)
+
+    def test_stats_workers(self):
+        """
+        Проверка, что статистика процессов пула объединяется
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "text.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write((self.text + "\n") * 10)
+
+            expected_stats = FilterStats()
+            list(line_filter(path, ["роза"], ["азора"], stats=expected_stats))
+
+            stats = FilterStats()
+            with patch.object(text_search_filter, "CHUNK_SIZE", 100):
+                list(
+                    line_filter(
+                        path, ["роза"], ["азора"], workers=2, stats=stats
+                    )
+                )
+
+            self.assertEqual(stats.lines_read, 60)
+            self.assertEqual(stats.matches, 10)
+            self.assertEqual(stats.stop_word_rejections, 10)
+            self.assertEqual(stats.word_hits, expected_stats.word_hits)
+            self.assertEqual(stats.bytes_read, expected_stats.bytes_read)
+
+    def test_invalid_stats(self):
+        """
+        Проверка некорректных значений stats
+        """
+        with self.assertRaises(TypeError):
+            next(line_filter(self.text_wrapper, ["роза"], stats={}))
+
+        with self.assertRaises(ValueError):
+            next(
+                line_filter(
+                    "text.txt", ["роза"], use_mmap=True, stats=FilterStats()
+                )
+            )
+
+    def test_line_filter_object_reuse(self):
+        """
+        Проверка многократного использования скомпилированного фильтра
+        """
+        expected = list(line_filter(self.text_wrapper, ["роза"], ["азора"]))
+
+        for engine in ("set", "word_table"):
+            line_filter_object = LineFilter(
+                ["Роза"], ["Азора"], engine=engine
+            )
+            self.assertEqual(
+                list(line_filter_object(StringIO(self.text))), expected
+            )
+            self.assertEqual(
+                list(line_filter_object(StringIO(self.text))), expected
+            )
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, "text.txt")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(self.text)
+                self.assertEqual(list(line_filter_object(path)), expected)
+
+    def test_line_filter_object_match(self):
+        """
+        Проверка проверки одной строки скомпилированным фильтром
+        """
+        for engine in ("set", "word_table"):
+            line_filter_object = LineFilter(
+                ["роза"], ["азора"], engine=engine
+            )
+            self.assertTrue(line_filter_object.match("И ещё Роза\n"))
+            self.assertFalse(line_filter_object.match("Роза и Азора"))
+            self.assertFalse(line_filter_object.match("розан"))
+
+    def test_line_filter_object_invalid_args(self):
+        """
+        Проверка некорректных аргументов скомпилированного фильтра
+        """
+        with self.assertRaises(TypeError):
+            LineFilter("роза")
+
+        with self.assertRaises(ValueError):
+            LineFilter(["роза"], engine="regex")
+
+        with self.assertRaises(TypeError):
+            next(LineFilter(["роза"])(123))
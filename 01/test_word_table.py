@@ -0,0 +1,78 @@
+import unittest
+
+from .word_table import WordTable
+
+
+class TestWordTable(unittest.TestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    def test_match_whole_word(self):
+        """
+        Проверка, что совпадает только целое слово без учета регистра
+        """
+        matcher = WordTable(["роза"], [])
+
+        self.assertTrue(matcher.match("а Роза упала на лапу Азора"))
+        self.assertTrue(matcher.match("РОЗА"))
+        self.assertFalse(matcher.match("розан и роз"))
+        self.assertFalse(matcher.match("мимоза"))
+
+    def test_stop_words(self):
+        """
+        Проверка, что стоп-слово отбрасывает строку с совпадением
+        """
+        matcher = WordTable(["роза"], ["азора"])
+
+        self.assertFalse(matcher.match("а Роза упала на лапу Азора"))
+        self.assertTrue(matcher.match("роза азор"))
+        self.assertFalse(matcher.match("азора"))
+
+    def test_words_are_not_substrings(self):
+        """
+        Проверка, что слово внутри другого слова не совпадает
+        """
+        matcher = WordTable(["he", "she", "hers"], ["his"])
+
+        self.assertTrue(matcher.match("she sells"))
+        self.assertTrue(matcher.match("ushers hers"))
+        self.assertFalse(matcher.match("ushers"))
+        self.assertFalse(matcher.match("he his"))
+
+    def test_words_with_spaces_ignored(self):
+        """
+        Проверка, что слова с пробелами не совпадают с частью строки
+        """
+        matcher = WordTable(["a роза", ""], ["роза упала"])
+
+        self.assertFalse(matcher.match("a роза"))
+        self.assertFalse(matcher.has_stop_words)
+
+    def test_iter_matches(self):
+        """
+        Проверка, что возвращаются все совпадения целых слов в порядке слов
+        """
+        matcher = WordTable(["роза", "лапу"], ["азора"])
+
+        self.assertEqual(
+            list(matcher.iter_matches("а Роза упала на\tлапу Азора роза\n")),
+            [("роза", False), ("лапу", False), ("азора", True),
+             ("роза", False)],
+        )
+
+    def test_word_in_search_and_stop_words(self):
+        """
+        Проверка, что слово из обоих списков считается стоп-словом
+        """
+        matcher = WordTable(["роза", "лапу"], ["Роза"])
+
+        self.assertFalse(matcher.match("роза"))
+        self.assertFalse(matcher.match("лапу роза"))
+        self.assertTrue(matcher.match("лапу розан"))
+        self.assertEqual(
+            list(matcher.iter_matches("лапу роза")),
+            [("лапу", False), ("роза", True)],
+        )
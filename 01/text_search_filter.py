@@ -1,41 +1,683 @@
-from typing import Generator
-from io import TextIOWrapper
+import gzip
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, ContextManager, Generator, Iterable
+from io import StringIO, TextIOBase, TextIOWrapper
 
+from .bloom_filter import BloomFilter
+from .compressed import (
+    COMPRESSED_FILES,
+    detect_compression,
+    filter_gzip_members,
+    gzip_member_chunks,
+    open_text,
+)
+from .filter_stats import BYTES_READ_INTERVAL, FilterStats
+from .mmap_filter import mmap_line_filter
+from .word_table import WordTable
 
-def _should_yield(line: str, search_words: set, stop_words: set) -> bool:
+ENGINES = ("set", "word_table")
+CHUNK_SIZE = 64 * 1024 * 1024
+
+_worker_matcher: Callable[[str], bool] | None = None
+_worker_stats: FilterStats | None = None
+
+
+def _should_yield(
+    line: str, search_words: set, stop_words: set | BloomFilter
+) -> bool:
     """
     Проверяет, следует ли возвращать строку
     на основе слов поиска и стоп-слов.
     """
     words = set(line.strip().lower().split())
-    return bool(words & search_words) and not bool(words & stop_words)
+    return bool(words & search_words) and stop_words.isdisjoint(words)
+
+
+def _count_set(
+    line: str,
+    search_words: set,
+    stop_words: set | BloomFilter,
+    stats: FilterStats,
+) -> bool:
+    """
+    Проверка строки движком "set" с учетом статистики. Стоп-слова
+    проверяются только в строках со словом поиска.
+    """
+    words = set(line.lower().split())
+    hits = words & search_words
+    return stats.record(hits, bool(hits) and not stop_words.isdisjoint(words))
+
+
+def _match_word_table(
+    line: str, table: WordTable, stop_words: BloomFilter
+) -> bool:
+    """
+    Проверка строки таблицей слов поиска и стоп-словами из файла.
+    """
+    return table.match(line) and stop_words.isdisjoint(
+        line.lower().split()
+    )
+
+
+def _count_word_table(
+    line: str,
+    table: WordTable,
+    search_words: set,
+    stats: FilterStats,
+    stop_words: BloomFilter | None = None,
+) -> bool:
+    """
+    Проверка строки движком "word_table" с учетом статистики.
+    Стоп-слова из файла (stop_words) проверяются по словам строки.
+    """
+    hits = set()
+    stopped = False
+    for word, is_stop in table.iter_matches(line):
+        stopped = stopped or is_stop
+        if word in search_words:
+            hits.add(word)
+    if hits and stop_words is not None:
+        stopped = not stop_words.isdisjoint(line.lower().split())
+    return stats.record(hits, stopped)
+
+
+def _build_matcher(
+    search_words: set,
+    stop_words: set | BloomFilter,
+    engine: str,
+    stats: FilterStats | None = None,
+    table: WordTable | None = None,
+) -> Callable[[str], bool]:
+    """
+    Создает функцию проверки строки для выбранного движка поиска.
+    Если передана статистика, функция также обновляет ее счетчики.
+    Уже построенную таблицу слов можно передать в table.
+
+    Стоп-слова из BloomFilter не входят в таблицу слов
+    и проверяются по словам строки, совпавшей со словами поиска.
+    """
+    if engine == "word_table":
+        stop_filter = (
+            stop_words if isinstance(stop_words, BloomFilter) else None
+        )
+        if table is None:
+            table = WordTable(
+                search_words, set() if stop_filter is not None else stop_words
+            )
+        if stats is None:
+            if stop_filter is None:
+                return table.match
+            return partial(
+                _match_word_table, table=table, stop_words=stop_filter
+            )
+        return partial(
+            _count_word_table,
+            table=table,
+            search_words=search_words,
+            stats=stats,
+            stop_words=stop_filter,
+        )
+    if stats is None:
+        return partial(
+            _should_yield, search_words=search_words, stop_words=stop_words
+        )
+    return partial(
+        _count_set,
+        search_words=search_words,
+        stop_words=stop_words,
+        stats=stats,
+    )
+
+
+def _chunk_offsets(path: str, chunk_count: int) -> list[tuple[int, int]]:
+    """
+    Разбивает файл на диапазоны байт [start, end), границы которых
+    выровнены по концу строки.
+    """
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, "rb") as f:
+        for index in range(1, chunk_count):
+            position = max(size * index // chunk_count, offsets[-1])
+            if position >= size:
+                break
+            f.seek(position)
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            if position > offsets[-1]:
+                offsets.append(position)
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def _init_worker(
+    search_words: set,
+    stop_words: set | BloomFilter,
+    engine: str,
+    collect_stats: bool,
+) -> None:
+    """Собирает функцию проверки строки один раз на процесс пула."""
+    global _worker_matcher, _worker_stats  # pylint: disable=global-statement
+    _worker_stats = FilterStats() if collect_stats else None
+    _worker_matcher = _build_matcher(
+        search_words, stop_words, engine, _worker_stats
+    )
+
+
+def _take_worker_stats() -> FilterStats | None:
+    """Возвращает статистику процесса пула за диапазон и обнуляет ее."""
+    if _worker_stats is None:
+        return None
+    stats = FilterStats()
+    stats.merge(_worker_stats)
+    _worker_stats.reset()
+    return stats
+
+
+def _submit_chunks(
+    executor: ProcessPoolExecutor,
+    func: Callable,
+    path: str,
+    chunks: Iterable[tuple[int, int]],
+    workers: int,
+) -> Generator[Future, None, None]:
+    """
+    Отправляет диапазоны в пул по мере чтения результатов: одновременно
+    в работе не больше 2 * workers диапазонов, поэтому результаты
+    не накапливаются, если потребитель медленнее пула.
+    """
+    pending: deque[Future] = deque()
+    for start, end in chunks:
+        pending.append(executor.submit(func, path, start, end))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+
+def _filter_chunk(
+    path: str, start: int, end: int
+) -> tuple[list[str], FilterStats | None]:
+    """Фильтрует строки из диапазона байт [start, end) файла."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    if _worker_stats is not None:
+        _worker_stats.bytes_read += end - start
+    lines = [
+        line.strip()
+        for line in StringIO(text, newline=None)
+        if _worker_matcher(line)
+    ]
+    return lines, _take_worker_stats()
+
+
+def _parallel_filter(  # pylint: disable=too-many-arguments
+    path: str,
+    search_words: set,
+    stop_words: set | BloomFilter,
+    engine: str,
+    workers: int,
+    *,
+    stats: FilterStats | None = None,
+) -> Generator[str, None, None]:
+    """
+    Фильтрует файл по частям в пуле процессов, возвращая строки
+    в исходном порядке.
+    """
+    chunk_count = max(workers, -(-os.path.getsize(path) // CHUNK_SIZE))
+    chunks = _chunk_offsets(path, chunk_count)
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(search_words, stop_words, engine, stats is not None),
+    )
+    try:
+        for future in _submit_chunks(
+            executor, _filter_chunk, path, chunks, workers
+        ):
+            lines, chunk_stats = future.result()
+            if chunk_stats is not None:
+                stats.merge(chunk_stats)
+            yield from lines
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
-def line_filter(
-    file_filter: str | TextIOWrapper,
+def _filter_gzip_chunk(
+    path: str, start: int, end: int
+) -> tuple[tuple[bytes | None, list[str], bytes, int] | None, FilterStats]:
+    """Фильтрует строки членов gzip из диапазона байт [start, end)."""
+    if _worker_stats is not None:
+        _worker_stats.reset()
+    result = filter_gzip_members(
+        path, start, end, _worker_matcher, stats=_worker_stats
+    )
+    return result, _take_worker_stats()
+
+
+def _parallel_gzip_filter(  # pylint: disable=too-many-arguments
+    path: str,
+    search_words: set,
+    stop_words: set | BloomFilter,
+    engine: str,
+    workers: int,
+    *,
+    stats: FilterStats | None = None,
+) -> Generator[str, None, None]:
+    """
+    Распаковывает и фильтрует члены многочленного gzip-файла в пуле
+    процессов, возвращая строки в исходном порядке.
+
+    Диапазон, начало которого оказалось не границей члена, отбрасывается
+    и распаковывается в текущем процессе с реальной границы, найденной
+    предыдущим диапазоном. Строки, разорванные между диапазонами,
+    склеиваются здесь же.
+    """
+    chunk_count = max(workers, -(-os.path.getsize(path) // CHUNK_SIZE))
+    chunks = gzip_member_chunks(path, chunk_count)
+    matcher = _build_matcher(search_words, stop_words, engine, stats)
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(search_words, stop_words, engine, stats is not None),
+    )
+    try:
+        futures = _submit_chunks(
+            executor, _filter_gzip_chunk, path, chunks, workers
+        )
+        yield from _merge_gzip_chunks(path, chunks, futures, matcher, stats)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _merge_gzip_chunks(
+    path: str,
+    chunks: list[tuple[int, int]],
+    futures: Iterable[Future],
+    matcher: Callable[[str], bool],
+    stats: FilterStats | None,
+) -> Generator[str, None, None]:
+    """
+    Собирает результаты диапазонов gzip по порядку, проверяя, что каждый
+    диапазон начинается с реальной границы члена.
+    """
+    carry = b""
+    position = 0
+    for (start, end), future in zip(chunks, futures):
+        if position >= end:
+            # Диапазон целиком внутри члена, распакованного ранее
+            future.cancel()
+            continue
+        if position == start:
+            result, chunk_stats = future.result()
+            if chunk_stats is not None:
+                stats.merge(chunk_stats)
+        else:
+            result = filter_gzip_members(
+                path, position, end, matcher, stats=stats
+            )
+        if result is None:
+            raise gzip.BadGzipFile(
+                f"Некорректный член gzip по смещению {position}"
+            )
+
+        head, lines, tail, position = result
+        if head is None:
+            carry += tail
+            continue
+        yield from _filter_raw_lines(carry + head, matcher, stats)
+        yield from lines
+        carry = tail
+    yield from _filter_raw_lines(carry, matcher, stats)
+
+
+def _filter_raw_lines(
+    data: bytes, matcher: Callable[[str], bool], stats: FilterStats | None
+) -> Generator[str, None, None]:
+    """Декодирует блок строк и проверяет их так же, как текстовый режим."""
+    if stats is not None:
+        stats.bytes_read += len(data)
+    for line in StringIO(data.decode("utf-8"), newline=None):
+        if matcher(line):
+            yield line.strip()
+
+
+def _filter_text_with_stats(
+    f: TextIOBase, matcher: Callable[[str], bool], stats: FilterStats
+) -> Generator[str, None, None]:
+    """
+    Фильтрует строки текстового файла, обновляя bytes_read по позиции
+    буфера байт раз в BYTES_READ_INTERVAL строк и в конце чтения, чтобы
+    не кодировать строки заново. Для текстовых объектов без буфера байт
+    (например, StringIO) размер каждой строки считается кодированием
+    в UTF-8.
+    """
+    try:
+        buffer = f.buffer
+        position = buffer.tell()
+    except (AttributeError, OSError):
+        for line in f:
+            stats.bytes_read += len(line.encode("utf-8"))
+            if matcher(line):
+                yield line.strip()
+        return
+
+    try:
+        for number, line in enumerate(f, start=1):
+            if number % BYTES_READ_INTERVAL == 0:
+                current = buffer.tell()
+                stats.bytes_read += current - position
+                position = current
+            if matcher(line):
+                yield line.strip()
+    finally:
+        stats.bytes_read += buffer.tell() - position
+
+
+def _validate_words(search_words: list[str], stop_words: list[str]) -> None:
+    """
+    Проверяет, что слова поиска и стоп-слова являются списками строк.
+    """
+    if not isinstance(search_words, list) or not all(
+        isinstance(word, str) for word in search_words
+    ):
+        raise TypeError(
+            "search_words должен быть списком со строковыми объектами"
+        )
+
+    if not isinstance(stop_words, list) or not all(
+        isinstance(word, str) for word in stop_words
+    ):
+        raise TypeError(
+            "stop_words должен быть списком со строковыми объектами "
+            "или быть None"
+        )
+
+
+def _validate_read_mode(
+    file_filter: str | TextIOBase, workers: int | None, use_mmap: bool
+) -> None:
+    """
+    Проверяет, что режим чтения файла совместим с переданным файлом.
+    """
+    if workers is not None:
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise TypeError(
+                f"Получено {type(workers).__name__}, "
+                "workers должен быть числом (int) или быть None"
+            )
+        if workers < 1:
+            raise ValueError(
+                f"Получено {workers=}, workers должно быть больше нуля (> 0)"
+            )
+        if not isinstance(file_filter, str):
+            raise ValueError(
+                "workers поддерживается только для имени файла (str)"
+            )
+
+    if use_mmap:
+        if not isinstance(file_filter, str):
+            raise ValueError(
+                "use_mmap поддерживается только для имени файла (str)"
+            )
+        if workers is not None:
+            raise ValueError("use_mmap не совместим с workers")
+
+
+def _validate_compression(
+    compression: str | None, workers: int | None, use_mmap: bool
+) -> None:
+    """
+    Проверяет, что режим чтения поддерживается для формата сжатия.
+    """
+    if use_mmap and compression is not None:
+        raise ValueError("use_mmap не поддерживается для сжатых файлов")
+    if workers is not None and compression not in (None, "gzip"):
+        raise ValueError(
+            f"workers не поддерживается для сжатия {compression}, "
+            "только для gzip"
+        )
+
+
+def _open_text(
+    file_filter: str | TextIOBase,
+) -> TextIOBase | ContextManager[TextIOBase]:
+    """
+    Открывает файл в текстовом режиме, распаковывая сжатые файлы на лету.
+    """
+    if isinstance(file_filter, COMPRESSED_FILES):
+        return TextIOWrapper(file_filter, encoding="utf-8")
+    if isinstance(file_filter, str):
+        return open_text(file_filter)
+    return file_filter
+
+
+class LineFilter:
+    """
+    Скомпилированный фильтр строк для многократного использования.
+
+    Списки слов проверяются и приводятся к нижнему регистру один раз при
+    создании, для движка "word_table" один раз строится таблица. Вызов
+    объекта фильтрует файл (как ``line_filter``), метод match проверяет
+    одну строку, поэтому на каждый файл или буфер остаются только
+    затраты на чтение.
+
+    Параметры:
+    ----------
+    search_words : List[str]
+        Список слов для поиска.
+    stop_words : Union[List[str], BloomFilter], optional
+        Список стоп-слов или BloomFilter, как в ``line_filter``.
+        По умолчанию None.
+    engine : str, optional
+        Движок поиска слов в строке, как в ``line_filter``.
+    """
+
+    def __init__(
+        self,
+        search_words: list[str],
+        stop_words: list[str] | BloomFilter | None = None,
+        *,
+        engine: str = "set",
+    ):
+        stop_words = stop_words if stop_words is not None else []
+        if isinstance(stop_words, BloomFilter):
+            _validate_words(search_words, [])
+        else:
+            _validate_words(search_words, stop_words)
+            stop_words = set(word.lower() for word in stop_words)
+
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Получено {engine=}, engine должен быть одним из {ENGINES}"
+            )
+
+        self.search_words = set(word.lower() for word in search_words)
+        self.stop_words = stop_words
+        self.engine = engine
+        self._table = (
+            WordTable(
+                self.search_words,
+                set() if isinstance(stop_words, BloomFilter) else stop_words,
+            )
+            if engine == "word_table"
+            else None
+        )
+        self._matcher = self._build_matcher()
+
+    def _build_matcher(
+        self, stats: FilterStats | None = None
+    ) -> Callable[[str], bool]:
+        """Функция проверки строки на скомпилированных словах."""
+        return _build_matcher(
+            self.search_words,
+            self.stop_words,
+            self.engine,
+            stats,
+            table=self._table,
+        )
+
+    def _filter_text(
+        self,
+        file_filter: str | TextIOBase | gzip.GzipFile,
+        stats: FilterStats | None,
+    ) -> Generator[str, None, None]:
+        """Фильтрация файла, прочитанного в текстовом режиме."""
+        matcher = self._build_matcher(stats)
+        with _open_text(file_filter) as f:
+            if stats is not None:
+                yield from _filter_text_with_stats(f, matcher, stats)
+                return
+            for line in f:
+                if matcher(line):
+                    yield line.strip()
+
+    def match(self, line: str) -> bool:
+        """
+        Проверяет, содержит ли строка слово поиска и не содержит стоп-слов.
+        """
+        return self._matcher(line)
+
+    def __call__(
+        self,
+        file_filter: str | TextIOBase | gzip.GzipFile,
+        *,
+        workers: int | None = None,
+        use_mmap: bool = False,
+        stats: FilterStats | None = None,
+    ) -> Generator[str, None, None]:
+        """
+        Генератор строк файла, прошедших фильтр. Параметры чтения
+        такие же, как у ``line_filter``.
+        """
+        if not isinstance(file_filter, (str, TextIOBase) + COMPRESSED_FILES):
+            raise TypeError(
+                f"Получено {type(file_filter).__name__}, "
+                "file должен быть str, текстовым объектом (TextIOBase) "
+                "или сжатым файлом (GzipFile, BZ2File, LZMAFile)"
+            )
+
+        if stats is not None and not isinstance(stats, FilterStats):
+            raise TypeError(
+                f"Получено {type(stats).__name__}, "
+                "stats должен быть FilterStats или быть None"
+            )
+
+        _validate_read_mode(file_filter, workers, use_mmap)
+        if use_mmap and stats is not None:
+            raise ValueError("stats не совместим с use_mmap")
+
+        # Текстовый режим определяет сжатие при открытии файла и читает
+        # его один раз; workers и use_mmap работают с обычными файлами
+        compression = (
+            detect_compression(file_filter)
+            if isinstance(file_filter, str)
+            and (workers is not None or use_mmap)
+            else None
+        )
+        _validate_compression(compression, workers, use_mmap)
+
+        if stats is not None:
+            stats.start()
+        try:
+            if workers is not None:
+                yield from (
+                    _parallel_gzip_filter if compression else _parallel_filter
+                )(
+                    file_filter,
+                    self.search_words,
+                    self.stop_words,
+                    self.engine,
+                    workers,
+                    stats=stats,
+                )
+            elif use_mmap:
+                yield from mmap_line_filter(
+                    file_filter, self.search_words, self._matcher
+                )
+            else:
+                yield from self._filter_text(file_filter, stats)
+        finally:
+            if stats is not None:
+                stats.finish()
+
+
+def line_filter(  # pylint: disable=too-many-arguments
+    file_filter: str | TextIOBase | gzip.GzipFile,
     search_words: list[str],
-    stop_words: list[str] | None = None,
+    stop_words: list[str] | BloomFilter | None = None,
+    *,
+    engine: str = "set",
+    workers: int | None = None,
+    use_mmap: bool = False,
+    stats: FilterStats | None = None,
 ) -> Generator[str, None, None]:
     """
     Генератор, который читает строки из файла и фильтрует
     их по заданным критериям.
 
+    Для многократной фильтрации одними и теми же словами удобнее
+    создать ``LineFilter`` один раз и вызывать его для каждого файла.
+
     Функция возвращает строки, содержащие хотя бы одно из слов для поиска,
     исключая те строки, которые содержат слова из списка стоп-слов.
     Поиск слов осуществляется по полному совпадению без учета регистра.
 
     Параметры:
     ----------
-    file : Union[str, io.TextIOBase]
+    file : Union[str, io.TextIOBase, gzip.GzipFile]
         Имя файла или объект файла, из которого будет производиться
-        чтение строк.
+        чтение строк. Файлы gzip, bz2, xz и zstd (при установленном
+        пакете zstandard) определяются по сигнатуре и распаковываются
+        потоково; также принимаются открытые GzipFile, BZ2File
+        и LZMAFile. Без workers и use_mmap файл открывается один раз,
+        поэтому можно передать FIFO или /dev/stdin.
     search_words : List[str]
         Список слов для поиска, строки из файла будут возвращены,
         если содержат хотя бы одно из этих слов.
-    stop_words : List[str], optional
+    stop_words : Union[List[str], BloomFilter], optional
         Список стоп-слов. Если строка содержит хотя бы одно из этих слов,
         она будет проигнорирована. По умолчанию None, что означает отсутствие
-        стоп-слов.
+        стоп-слов. Для очень больших списков можно передать BloomFilter:
+        стоп-слова читаются из файла, отображаемого в память, и не
+        копируются в каждый процесс пула.
+    engine : str, optional
+        Движок поиска слов в строке: "set" (по умолчанию) разбивает
+        каждую строку на множество слов, "word_table" один раз
+        компилирует таблицу слов поиска и стоп-слов и проверяет слова
+        строки по ней без создания множества слов, останавливаясь
+        на первом совпадении (быстрее "set" на больших списках слов,
+        см. benchmark_line_filter.py).
+    workers : int, optional
+        Количество процессов для параллельной фильтрации. Файл разбивается
+        на диапазоны байт по границам строк, каждый диапазон фильтруется
+        в пуле процессов, а строки возвращаются в исходном порядке.
+        Одновременно в работе не больше 2 * workers диапазонов, поэтому
+        память не растет, если строки читаются медленнее, чем фильтруются.
+        Для многочленного gzip-файла (например, после pigz или cat
+        нескольких .gz) параллельно распаковываются члены gzip.
+        Поддерживается только для имени файла. По умолчанию None -
+        чтение в текущем процессе.
+    use_mmap : bool, optional
+        Отобразить файл в память и искать слова поиска прямо в байтах,
+        декодируя только строки-кандидаты. Ускоряет поиск небольшого
+        числа слов (не больше MMAP_MAX_WORDS) с малым числом совпадений;
+        при большем числе слов проверяются все строки, как без use_mmap.
+        Поддерживается только для имени несжатого файла и не совместимо
+        с workers. По умолчанию False.
+    stats : FilterStats, optional
+        Объект статистики: количество прочитанных строк и байт,
+        совпадений, отброшенных стоп-словами строк, время работы
+        и число совпадений по каждому слову поиска. Обновляется во время
+        работы генератора. Не совместим с use_mmap. По умолчанию None.
 
     Возвращает:
     ----------
@@ -46,40 +688,83 @@ def line_filter(
     -----------
     TypeError
         Если аргументы не соответствуют ожидаемым типам.
+    ValueError
+        Если передан неизвестный движок поиска, некорректное
+        количество процессов или несовместимый режим чтения.
+    """
+    yield from LineFilter(search_words, stop_words, engine=engine)(
+        file_filter, workers=workers, use_mmap=use_mmap, stats=stats
+    )
+
+
+def multi_line_filter(
+    file_filter: str | TextIOBase | gzip.GzipFile,
+    rules: dict[str, tuple[list[str], list[str] | None]],
+) -> Generator[tuple[str, str], None, None]:
     """
-    stop_words = stop_words if stop_words is not None else []
+    Генератор, который фильтрует строки файла сразу по нескольким
+    независимым наборам правил за один проход.
+
+    Каждая строка разбивается на слова один раз, после чего слова
+    направляются ко всем правилам, в которых они встречаются. Семантика
+    каждого правила совпадает с ``line_filter``.
+
+    Параметры:
+    ----------
+    file : Union[str, io.TextIOBase, gzip.GzipFile]
+        Имя файла или объект файла, из которого будет производиться
+        чтение строк. Сжатые файлы распаковываются, как в ``line_filter``.
+    rules : Dict[str, Tuple[List[str], List[str] | None]]
+        Словарь идентификатор правила -> (search_words, stop_words).
 
-    if not isinstance(file_filter, (str, TextIOWrapper)):
+    Возвращает:
+    ----------
+    Generator[Tuple[str, str], None, None]
+        Генератор пар (идентификатор правила, строка). Для одной строки
+        пары возвращаются в порядке правил в словаре.
+
+    Исключения:
+    -----------
+    TypeError
+        Если аргументы не соответствуют ожидаемым типам.
+    """
+    if not isinstance(file_filter, (str, TextIOBase) + COMPRESSED_FILES):
         raise TypeError(
             f"Получено {type(file_filter).__name__}, "
-            "file должен быть str или тестовым объектом (TextIOWrapper)"
+            "file должен быть str, текстовым объектом (TextIOBase) "
+            "или сжатым файлом (GzipFile, BZ2File, LZMAFile)"
         )
 
-    if not isinstance(search_words, list) or not all(
-        isinstance(word, str) for word in search_words
+    if not isinstance(rules, dict) or not all(
+        isinstance(rule, (tuple, list)) and len(rule) == 2
+        for rule in rules.values()
     ):
         raise TypeError(
-            "search_words должен быть списком со строковыми объектами"
+            "rules должен быть словарем вида "
+            "{rule_id: (search_words, stop_words)}"
         )
 
-    if not isinstance(stop_words, list) or not all(
-        isinstance(word, str) for word in stop_words
-    ):
-        raise TypeError(
-            "stop_words должен быть списком со строковыми объектами "
-            "или быть None"
-        )
+    rule_ids = list(rules)
+    # слово -> список (номер правила, является ли слово стоп-словом)
+    routes: dict[str, list[tuple[int, bool]]] = {}
+    for number, (search_words, stop_words) in enumerate(rules.values()):
+        stop_words = stop_words if stop_words is not None else []
+        _validate_words(search_words, stop_words)
 
-    search_words = set(word.lower() for word in search_words)
-    stop_words = (
-        set(word.lower() for word in stop_words) if stop_words else set()
-    )
+        stop_words = set(word.lower() for word in stop_words)
+        for word in stop_words:
+            routes.setdefault(word, []).append((number, True))
+        for word in set(word.lower() for word in search_words) - stop_words:
+            routes.setdefault(word, []).append((number, False))
 
-    with (
-        open(file_filter, "r", encoding="utf-8")
-        if isinstance(file_filter, str)
-        else file_filter
-    ) as f:
+    with _open_text(file_filter) as f:
         for line in f:
-            if _should_yield(line, search_words, stop_words):
-                yield line.strip()
+            matched = set()
+            stopped = set()
+            for word in set(line.lower().split()):
+                for number, is_stop in routes.get(word, ()):
+                    (stopped if is_stop else matched).add(number)
+            if matched - stopped:
+                stripped = line.strip()
+                for number in sorted(matched - stopped):
+                    yield rule_ids[number], stripped
@@ -0,0 +1,59 @@
+from typing import Generator, Iterable
+
+
+class WordTable:
+    """
+    Скомпилированная таблица слов поиска и стоп-слов для проверки строки.
+
+    Совпадение засчитывается только для целого слова: слева и справа
+    от него должно быть начало/конец строки или пробельный символ
+    (та же семантика, что и у ``str.split()``). Регистр не учитывается.
+    Таблица слово -> является ли оно стоп-словом строится один раз,
+    а строка разбивается ``split()`` на список слов, который проверяется
+    по таблице на уровне C (``frozenset.isdisjoint``) без создания
+    множества слов строки и с выходом на первом совпадении.
+    """
+
+    def __init__(self, search_words: Iterable[str], stop_words: Iterable[str]):
+        search_words = set(word.lower() for word in search_words)
+        stop_words = set(word.lower() for word in stop_words)
+
+        # Слова с пробелами никогда не совпадут с целым словом строки
+        self._words: dict[str, bool] = {
+            word: word in stop_words
+            for word in search_words | stop_words
+            if word and not any(char.isspace() for char in word)
+        }
+        self._search_words = frozenset(
+            word for word, is_stop in self._words.items() if not is_stop
+        )
+        self._stop_words = frozenset(
+            word for word, is_stop in self._words.items() if is_stop
+        )
+        self.has_stop_words = bool(self._stop_words)
+
+    def iter_matches(
+        self, line: str
+    ) -> Generator[tuple[str, bool], None, None]:
+        """
+        Генератор совпадений целых слов в строке.
+
+        Возвращает пары (слово, является ли оно стоп-словом) в порядке
+        слов в строке, повторяющееся слово возвращается каждый раз.
+        """
+        words = self._words
+        for word in line.lower().split():
+            is_stop = words.get(word)
+            if is_stop is not None:
+                yield word, is_stop
+
+    def match(self, line: str) -> bool:
+        """
+        Проверяет, содержит ли строка слово поиска и не содержит стоп-слов.
+
+        Стоп-слова проверяются только в строках со словом поиска.
+        """
+        words = line.lower().split()
+        if self._search_words.isdisjoint(words):
+            return False
+        return not self.has_stop_words or self._stop_words.isdisjoint(words)
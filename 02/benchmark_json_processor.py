@@ -0,0 +1,71 @@
+import json
+import timeit
+
+from .json_processor import PARSERS, custom_json, process_json
+
+# Документы из тестов process_json
+TEST_DOCUMENTS = [
+    '{"key1": "Word1 word2", "key2": "word3 word4"}',
+    '{"key1": "word1 Word2 word1", "key2": "WORD2 wOrD4 word3"}',
+    '{"key1": "hello world hello", "key2": "HELLO world HelLO"}',
+    '{"key1": "Apple banana", "key2": "BaNaNa APPLE"}',
+    '{"key1": "token1 TokEN2 token3", "key2": "ToKeN3 TOKEN1"}',
+    '{"key1": "word1 word1st", "key2": "word2 dsfword2"}',
+    '{"key1": "word1 word2", "key2": "wordword4"}',
+]
+TOKENS = ["word1", "WORD2", "hello", "banana", "token3"]
+
+
+def generate_large_document(keys=10_000):
+    """Большой документ из значений тестовых документов."""
+    values = [
+        value
+        for document in TEST_DOCUMENTS
+        for value in json.loads(document).values()
+    ]
+    return json.dumps(
+        {f"key{number}": values[number % len(values)] for number in range(keys)}
+    )
+
+
+def run(documents, parser):
+    """Обработка всех документов выбранным парсером."""
+    matches = []
+    for document in documents:
+        process_json(
+            document,
+            tokens=TOKENS,
+            batch_callback=matches.extend,
+            parser=parser,
+        )
+    return matches
+
+
+def main():
+    number_iteration = 100
+    datasets = {
+        "test documents": TEST_DOCUMENTS * 100,
+        "large document": [generate_large_document()],
+    }
+    parsers = [
+        parser
+        for parser in PARSERS
+        if parser != "custom_json" or custom_json is not None
+    ]
+
+    for name, documents in datasets.items():
+        expected = run(documents, "json")
+        print(f"\n{name} ({number_iteration} iterations):")
+        for parser in parsers:
+            assert run(documents, parser) == expected
+            seconds = timeit.timeit(
+                lambda documents=documents, parser=parser: run(
+                    documents, parser
+                ),
+                number=number_iteration,
+            )
+            print(f"{parser:>12}: {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
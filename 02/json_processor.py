@@ -1,39 +1,144 @@
 import json
-from typing import Callable
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import TextIOBase
+from typing import Callable, Iterable, Iterator
 
+try:
+    import custom_json
+except ImportError:  # pragma: no cover
+    custom_json = None
 
-def _process_words(
-    key: str, words: list[str], callback: Callable[[str, str], None] | None
-):
-    """Обработка слов без токенов"""
-    for word in words:
-        callback(key, word)
+from .key_selector import KeySelector, is_selector
 
+BatchCallback = Callable[[list[tuple[str, str]]], None]
+Loads = Callable[[str], dict]
+PARSERS = ("json", "custom_json")
+# Количество частей документа на один процесс пула
+SHARDS_PER_WORKER = 4
 
-def _process_tokens(
-    key: str,
-    lower_words: list[str],
-    lower_tokens: list[str],
-    tokens: list[str],
-    callback: Callable[[str, str], None] | None = None,
-):
-    """Обработка слов с токенами"""
-    for token in lower_words:
-        if token in lower_tokens:
-            callback(key, tokens[lower_tokens.index(token)])
+_worker_token_map: dict[str, str] | None = None
 
 
-def process_json(
-    json_str: str,
-    required_keys: list[str] | None = None,
-    tokens: list[str] | None = None,
-    callback: Callable[[str, str], None] | None = None,
-) -> None:
+def _key_matches(
+    key: str, value: str, token_map: dict[str, str]
+) -> list[tuple[str, str]]:
+    """
+    Пары (ключ, слово) для значения: все слова или найденные токены.
+
+    Для поиска токенов значение приводится к нижнему регистру целиком
+    один раз: в обработчик передается исходный токен, поэтому слова
+    в исходном регистре не создаются.
+    """
+    if not token_map:
+        return [(key, word) for word in value.split()]
+    return [
+        (key, token)
+        for token in map(token_map.get, value.lower().split())
+        if token is not None
+    ]
+
+
+def _init_worker(token_map: dict[str, str]) -> None:
+    """Сохраняет таблицу токенов один раз на процесс пула"""
+    global _worker_token_map  # pylint: disable=global-statement
+    _worker_token_map = token_map
+
+
+def _match_shard(items: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Совпадения для части пар (ключ, значение) в процессе пула"""
+    matches = []
+    for key, value in items:
+        matches.extend(_key_matches(key, value, _worker_token_map))
+    return matches
+
+
+def _parallel_matches(
+    items: list[tuple[str, str]], token_map: dict[str, str], workers: int
+) -> Iterator[list[tuple[str, str]]]:
+    """
+    Делит пары документа на части и ищет совпадения в пуле процессов.
+    Результаты возвращаются в порядке ключей документа.
+    """
+    shard_size = max(math.ceil(len(items) / (workers * SHARDS_PER_WORKER)), 1)
+    shards = [
+        items[start:start + shard_size]
+        for start in range(0, len(items), shard_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(token_map,),
+    ) as executor:
+        yield from executor.map(_match_shard, shards)
+
+
+def _with_fallback(loads: Loads, json_str: str) -> dict:
+    """
+    Разбор быстрым парсером; если он отклонил строку или вернул
+    не словарь, строка разбирается стандартным json.loads.
+    """
     try:
-        data = json.loads(json_str)
-    except Exception as error:
-        raise error
+        data = loads(json_str)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return json.loads(json_str)
+    return data if isinstance(data, dict) else json.loads(json_str)
+
 
+def _resolve_parser(parser: str | Loads) -> Loads:
+    """Функция разбора JSON для имени парсера или вызываемого объекта"""
+    if callable(parser):
+        return partial(_with_fallback, parser)
+    if not isinstance(parser, str):
+        raise TypeError(
+            f"Получено {type(parser).__name__}, parser должен быть строкой "
+            "или вызываемым объектом"
+        )
+    if parser not in PARSERS:
+        raise ValueError(
+            f"Получено {parser=}, parser должен быть одним из {PARSERS} "
+            "или вызываемым объектом"
+        )
+    if parser == "json":
+        return json.loads
+    if custom_json is None:
+        raise ImportError(
+            "Для parser='custom_json' нужно расширение custom_json"
+        )
+    return partial(
+        _with_fallback, custom_json.loads  # pylint: disable=I1101
+    )
+
+
+def _token_map(tokens: list[str]) -> dict[str, str]:
+    """
+    Словарь токен в нижнем регистре -> исходный токен. Для токенов,
+    совпадающих без учета регистра, используется первый из них.
+    """
+    token_map = {}
+    for token in tokens:
+        token_map.setdefault(token.lower(), token)
+    return token_map
+
+
+def _compile_keys(required_keys: list[str]) -> set[str] | KeySelector:
+    """
+    Множество ключей верхнего уровня или, если среди них есть пути
+    с "$", скомпилированный KeySelector для всех ключей.
+    """
+    if any(is_selector(key) for key in required_keys):
+        return KeySelector(required_keys)
+    return set(required_keys)
+
+
+def _validate_args(
+    required_keys: list[str] | None,
+    tokens: list[str] | None,
+    callback: Callable[[str, str], None] | None,
+    batch_callback: BatchCallback | None = None,
+) -> tuple[list[str], list[str]]:
+    """Проверка аргументов, общих для process_json и process_json_stream"""
     required_keys = required_keys if required_keys is not None else []
     tokens = tokens if tokens is not None else []
 
@@ -58,19 +163,208 @@ def process_json(
             "callback является Callable[[str, str], None] или быть None"
         )
 
-    lower_tokens = [token.lower() for token in tokens] if tokens else []
+    if not callable(batch_callback) and batch_callback is not None:
+        raise TypeError(
+            "batch_callback является "
+            "Callable[[list[tuple[str, str]]], None] или быть None"
+        )
+
+    if callback is not None and batch_callback is not None:
+        raise ValueError("Можно передать только callback или batch_callback")
+
+    return required_keys, tokens
+
+
+def _process_data(  # pylint: disable=too-many-arguments
+    data: dict,
+    required_keys: set[str] | KeySelector,
+    token_map: dict[str, str],
+    callback: Callable[[str, str], None] | None,
+    *,
+    batch_callback: BatchCallback | None = None,
+    workers: int | None = None,
+) -> None:
+    """
+    Обработка разобранного JSON-объекта: callback вызывается для каждого
+    совпадения, batch_callback - один раз со всеми совпадениями объекта.
+    """
+    if callback is None and batch_callback is None:
+        return
+
+    if isinstance(required_keys, KeySelector):
+        items = required_keys.select(data)
+    else:
+        items = (
+            (key, value)
+            for key, value in data.items()
+            if not required_keys or key in required_keys
+        )
+    if workers is None:
+        key_matches = (
+            _key_matches(key, value, token_map) for key, value in items
+        )
+    else:
+        key_matches = _parallel_matches(list(items), token_map, workers)
+
+    matches = []
+    for pairs in key_matches:
+        if batch_callback is not None:
+            matches.extend(pairs)
+        else:
+            for key, word in pairs:
+                callback(key, word)
+
+    if matches:
+        batch_callback(matches)
+
+
+def process_json(  # pylint: disable=too-many-arguments
+    json_str: str,
+    required_keys: list[str] | None = None,
+    tokens: list[str] | None = None,
+    callback: Callable[[str, str], None] | None = None,
+    *,
+    batch_callback: BatchCallback | None = None,
+    workers: int | None = None,
+    parser: str | Loads = "json",
+) -> None:
+    """
+    Вызывает callback(key, token) для каждого найденного токена.
+    Вместо callback можно передать batch_callback: он вызывается один раз
+    со списком всех пар (key, token) документа, если они есть.
+
+    С workers поиск по значениям документа делится на части и выполняется
+    в пуле из workers процессов (таблица токенов передается в каждый
+    процесс один раз), а обработчики вызываются в этом процессе в том же
+    порядке ключей, что и без пула.
 
-    for key, value in data.items():
-        words = value.split()
-        if callback is None:
-            break
+    parser задает разбор JSON: "json" (стандартный json.loads),
+    "custom_json" (C-расширение из 10/custom_json.c) или любая функция,
+    совместимая с json.loads. Если быстрый парсер отклонил документ,
+    он разбирается стандартным json.loads. custom_json сам разбирает
+    только плоские объекты со строками без escape-последовательностей
+    и целыми числами типа long и отклоняет остальные документы (в том
+    числе некорректный JSON), поэтому результат совпадает с json.loads.
+    Для пользовательской функции результат может отличаться от
+    json.loads, если она принимает некорректный JSON.
 
-        if not required_keys or key in required_keys:
-            lower_words = [word.lower() for word in words]
+    В required_keys кроме ключей верхнего уровня можно передать пути
+    во вложенные объекты и массивы: "$.user.name", "$.messages[*].text",
+    "$.items[0]", "$.*.title". Пути компилируются в дерево, документ
+    обходится только по выбранным ветвям, а в обработчик вместо ключа
+    передается путь найденной строки ("messages[1].text"). Если путь
+    выбирает объект или массив, обрабатываются все строки внутри него,
+    остальные значения (числа, null) пропускаются.
+    """
+    loads = _resolve_parser(parser)
+    try:
+        data = loads(json_str)
+    except Exception as error:
+        raise error
 
-            if not tokens:
-                _process_words(key, words, callback)
-            else:
-                _process_tokens(
-                    key, lower_words, lower_tokens, tokens, callback
-                )
+    required_keys, tokens = _validate_args(
+        required_keys, tokens, callback, batch_callback
+    )
+    if workers is not None and (
+        isinstance(workers, bool) or not isinstance(workers, int)
+    ):
+        raise TypeError(
+            f"Получено {type(workers).__name__}, "
+            "workers должен быть целым числом или быть None"
+        )
+    if workers is not None and workers < 1:
+        raise ValueError(f"Получено {workers=}, workers должен быть >= 1")
+
+    _process_data(
+        data,
+        _compile_keys(required_keys),
+        _token_map(tokens),
+        callback,
+        batch_callback=batch_callback,
+        workers=workers,
+    )
+
+
+def _read_lines(
+    source: str | TextIOBase | Iterable[str | bytes],
+) -> Iterator[str | bytes]:
+    """Строки JSON lines из имени файла, файла или итерируемого объекта"""
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as file:
+            yield from file
+    else:
+        yield from source
+
+
+def process_json_stream(  # pylint: disable=too-many-arguments
+    source: str | TextIOBase | Iterable[str | bytes],
+    required_keys: list[str] | None = None,
+    tokens: list[str] | None = None,
+    callback: Callable[[str, str], None] | None = None,
+    *,
+    batch_callback: BatchCallback | None = None,
+    parser: str | Loads = "json",
+) -> int:
+    """
+    Обработка JSON lines: каждая непустая строка источника - отдельный
+    JSON-объект, который обрабатывается так же, как в process_json.
+
+    Аргументы проверяются один раз до чтения, строки читаются и
+    разбираются по одной, поэтому память не зависит от размера
+    источника. Возвращает количество обработанных записей.
+
+    Параметры:
+    ----------
+    source : Union[str, io.TextIOBase, Iterable[Union[str, bytes]]]
+        Имя файла, открытый файл или итерируемый объект строк.
+    required_keys, tokens, callback, batch_callback, parser
+        Как в process_json; пути в required_keys компилируются один
+        раз, batch_callback вызывается один раз для каждой записи,
+        в которой есть совпадения.
+
+    Исключения:
+    -----------
+    TypeError
+        Если аргументы не соответствуют ожидаемым типам или запись
+        не является JSON-объектом.
+    json.JSONDecodeError
+        Если строка не является JSON; в сообщении указан номер строки.
+    """
+    if isinstance(source, (bytes, bytearray)) or not isinstance(
+        source, (str, Iterable)
+    ):
+        raise TypeError(
+            f"Получено {type(source).__name__}, source должен быть "
+            "именем файла, файлом или итерируемым объектом строк"
+        )
+    required_keys, tokens = _validate_args(
+        required_keys, tokens, callback, batch_callback
+    )
+    required_keys = _compile_keys(required_keys)
+    token_map = _token_map(tokens)
+    loads = _resolve_parser(parser)
+
+    records = 0
+    for number, line in enumerate(_read_lines(source), start=1):
+        if not line.strip():
+            continue
+        try:
+            data = loads(line.strip())
+        except json.JSONDecodeError as error:
+            raise json.JSONDecodeError(
+                f"Строка {number}: {error.msg}", error.doc, error.pos
+            ) from error
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"Строка {number}: ожидался JSON-объект, "
+                f"получено {type(data).__name__}"
+            )
+        _process_data(
+            data,
+            required_keys,
+            token_map,
+            callback,
+            batch_callback=batch_callback,
+        )
+        records += 1
+    return records
@@ -0,0 +1,147 @@
+import re
+from typing import Iterator
+
+# Шаг пути: .ключ, .*, [индекс] или [*]
+_STEP = re.compile(r"\.(\*|[^.\[\]]+)|\[(\*|\d+)\]")
+
+
+class _Node:  # pylint: disable=too-few-public-methods
+    """Узел дерева селекторов: переходы по ключам и индексам массивов"""
+
+    __slots__ = ("keys", "any_key", "indexes", "any_index", "terminal")
+
+    def __init__(self):
+        self.keys: dict[str, "_Node"] = {}
+        self.any_key: "_Node | None" = None
+        self.indexes: dict[int, "_Node"] = {}
+        self.any_index: "_Node | None" = None
+        self.terminal = False
+
+
+def is_selector(key: str) -> bool:
+    """Ключ, начинающийся с "$", является путем, а не ключом верхнего уровня"""
+    return key.startswith("$")
+
+
+class KeySelector:  # pylint: disable=too-few-public-methods
+    """
+    Скомпилированный набор путей к значениям во вложенном JSON.
+
+    Путь начинается с "$" и состоит из шагов ".ключ", ".*" (любой ключ
+    объекта), "[N]" (элемент массива) и "[*]" (любой элемент массива),
+    например "$.user.name" или "$.messages[*].text". Строка без "$"
+    выбирает ключ верхнего уровня целиком, как раньше. Если путь
+    указывает на объект или массив, выбираются все строки внутри него.
+
+    Пути компилируются один раз в дерево переходов. При обходе документа
+    спускаемся только в те значения, для которых есть переход, поэтому
+    невыбранные поддеревья не просматриваются.
+
+    Параметры:
+    ----------
+    selectors : list[str]
+        Пути и ключи верхнего уровня.
+
+    Исключения:
+    -----------
+    ValueError
+        Если путь записан некорректно.
+    """
+
+    def __init__(self, selectors: list[str]):
+        self._root = _Node()
+        for selector in selectors:
+            node = self._root
+            for kind, value in self._parse(selector):
+                node = self._step(node, kind, value)
+            node.terminal = True
+
+    @staticmethod
+    def _parse(selector: str) -> list[tuple[str, str]]:
+        """
+        Шаги пути: ("key", имя) или ("index", номер), "*" - любой.
+        Ключ верхнего уровня без "$" - один шаг ("literal", ключ),
+        в котором "*" не является шаблоном.
+        """
+        if not is_selector(selector):
+            return [("literal", selector)]
+
+        steps = []
+        position = 1
+        while position < len(selector):
+            match = _STEP.match(selector, position)
+            if match is None:
+                raise ValueError(
+                    f"Некорректный путь {selector!r}: "
+                    f"ошибка в позиции {position}"
+                )
+            key, index = match.groups()
+            steps.append(("key", key) if key is not None else ("index", index))
+            position = match.end()
+        return steps
+
+    @staticmethod
+    def _step(node: _Node, kind: str, value: str) -> _Node:
+        """Переход из узла по шагу пути, создающий узел при необходимости"""
+        if kind == "literal":
+            return node.keys.setdefault(value, _Node())
+        if kind == "key" and value == "*":
+            node.any_key = node.any_key or _Node()
+            return node.any_key
+        if kind == "key":
+            return node.keys.setdefault(value, _Node())
+        if value == "*":
+            node.any_index = node.any_index or _Node()
+            return node.any_index
+        return node.indexes.setdefault(int(value), _Node())
+
+    def select(self, data) -> Iterator[tuple[str, str]]:
+        """
+        Пары (путь, строка) для выбранных строк документа в порядке
+        документа. Путь записывается как "user.name" или "messages[0].text".
+        """
+        return _select(data, [self._root], "")
+
+
+def _strings(value, path: str) -> Iterator[tuple[str, str]]:
+    """Все строки внутри значения"""
+    if isinstance(value, str):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            yield from _strings(child, f"{path}.{key}" if path else key)
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            yield from _strings(child, f"{path}[{index}]")
+
+
+def _select(value, nodes: list[_Node], path: str) -> Iterator[tuple[str, str]]:
+    """
+    Обход значения, в которое привели узлы nodes. Несколько узлов
+    обрабатываются вместе, поэтому значение, выбранное несколькими
+    путями, возвращается один раз.
+    """
+    if any(node.terminal for node in nodes):
+        yield from _strings(value, path)
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            child_nodes = [
+                next_node
+                for node in nodes
+                for next_node in (node.keys.get(key), node.any_key)
+                if next_node is not None
+            ]
+            if child_nodes:
+                yield from _select(
+                    child, child_nodes, f"{path}.{key}" if path else key
+                )
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            child_nodes = [
+                next_node
+                for node in nodes
+                for next_node in (node.indexes.get(index), node.any_index)
+                if next_node is not None
+            ]
+            if child_nodes:
+                yield from _select(child, child_nodes, f"{path}[{index}]")
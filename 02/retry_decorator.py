@@ -1,10 +1,96 @@
+import asyncio
+import inspect
+import random
+import sys
+import time
 from typing import Type, Any, List
 from functools import wraps
 
 
+def _validate_seconds(name: str, value: float | None, *, zero: bool) -> None:
+    """Проверка неотрицательного (или положительного) числа секунд"""
+    if value is None:
+        return
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise TypeError(
+            f"{name} должен быть числом (int, float) или быть пустым"
+        )
+    if value < 0 or (value == 0 and not zero):
+        raise ValueError(
+            f"{name} должно быть больше нуля (> 0)"
+            if not zero
+            else f"{name} должно быть неотрицательным (>= 0)"
+        )
+
+
+def _backoff_delay(
+    attempt: int, backoff: float, max_delay: float | None
+) -> float:
+    """
+    Экспоненциальная пауза с полным разбросом после попытки attempt.
+
+    Степень двойки считается во float: при большом attempt произведение
+    переполняется в inf (а не в OverflowError, как для int) и затем
+    ограничивается max_delay или наибольшим float.
+    """
+    limit = backoff * 2.0 ** min(attempt, sys.float_info.max_exp - 1)
+    limit = min(
+        limit, max_delay if max_delay is not None else sys.float_info.max
+    )
+    return random.uniform(0, limit) if limit else 0.0
+
+
+def _info_function(func, args, kwargs) -> tuple[str, str, str]:
+    return (
+        f'run "{func.__name__}" with ',
+        f"positional {args=}, " if args else "",
+        f"keyword {kwargs=}, " if kwargs else "",
+    )
+
+
+def _log_result(func, args, kwargs, attempt: int, result: Any) -> None:
+    print(*_info_function(func, args, kwargs),
+          f"attempt = {attempt + 1}, {result=}",
+          sep="")
+
+
+def _log_error(func, args, kwargs, attempt: int, error: Exception) -> None:
+    print(
+        *_info_function(func, args, kwargs),
+        f"attempt = {attempt + 1}, "
+        f"exception = {error.__class__.__name__}, "
+        f"info_exception = {error}",
+        sep="",
+    )
+
+
 def retry_deco(
-    retries: int | None = None, exceptions: List[Type[Exception]] | None = None
+    retries: int | None = None,
+    exceptions: List[Type[Exception]] | None = None,
+    *,
+    backoff: float = 0.0,
+    max_delay: float | None = None,
+    deadline: float | None = None,
 ):
+    """
+    Повторяет вызов функции при исключении до retries раз. Исключения
+    из exceptions не повторяются и сразу пробрасываются дальше.
+
+    Между попытками выдерживается пауза с экспоненциальным ростом и
+    полным разбросом: случайное значение от 0 до
+    min(max_delay, backoff * 2 ** номер_попытки) секунд. С backoff=0
+    (по умолчанию) попытки идут сразу одна за другой. deadline
+    ограничивает общее время в секундах от первой попытки: если
+    следующая пауза выходит за него, последнее исключение пробрасывается
+    без новых попыток.
+
+    Для корутинных функций (async def) декоратор возвращает корутинную
+    функцию, которая ждет пауз через asyncio.sleep и не блокирует цикл
+    событий. Каждая попытка ограничена оставшимся до deadline временем:
+    зависшая попытка отменяется и пробрасывается TimeoutError. Обычную
+    функцию прервать нельзя, поэтому для нее deadline проверяется только
+    между попытками, и одна долгая попытка может выйти за него.
+    """
     if exceptions is None:
         exceptions = []
     if retries is None:
@@ -27,34 +113,71 @@ def retry_deco(
             "или быть пустым"
         )
 
+    _validate_seconds("backoff", backoff, zero=True)
+    _validate_seconds("max_delay", max_delay, zero=False)
+    _validate_seconds("deadline", deadline, zero=False)
+
+    def next_delay(
+        error: Exception, attempt: int, started: float
+    ) -> float | None:
+        """Пауза перед следующей попыткой или None, если ее не будет"""
+        if isinstance(error, tuple(exceptions)) or attempt + 1 == retries:
+            return None
+        seconds = _backoff_delay(attempt, backoff, max_delay)
+        if deadline is not None and (
+            time.monotonic() + seconds >= started + deadline
+        ):
+            return None
+        return seconds
+
     def decorator(func) -> Any:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrappers(*args, **kwargs) -> Any:
+                started = time.monotonic()
+                attempt = 0
+                while True:
+                    timeout = (
+                        None
+                        if deadline is None
+                        else started + deadline - time.monotonic()
+                    )
+                    try:
+                        result = await asyncio.wait_for(
+                            func(*args, **kwargs), timeout
+                        )
+                    except Exception as error:  # pylint: disable=broad-except
+                        _log_error(func, args, kwargs, attempt, error)
+                        seconds = next_delay(error, attempt, started)
+                        if seconds is None:
+                            raise error
+                        if seconds:
+                            await asyncio.sleep(seconds)
+                        attempt += 1
+                    else:
+                        _log_result(func, args, kwargs, attempt, result)
+                        return result
+
+            return async_wrappers
+
         @wraps(func)
-        def wrappers(*args, **kwargs) -> Any:  # pylint: disable = R1710
-            info_function = (
-                f'run "{func.__name__}" with ',
-                f"positional {args=}, " if args else "",
-                f"keyword {kwargs=}, " if kwargs else "",
-            )
-            for attempt in range(retries):
+        def wrappers(*args, **kwargs) -> Any:
+            started = time.monotonic()
+            attempt = 0
+            while True:
                 try:
                     result = func(*args, **kwargs)
-                    print(*info_function,
-                          f"attempt = {attempt + 1}, {result=}",
-                          sep="")
-                    return result
                 except Exception as error:  # pylint: disable=broad-except
-                    print(
-                        *info_function,
-                        f"attempt = {attempt + 1}, "
-                        f"exception = {error.__class__.__name__}, "
-                        f"info_exception = {error}",
-                        sep="",
-                    )
-                    if (
-                        isinstance(error, tuple(exceptions))
-                        or attempt + 1 == retries
-                    ):
+                    _log_error(func, args, kwargs, attempt, error)
+                    seconds = next_delay(error, attempt, started)
+                    if seconds is None:
                         raise error
+                    if seconds:
+                        time.sleep(seconds)
+                    attempt += 1
+                else:
+                    _log_result(func, args, kwargs, attempt, result)
+                    return result
 
         return wrappers
 
@@ -1,9 +1,13 @@
-# pylint: disable=R0801
+# pylint: disable=R0801,R0904
+import os
+import tempfile
 import unittest
-from unittest.mock import Mock
+from io import StringIO
+from unittest.mock import Mock, call, patch
 
 import json
-from .json_processor import process_json
+from . import json_processor
+from .json_processor import process_json, process_json_stream
 
 
 class TestProcessJson(unittest.TestCase):
@@ -296,3 +300,461 @@ class TestProcessJson(unittest.TestCase):
         mock_callback.assert_any_call("key1", "word2")
         mock_callback.assert_any_call("key2", "word2")
         self.assertEqual(mock_callback.call_count, 3)
+
+    def test_many_tokens(self):
+        """Проверка большого списка токенов и ключей"""
+        mock_callback = Mock()
+        tokens = [f"Token{number}" for number in range(5000)]
+        required_keys = [f"key{number}" for number in range(5000)]
+        json_str = json.dumps(
+            {"key1": "token1 TOKEN4999 token5000", "other": "token2"}
+        )
+
+        process_json(json_str, required_keys, tokens, callback=mock_callback)
+
+        self.assertEqual(
+            mock_callback.call_args_list,
+            [call("key1", "Token1"), call("key1", "Token4999")],
+        )
+
+    def test_batch_callback(self):
+        """batch_callback получает все совпадения документа одним списком"""
+        json_str = '{"key1": "Word1 word2", "key2": "word2 WORD1", "k": "a"}'
+        for required_keys, tokens in (
+            (None, None),
+            (["key1", "key2"], ["word1", "WORD2"]),
+            (["key2"], None),
+        ):
+            mock_callback = Mock()
+            process_json(json_str, required_keys, tokens, mock_callback)
+
+            batch_callback = Mock()
+            process_json(
+                json_str, required_keys, tokens, batch_callback=batch_callback
+            )
+
+            batch_callback.assert_called_once_with(
+                [tuple(args) for args, _ in mock_callback.call_args_list]
+            )
+
+        batch_callback = Mock()
+        process_json(json_str, tokens=["word3"], batch_callback=batch_callback)
+        process_json("{}", batch_callback=batch_callback)
+        batch_callback.assert_not_called()
+
+    def test_invalid_batch_callback(self):
+        """Невалидный batch_callback или оба обработчика"""
+        json_str = '{"key": "value"}'
+        for invalid_value in self.invalid_values:
+            with self.assertRaises(TypeError):
+                process_json(json_str, batch_callback=invalid_value)
+
+        with self.assertRaises(ValueError):
+            process_json(json_str, callback=Mock(), batch_callback=Mock())
+
+    def test_workers_same_as_sequential(self):
+        """Параллельная обработка вызывает обработчики в порядке ключей"""
+        data = {
+            f"key{number}": f"Word{number % 7} word{number % 3} other"
+            for number in range(200)
+        }
+        json_str = json.dumps(data)
+        cases = [
+            (None, None),
+            ([f"key{number}" for number in range(0, 200, 3)], None),
+            (None, ["word1", "WORD2", "word5"]),
+        ]
+        for required_keys, tokens in cases:
+            expected = Mock()
+            process_json(json_str, required_keys, tokens, expected)
+
+            for workers in (1, 3):
+                mock_callback = Mock()
+                process_json(
+                    json_str,
+                    required_keys,
+                    tokens,
+                    mock_callback,
+                    workers=workers,
+                )
+                self.assertEqual(
+                    mock_callback.call_args_list, expected.call_args_list
+                )
+
+                batch_callback = Mock()
+                process_json(
+                    json_str,
+                    required_keys,
+                    tokens,
+                    batch_callback=batch_callback,
+                    workers=workers,
+                )
+                batch_callback.assert_called_once_with(
+                    [tuple(args) for args, _ in expected.call_args_list]
+                )
+
+        mock_callback = Mock()
+        process_json("{}", callback=mock_callback, workers=2)
+        mock_callback.assert_not_called()
+
+    def test_nested_selectors(self):
+        """Пути в required_keys выбирают строки вложенных объектов"""
+        json_str = json.dumps(
+            {
+                "title": "Word1 word2",
+                "user": {"name": "word1", "age": 30},
+                "items": [{"text": "WORD2 word3"}, {"text": "word1"}],
+                "skip": {"text": "word1"},
+            }
+        )
+        mock_callback = Mock()
+        process_json(
+            json_str,
+            ["title", "$.user", "$.items[*].text"],
+            ["word1", "word2"],
+            mock_callback,
+        )
+        self.assertEqual(
+            mock_callback.call_args_list,
+            [
+                call("title", "word1"),
+                call("title", "word2"),
+                call("user.name", "word1"),
+                call("items[0].text", "word2"),
+                call("items[1].text", "word1"),
+            ],
+        )
+
+        mock_callback = Mock()
+        process_json(
+            '{"*": "star", "other": "nope", "a": "x"}',
+            ["*", "$.a"],
+            callback=mock_callback,
+        )
+        self.assertEqual(
+            mock_callback.call_args_list, [call("*", "star"), call("a", "x")]
+        )
+
+        for workers in (None, 2):
+            batch_callback = Mock()
+            process_json(
+                json_str,
+                ["$.items[1]", "$.*.name"],
+                batch_callback=batch_callback,
+                workers=workers,
+            )
+            batch_callback.assert_called_once_with(
+                [("user.name", "word1"), ("items[1].text", "word1")]
+            )
+
+        with self.assertRaisesRegex(ValueError, "Некорректный путь"):
+            process_json(json_str, ["$.items[-1]"], callback=mock_callback)
+
+    def test_invalid_workers(self):
+        """Невалидное количество процессов"""
+        json_str = '{"key": "value"}'
+        for invalid_value in (1.5, "2", True):
+            with self.assertRaises(TypeError):
+                process_json(json_str, callback=Mock(), workers=invalid_value)
+        for invalid_value in (0, -1):
+            with self.assertRaises(ValueError):
+                process_json(json_str, callback=Mock(), workers=invalid_value)
+
+    def test_tokens_unicode_and_whitespace(self):
+        """Регистр не-ASCII символов и разные пробельные символы"""
+        mock_callback = Mock()
+        json_str = json.dumps(
+            {
+                "key1": "ПРИВЕТ\tмир\nStraße İstanbul\xa0ΟΔΟΣ",
+                "key2": "привет",
+            }
+        )
+        tokens = ["привет", "МИР", "straße", "İstanbul", "οδος", "ΟΔΟΣ"]
+
+        process_json(json_str, tokens=tokens, callback=mock_callback)
+
+        self.assertEqual(
+            mock_callback.call_args_list,
+            [
+                call("key1", "привет"),
+                call("key1", "МИР"),
+                call("key1", "straße"),
+                call("key1", "İstanbul"),
+                call("key1", "οδος"),
+                call("key2", "привет"),
+            ],
+        )
+
+    def test_parser_callable_with_fallback(self):
+        """Пользовательский парсер и возврат к json.loads при отказе"""
+        json_str = '{"key1": "Word1 word2", "key2": "word2 word3"}'
+        expected = Mock()
+        process_json(json_str, tokens=["word2"], callback=expected)
+
+        fast_parser = Mock(side_effect=json.loads)
+        for parser in (
+            fast_parser,
+            Mock(side_effect=ValueError("unsupported")),
+            Mock(return_value=["not", "a", "dict"]),
+        ):
+            mock_callback = Mock()
+            process_json(
+                json_str, tokens=["word2"], callback=mock_callback,
+                parser=parser,
+            )
+            parser.assert_called_once_with(json_str)
+            self.assertEqual(
+                mock_callback.call_args_list, expected.call_args_list
+            )
+
+        with self.assertRaises(json.JSONDecodeError):
+            process_json(
+                '{"key": "value",}',
+                parser=Mock(side_effect=ValueError("unsupported")),
+            )
+
+    @unittest.skipIf(
+        json_processor.custom_json is None, "custom_json не установлен"
+    )
+    def test_parser_custom_json(self):
+        """custom_json дает тот же результат, что и json"""
+        documents = [
+            '{"key1": "Word1 word2", "key2": "word2 word3"}',
+            '{"key1": "word1 word1st", "number": 10}',
+            '{"key1": "escaped\\nword1 \\u0441\\u043b\\u043e\\u0432\\u043e"}',
+            '{"key1": "word1", "nested": {"key2": "word2"}}',
+            '{"key1": "слово word1", "flag": true}',
+        ]
+        for json_str in documents:
+            expected = Mock()
+            process_json(json_str, ["key1"], callback=expected)
+
+            mock_callback = Mock()
+            process_json(
+                json_str, ["key1"], callback=mock_callback,
+                parser="custom_json",
+            )
+            self.assertEqual(
+                mock_callback.call_args_list, expected.call_args_list
+            )
+
+    @unittest.skipIf(
+        json_processor.custom_json is None, "custom_json не установлен"
+    )
+    def test_parser_custom_json_invalid(self):
+        """Некорректный JSON, который пропускает custom_json, отклоняется"""
+        documents = [
+            '{"a": "x y"} {"b": "z"}',
+            '{"a": "x" "b": "y"}',
+            '{"a": "x",}',
+            '{"a": 1.5.5}',
+        ]
+        for json_str in documents:
+            with self.assertRaises(json.JSONDecodeError):
+                process_json(json_str, parser="custom_json")
+
+    @unittest.skipIf(
+        json_processor.custom_json is None, "custom_json не установлен"
+    )
+    def test_parser_custom_json_results(self):
+        """Значения, которые custom_json не поддерживает, берутся из json"""
+        documents = [
+            '{"key1": "word1", "number": 12345678901234567890}',
+            '{"key1": "word1", "number": 1.5}',
+            '{"key1": "word1\\tword2"}',
+            '{"key1": "word1"}',
+            '{ "key1" : "word1" ,\n"number": -10 }',
+        ]
+        for json_str in documents:
+            mock_callback = Mock()
+            process_json(
+                json_str, ["$"], callback=mock_callback,
+                parser="custom_json",
+            )
+            expected = Mock()
+            process_json(json_str, ["$"], callback=expected)
+            self.assertEqual(
+                mock_callback.call_args_list, expected.call_args_list
+            )
+
+    def test_invalid_parser(self):
+        """Неизвестный парсер или отсутствующее расширение"""
+        with self.assertRaises(ValueError):
+            process_json('{"key": "value"}', parser="ujson")
+        with self.assertRaises(ValueError):
+            process_json_stream([], parser="ujson")
+        for invalid_value in (123, None):
+            with self.assertRaises(TypeError):
+                process_json('{"key": "value"}', parser=invalid_value)
+            with self.assertRaises(TypeError):
+                process_json_stream([], parser=invalid_value)
+
+        with patch.object(json_processor, "custom_json", None):
+            with self.assertRaises(ImportError):
+                process_json('{"key": "value"}', parser="custom_json")
+
+
+class TestProcessJsonStream(unittest.TestCase):
+
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.records = [
+            '{"key1": "Word1 word2", "key2": "word2 word3"}',
+            '{"key1": "word3", "key3": "WORD1"}',
+            "",
+            '{"key2": "word1 word1"}',
+        ]
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    def _expected_calls(self, *args) -> list:
+        mock_callback = Mock()
+        for record in self.records:
+            if record:
+                process_json(record, *args, callback=mock_callback)
+        return mock_callback.call_args_list
+
+    def test_same_as_process_json(self):
+        """Каждая строка обрабатывается так же, как в process_json"""
+        cases = [
+            (None, None),
+            (["key1", "key2"], None),
+            (None, ["WORD1", "word3"]),
+            (["key2"], ["word1", "word2"]),
+        ]
+        for required_keys, tokens in cases:
+            expected_calls = self._expected_calls(required_keys, tokens)
+
+            mock_callback = Mock()
+            records = process_json_stream(
+                iter(self.records), required_keys, tokens, mock_callback
+            )
+            self.assertEqual(records, 3)
+            self.assertEqual(mock_callback.call_args_list, expected_calls)
+
+    def test_file_sources(self):
+        """Источник - имя файла, открытый файл или строки байт"""
+        data = "\n".join(self.records) + "\n"
+        expected_calls = [
+            call("key1", "word1"),
+            call("key3", "word1"),
+            call("key2", "word1"),
+            call("key2", "word1"),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "records.jsonl")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(data)
+
+            for source in (
+                path,
+                StringIO(data),
+                [line.encode("utf-8") for line in self.records],
+            ):
+                mock_callback = Mock()
+                process_json_stream(
+                    source, tokens=["word1"], callback=mock_callback
+                )
+                self.assertEqual(
+                    mock_callback.call_args_list, expected_calls
+                )
+
+    def test_callback_is_none(self):
+        """Без callback записи только разбираются"""
+        self.assertEqual(process_json_stream(self.records), 3)
+
+    def test_parser(self):
+        """Парсер вызывается для каждой записи"""
+        parser = Mock(side_effect=json.loads)
+        self.assertEqual(process_json_stream(self.records, parser=parser), 3)
+        self.assertEqual(parser.call_count, 3)
+
+        with self.assertRaisesRegex(json.JSONDecodeError, "Строка 1"):
+            process_json_stream(
+                ['{"key": "value",}'],
+                parser=Mock(side_effect=ValueError("unsupported")),
+            )
+
+    @unittest.skipIf(
+        json_processor.custom_json is None, "custom_json не установлен"
+    )
+    def test_parser_custom_json(self):
+        """Строки файла с переводом строки разбираются custom_json"""
+        data = "\n".join(self.records) + "\n"
+        expected_calls = self._expected_calls(None, ["word1"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "records.jsonl")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(data)
+
+            mock_callback = Mock()
+            with patch.object(
+                json_processor.json, "loads", wraps=json.loads
+            ) as mock_loads:
+                records = process_json_stream(
+                    path, tokens=["word1"], callback=mock_callback,
+                    parser="custom_json",
+                )
+            mock_loads.assert_not_called()
+        self.assertEqual(records, 3)
+        self.assertEqual(mock_callback.call_args_list, expected_calls)
+
+    def test_batch_callback(self):
+        """batch_callback вызывается один раз на запись с совпадениями"""
+        batch_callback = Mock()
+        process_json_stream(
+            self.records, tokens=["word3"], batch_callback=batch_callback
+        )
+        self.assertEqual(
+            batch_callback.call_args_list,
+            [call([("key2", "word3")]), call([("key1", "word3")])],
+        )
+
+    def test_nested_selectors(self):
+        """Пути компилируются один раз и применяются к каждой записи"""
+        records = [
+            '{"user": {"name": "Word1"}, "key1": "word1"}',
+            '{"user": [{"name": "word1"}]}',
+            '{"user": {"name": "word2 word1"}}',
+        ]
+        mock_callback = Mock()
+        with patch.object(
+            json_processor, "is_selector", wraps=json_processor.is_selector
+        ) as is_selector:
+            process_json_stream(
+                records, ["$.user.name"], ["word1"], mock_callback
+            )
+        is_selector.assert_called_once_with("$.user.name")
+        self.assertEqual(
+            mock_callback.call_args_list,
+            [call("user.name", "word1"), call("user.name", "word1")],
+        )
+
+    def test_invalid_records(self):
+        """Ошибка разбора указывает номер строки"""
+        with self.assertRaisesRegex(json.JSONDecodeError, "Строка 2"):
+            process_json_stream(['{"key": "value"}', '{"key": "value",}'])
+
+        with self.assertRaisesRegex(TypeError, "Строка 1"):
+            process_json_stream(['["value"]'])
+
+    def test_invalid_args_checked_before_reading(self):
+        """Аргументы проверяются до чтения источника"""
+        source = Mock()
+        source.__iter__ = Mock()
+        for kwargs in (
+            {"required_keys": "key"},
+            {"tokens": [1]},
+            {"callback": 123},
+        ):
+            with self.assertRaises(TypeError):
+                process_json_stream(source, **kwargs)
+        source.__iter__.assert_not_called()
+
+        for invalid_value in (123, None, b"{}"):
+            with self.assertRaises(TypeError):
+                process_json_stream(invalid_value)
@@ -0,0 +1,116 @@
+import unittest
+
+from .key_selector import KeySelector, is_selector
+
+
+class _Untouchable(dict):
+    """Словарь, обход которого считается ошибкой"""
+
+    def items(self):
+        raise AssertionError("Поддерево не должно обходиться")
+
+
+class TestKeySelector(unittest.TestCase):
+
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+        self.data = {
+            "title": "Hello world",
+            "user": {"name": "Ann Lee", "age": 30, "tags": ["a b", "c"]},
+            "messages": [
+                {"text": "first one", "id": 1},
+                {"text": "second", "meta": {"text": "nested"}},
+                "plain",
+            ],
+            "empty": None,
+        }
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    def test_is_selector(self):
+        """Путь начинается с "$", остальное - ключ верхнего уровня"""
+        self.assertTrue(is_selector("$.key"))
+        self.assertTrue(is_selector("$"))
+        self.assertFalse(is_selector("key.name"))
+
+    def test_paths(self):
+        """Выбор по ключам, индексам и шаблонам в порядке документа"""
+        cases = [
+            (["$.user.name"], [("user.name", "Ann Lee")]),
+            (["title"], [("title", "Hello world")]),
+            (
+                ["$.messages[*].text"],
+                [("messages[0].text", "first one"),
+                 ("messages[1].text", "second")],
+            ),
+            (["$.messages[2]"], [("messages[2]", "plain")]),
+            (["$.messages[5].text"], []),
+            (
+                ["$.*.tags[1]", "$.messages[0].text"],
+                [("user.tags[1]", "c"), ("messages[0].text", "first one")],
+            ),
+            (
+                ["$.user"],
+                [("user.name", "Ann Lee"), ("user.tags[0]", "a b"),
+                 ("user.tags[1]", "c")],
+            ),
+            (["$.user.age", "$.empty", "$.title.text"], []),
+            (["$.missing", "$.title[0]"], []),
+        ]
+        for selectors, expected in cases:
+            self.assertEqual(
+                list(KeySelector(selectors).select(self.data)), expected
+            )
+
+    def test_whole_document(self):
+        """Путь "$" выбирает все строки документа"""
+        self.assertEqual(
+            [path for path, _ in KeySelector(["$"]).select(self.data)],
+            [
+                "title", "user.name", "user.tags[0]", "user.tags[1]",
+                "messages[0].text", "messages[1].text",
+                "messages[1].meta.text", "messages[2]",
+            ],
+        )
+
+    def test_overlapping_paths_once(self):
+        """Строка, выбранная несколькими путями, возвращается один раз"""
+        selector = KeySelector(
+            ["$.messages[*].text", "$.messages[1]", "$.*[1].text"]
+        )
+        self.assertEqual(
+            list(selector.select(self.data)),
+            [
+                ("messages[0].text", "first one"),
+                ("messages[1].text", "second"),
+                ("messages[1].meta.text", "nested"),
+            ],
+        )
+
+    def test_untargeted_subtrees_skipped(self):
+        """Невыбранные поддеревья не обходятся"""
+        data = {
+            "skip": _Untouchable(text="no"),
+            "items": [_Untouchable(text="no"), {"text": "yes"}],
+        }
+        selector = KeySelector(["$.items[1].text"])
+        self.assertEqual(
+            list(selector.select(data)), [("items[1].text", "yes")]
+        )
+
+    def test_plain_key_is_literal(self):
+        """Ключ верхнего уровня без "$" не является шаблоном"""
+        data = {"*": "star", "other": "nope", "a": "x", "[0]": "index"}
+        self.assertEqual(
+            list(KeySelector(["*", "$.a", "[0]"]).select(data)),
+            [("*", "star"), ("a", "x"), ("[0]", "index")],
+        )
+
+    def test_invalid_paths(self):
+        """Некорректный путь вызывает ValueError"""
+        for selector in ("$.", "$key", "$.a..b", "$.a[", "$.a[-1]",
+                         "$.a[x]", "$[*"):
+            with self.assertRaisesRegex(ValueError, "Некорректный путь"):
+                KeySelector([selector])
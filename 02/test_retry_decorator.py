@@ -1,7 +1,10 @@
 # pylint: disable=R0801
+import asyncio
+import time
 import unittest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, call, patch
 
+from . import retry_decorator
 from .retry_decorator import retry_deco
 
 
@@ -166,3 +169,157 @@ class TestRetryDecorator(unittest.TestCase):
             retry_deco(retries=-5)(mock_func)
 
         mock_func.assert_not_called()
+
+    def test_backoff_with_jitter(self):
+        """Тест экспоненциальной паузы с разбросом и ограничением max_delay"""
+        mock_func = Mock(side_effect=ValueError("Always failing"))
+        mock_func.__name__ = "mock_func"
+
+        decorated_func = retry_deco(retries=5, backoff=0.1, max_delay=0.3)(
+            mock_func
+        )
+        with patch.object(
+            retry_decorator.random, "uniform", side_effect=lambda a, b: b
+        ) as uniform, patch.object(retry_decorator.time, "sleep") as sleep:
+            with self.assertRaises(ValueError):
+                decorated_func()
+
+        self.assertEqual(mock_func.call_count, 5)
+        self.assertEqual(
+            uniform.call_args_list,
+            [call(0, 0.1), call(0, 0.2), call(0, 0.3), call(0, 0.3)],
+        )
+        self.assertEqual(
+            sleep.call_args_list,
+            [call(0.1), call(0.2), call(0.3), call(0.3)],
+        )
+
+    def test_backoff_many_attempts(self):
+        """Тест на паузу после очень большого номера попытки"""
+        mock_func = Mock(side_effect=ValueError("Always failing"))
+        mock_func.__name__ = "mock_func"
+
+        decorated_func = retry_deco(1100, backoff=1e-300, max_delay=1e-9)(
+            mock_func
+        )
+        with patch.object(retry_decorator.time, "sleep") as sleep:
+            with self.assertRaises(ValueError):
+                decorated_func()
+        self.assertEqual(mock_func.call_count, 1100)
+        self.assertLessEqual(
+            max(args[0] for args, _ in sleep.call_args_list), 1e-9
+        )
+
+    def test_deadline(self):
+        """Тест на прекращение попыток, если пауза выходит за deadline"""
+        mock_func = Mock(side_effect=[ValueError("First failure"), 7])
+        mock_func.__name__ = "mock_func"
+
+        decorated_func = retry_deco(retries=3, backoff=1, deadline=0.5)(
+            mock_func
+        )
+        with patch.object(
+            retry_decorator.random, "uniform", return_value=0.6
+        ), patch.object(retry_decorator.time, "sleep") as sleep:
+            with self.assertRaises(ValueError):
+                decorated_func()
+
+        mock_func.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_invalid_backoff_args(self):
+        """Тест на неправильные backoff, max_delay и deadline"""
+        for name in ("backoff", "max_delay", "deadline"):
+            for invalid_value in ("1", True, [1]):
+                with self.assertRaises(TypeError):
+                    retry_deco(**{name: invalid_value})
+            with self.assertRaises(ValueError):
+                retry_deco(**{name: -1})
+        for name in ("max_delay", "deadline"):
+            with self.assertRaises(ValueError):
+                retry_deco(**{name: 0})
+        retry_deco(backoff=0, max_delay=None, deadline=None)
+
+
+class TestAsyncRetryDecorator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        print(f"\nStart test {self.id()}")
+
+    def tearDown(self) -> None:
+        print(f"End test {self.id()}")
+
+    async def test_retry_coroutine(self):
+        """Тест повторов корутинной функции"""
+        mock_func = AsyncMock(side_effect=[ValueError("First failure"), 20])
+        mock_func.__name__ = "mock_func"
+
+        decorated_func = retry_deco(retries=3)(mock_func)
+        self.assertTrue(asyncio.iscoroutinefunction(decorated_func))
+        self.assertEqual(await decorated_func(1, key=2), 20)
+        self.assertEqual(mock_func.await_count, 2)
+        mock_func.assert_awaited_with(1, key=2)
+
+    async def test_specific_exceptions_not_retried(self):
+        """Тест на исключения из exceptions и превышение попыток"""
+        mock_func = AsyncMock(side_effect=KeyError("Expected failure"))
+        mock_func.__name__ = "mock_func"
+
+        with self.assertRaises(KeyError):
+            await retry_deco(retries=3, exceptions=[KeyError])(mock_func)()
+        self.assertEqual(mock_func.await_count, 1)
+
+        with self.assertRaises(KeyError):
+            await retry_deco(retries=3)(mock_func)()
+        self.assertEqual(mock_func.await_count, 4)
+
+    async def test_backoff_does_not_block_loop(self):
+        """Тест на паузы через asyncio.sleep без блокировки цикла событий"""
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        mock_func = AsyncMock(side_effect=[OSError("Failure"), "Success"])
+        mock_func.__name__ = "mock_func"
+        decorated_func = retry_deco(retries=2, backoff=0.05)(mock_func)
+
+        with patch.object(
+            retry_decorator.random, "uniform", side_effect=lambda a, b: b
+        ), patch.object(retry_decorator.time, "sleep") as sleep:
+            result, _ = await asyncio.gather(decorated_func(), ticker())
+
+        self.assertEqual(result, "Success")
+        self.assertEqual(ticks, [0, 1, 2])
+        sleep.assert_not_called()
+
+    async def test_deadline(self):
+        """Тест deadline для корутинной функции"""
+        mock_func = AsyncMock(side_effect=OSError("Always failing"))
+        mock_func.__name__ = "mock_func"
+
+        decorated_func = retry_deco(
+            retries=10, backoff=0.01, max_delay=0.02, deadline=0.05
+        )(mock_func)
+        with self.assertRaises(OSError):
+            await decorated_func()
+        self.assertLess(mock_func.await_count, 10)
+
+    async def test_deadline_cancels_hung_attempt(self):
+        """Тест отмены попытки, которая не укладывается в deadline"""
+        cancelled = []
+
+        async def hung():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        decorated_func = retry_deco(retries=3, deadline=0.05)(hung)
+        started = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            await asyncio.wait_for(decorated_func(), 1)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(cancelled, [True])
@@ -1,9 +1,63 @@
 #include <Python.h>
+#include <errno.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 
-// Function to parse a JSON string and return a Python dictionary (loads)
+// Skip JSON whitespace
+static const char* skip_whitespace(const char* ptr) {
+    while (*ptr == ' ' || *ptr == '\t' || *ptr == '\n' || *ptr == '\r') ptr++;
+    return ptr;
+}
+
+// Parse a string without escape sequences, ptr points to the opening quote
+static PyObject* parse_string(const char** ptr, const char* what) {
+    const char* start = ++*ptr;
+    while (**ptr != '\"') {
+        if (!**ptr) {
+            PyErr_Format(PyExc_TypeError, "Unterminated JSON %s", what);
+            return NULL;
+        }
+        if (**ptr == '\\' || (unsigned char)**ptr < 0x20) {
+            PyErr_Format(PyExc_TypeError, "Unsupported character in JSON %s", what);
+            return NULL;
+        }
+        (*ptr)++;
+    }
+    PyObject* result = PyUnicode_FromStringAndSize(start, *ptr - start);
+    (*ptr)++;  // Skip closing quote
+    return result;
+}
+
+// Parse an integer that fits into long, ptr points to its first character
+static PyObject* parse_number(const char** ptr) {
+    const char* start = *ptr;
+    if (**ptr == '-') (*ptr)++;
+    if (**ptr == '0') {
+        (*ptr)++;
+    } else if (**ptr >= '1' && **ptr <= '9') {
+        while (**ptr >= '0' && **ptr <= '9') (*ptr)++;
+    } else {
+        PyErr_Format(PyExc_TypeError, "Invalid JSON number");
+        return NULL;
+    }
+    if (**ptr == '.' || **ptr == 'e' || **ptr == 'E') {
+        PyErr_Format(PyExc_TypeError, "Only integer JSON numbers are supported");
+        return NULL;
+    }
+
+    errno = 0;
+    long num = strtol(start, NULL, 10);  // Support negative numbers
+    if (errno == ERANGE) {
+        PyErr_Format(PyExc_TypeError, "JSON number is out of range");
+        return NULL;
+    }
+    return PyLong_FromLong(num);
+}
+
+// Function to parse a JSON string and return a Python dictionary (loads).
+// Only flat objects with string and integer values are supported; any other
+// input, including invalid JSON, raises TypeError
 static PyObject* custom_json_loads(PyObject* self, PyObject* args) {
     const char* json_str;
     if (!PyArg_ParseTuple(args, "s", &json_str)) {
@@ -11,7 +65,7 @@ static PyObject* custom_json_loads(PyObject* self, PyObject* args) {
         return NULL;
     }
 
-    if (json_str[0] != '{' || json_str[strlen(json_str) - 1] != '}') {
+    if (json_str[0] != '{') {
         PyErr_Format(PyExc_TypeError, "Expected object or value");
         return NULL;
     }
@@ -22,74 +76,66 @@ static PyObject* custom_json_loads(PyObject* self, PyObject* args) {
         return NULL;
     }
 
-    const char* ptr = json_str + 1;  // Skip the opening brace
-    while (*ptr) {
-        while (*ptr == ' ' || *ptr == '\n' || *ptr == ',') ptr++;  // Skip spaces and commas
-        if (*ptr == '}') break;  // End of JSON object
-
+    PyObject* key = NULL;
+    PyObject* value = NULL;
+    const char* ptr = skip_whitespace(json_str + 1);  // Skip the opening brace
+    while (*ptr != '}') {
         // Parse key
         if (*ptr != '\"') {
-            Py_DECREF(dict);
             PyErr_Format(PyExc_TypeError, "Invalid JSON key");
-            return NULL;
-        }
-        const char* key_start = ++ptr;
-        while (*ptr && *ptr != '\"') ptr++;
-        if (!*ptr) {
-            Py_DECREF(dict);
-            PyErr_Format(PyExc_TypeError, "Unterminated JSON key");
-            return NULL;
+            goto error;
         }
-        PyObject* key = PyUnicode_FromStringAndSize(key_start, ptr - key_start);
-        ptr++;  // Skip closing quote
+        key = parse_string(&ptr, "key");
+        if (!key) goto error;
 
         // Skip colon
-        while (*ptr == ' ') ptr++;
+        ptr = skip_whitespace(ptr);
         if (*ptr != ':') {
-            Py_DECREF(dict);
-            Py_DECREF(key);
             PyErr_Format(PyExc_TypeError, "Expected ':' after key");
-            return NULL;
+            goto error;
         }
-        ptr++;
+        ptr = skip_whitespace(ptr + 1);
 
         // Parse value
-        while (*ptr == ' ') ptr++;
-        PyObject* value = NULL;
         if (*ptr == '\"') {
-            const char* value_start = ++ptr;
-            while (*ptr && *ptr != '\"') ptr++;
-            if (!*ptr) {
-                Py_DECREF(dict);
-                Py_DECREF(key);
-                PyErr_Format(PyExc_TypeError, "Unterminated JSON value");
-                return NULL;
-            }
-            value = PyUnicode_FromStringAndSize(value_start, ptr - value_start);
-            ptr++;  // Skip closing quote
+            value = parse_string(&ptr, "value");
         } else if (*ptr == '-' || (*ptr >= '0' && *ptr <= '9')) {
-            char* end_ptr;
-            long num = strtol(ptr, &end_ptr, 10);  // Support negative numbers
-            value = PyLong_FromLong(num);
-            ptr = end_ptr;
+            value = parse_number(&ptr);
         } else {
-            Py_DECREF(dict);
-            Py_DECREF(key);
             PyErr_Format(PyExc_TypeError, "Invalid JSON value");
-            return NULL;
+            goto error;
         }
-
-        if (PyDict_SetItem(dict, key, value) < 0) {
-            Py_DECREF(dict);
-            Py_DECREF(key);
-            Py_DECREF(value);
-            return NULL;
+        if (!value) goto error;
+
+        if (PyDict_SetItem(dict, key, value) < 0) goto error;
+        Py_CLEAR(key);
+        Py_CLEAR(value);
+
+        // Fields are separated by exactly one comma
+        ptr = skip_whitespace(ptr);
+        if (*ptr == ',') {
+            ptr = skip_whitespace(ptr + 1);
+            if (*ptr == '}') {
+                PyErr_Format(PyExc_TypeError, "Trailing comma in JSON object");
+                goto error;
+            }
+        } else if (*ptr != '}') {
+            PyErr_Format(PyExc_TypeError, "Expected ',' or '}' after value");
+            goto error;
         }
-        Py_DECREF(key);
-        Py_DECREF(value);
     }
 
+    if (*skip_whitespace(ptr + 1)) {
+        PyErr_Format(PyExc_TypeError, "Extra data after JSON object");
+        goto error;
+    }
     return dict;
+
+error:
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    Py_DECREF(dict);
+    return NULL;
 }
 
 static PyObject* custom_json_dumps(PyObject* self, PyObject* args) {
@@ -40,6 +40,31 @@ class TestCustomJson(unittest.TestCase):
         with self.assertRaises(TypeError):
             custom_json.loads("")  # Пустая строка
 
+    def test_loads_strict(self):
+        """Тест отклонения того, что json.loads разобрал бы иначе."""
+        for json_str in (
+            '{"a": "x y"} {"b": "z"}',  # Данные после объекта
+            '{"a": "x" "b": "y"}',  # Нет запятой между полями
+            '{"a": "x",}',  # Запятая перед "}"
+            '{"a": 1,, "b": 2}',  # Две запятые
+            '{"a": "x\\ny"}',  # Escape-последовательность
+            '{"a": "x\ty"}',  # Управляющий символ в строке
+            '{"a": 1.5}',  # Дробное число
+            '{"a": 01}',  # Ведущий ноль
+            '{"a": -}',  # Минус без цифр
+            '{"a": 99999999999999999999}',  # Не помещается в long
+            '{"a": "x"',  # Нет закрывающей скобки
+        ):
+            with self.assertRaises(TypeError):
+                custom_json.loads(json_str)
+
+    def test_loads_whitespace(self):
+        """Тест пробельных символов JSON между элементами."""
+        self.assertEqual(
+            custom_json.loads('{\t"a"\r\n: 1 ,\n"b":"x" } \n'),
+            {"a": 1, "b": "x"},
+        )
+
     def test_dumps_valid(self):
         """Тест корректной сериализации словарей."""
         self.assertEqual(